@@ -1,8 +1,9 @@
 from typing import Annotated
-from fastapi import Depends
 
-from src.core.database import SessionDep
-from src.apps.users.depends import UsersService
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.container import container, Scope
+from src.apps.users.depends import UsersServiceProtocol
 
 from .repositories.auth_tokens import (
     AuthTokensRepositoryProtocol,
@@ -23,93 +24,95 @@ from .use_cases.refresh import RefreshUseCaseProtocol, RefreshUseCaseImpl
 
 
 # === REPOSITORIES ===
-def get_jwt_repository(session: SessionDep) -> AuthTokensRepositoryProtocol:
-    return AuthTokensRepositoryImpl(session=session)
-
+container.register(
+    AuthTokensRepositoryProtocol,
+    lambda r: AuthTokensRepositoryImpl(session=r.get(AsyncSession)),
+    Scope.REQUEST,
+)
+container.register(
+    PermissionsRepositoryProtocol,
+    lambda r: PermissionsRepositoryImpl(session=r.get(AsyncSession)),
+    Scope.REQUEST,
+)
 
 JWTRepository = Annotated[
     AuthTokensRepositoryProtocol,
-    Depends(get_jwt_repository),
+    container.depends(AuthTokensRepositoryProtocol),
 ]
-
-
-def get_perms_repository(session: SessionDep) -> PermissionsRepositoryProtocol:
-    return PermissionsRepositoryImpl(session=session)
-
-
 PermissionsRepository = Annotated[
     PermissionsRepositoryProtocol,
-    Depends(get_perms_repository),
+    container.depends(PermissionsRepositoryProtocol),
 ]
 
 
 # === SERVICES ===
-def get_security_service() -> SecurityServiceProtocol:
-    return SecurityServiceImpl()
-
-
-def get_jwt_service(repository: JWTRepository) -> JWTServiceProtocol:
-    return JWTServiceImpl(repository=repository)
-
+container.register(
+    SecurityServiceProtocol,
+    lambda r: SecurityServiceImpl(),
+    Scope.APP,
+)
+container.register(
+    JWTServiceProtocol,
+    lambda r: JWTServiceImpl(repository=r.get(AuthTokensRepositoryProtocol)),
+    Scope.REQUEST,
+)
 
 SecurityService = Annotated[
     SecurityServiceProtocol,
-    Depends(get_security_service),
+    container.depends(SecurityServiceProtocol),
 ]
 JWTService = Annotated[
     JWTServiceProtocol,
-    Depends(get_jwt_service),
+    container.depends(JWTServiceProtocol),
 ]
 
 
 # === USE CASES ===
-def get_register_use_case(
-    users_service: UsersService,
-    security_service: SecurityService,
-) -> RegisterUseCaseProtocol:
-    return RegisterUseCaseImpl(
-        users_service=users_service,
-        security_service=security_service,
-    )
-
-def get_login_use_case(
-    users_service: UsersService,
-    security_service: SecurityService,
-    jwt_service: JWTService,
-) -> LoginUseCaseProtocol:
-    return LoginUseCaseImpl(
-        users_service=users_service,
-        security_service=security_service,
-        jwt_service=jwt_service,
-    )
-
-
-def get_logout_use_case(jwt_service: JWTService) -> LogoutUseCaseProtocol:
-    return LogoutUseCaseImpl(jwt_service=jwt_service)
-
-
-def get_refresh_use_case(
-    users_service: UsersService,
-    jwt_service: JWTService,
-) -> RefreshUseCaseProtocol:
-    return RefreshUseCaseImpl(
-        users_service=users_service,
-        jwt_service=jwt_service,
-    )
+container.register(
+    RegisterUseCaseProtocol,
+    lambda r: RegisterUseCaseImpl(
+        users_service=r.get(UsersServiceProtocol),
+        security_service=r.get(SecurityServiceProtocol),
+    ),
+    Scope.REQUEST,
+)
+container.register(
+    LoginUseCaseProtocol,
+    lambda r: LoginUseCaseImpl(
+        users_service=r.get(UsersServiceProtocol),
+        security_service=r.get(SecurityServiceProtocol),
+        jwt_service=r.get(JWTServiceProtocol),
+        session=r.get(AsyncSession),
+    ),
+    Scope.REQUEST,
+)
+container.register(
+    LogoutUseCaseProtocol,
+    lambda r: LogoutUseCaseImpl(jwt_service=r.get(JWTServiceProtocol)),
+    Scope.REQUEST,
+)
+container.register(
+    RefreshUseCaseProtocol,
+    lambda r: RefreshUseCaseImpl(
+        users_service=r.get(UsersServiceProtocol),
+        jwt_service=r.get(JWTServiceProtocol),
+    ),
+    Scope.REQUEST,
+)
 
 RegisterUseCase = Annotated[
     RegisterUseCaseProtocol,
-    Depends(get_register_use_case),
+    container.depends(RegisterUseCaseProtocol),
 ]
 LoginUseCase = Annotated[
     LoginUseCaseProtocol,
-    Depends(get_login_use_case),
+    container.depends(LoginUseCaseProtocol),
 ]
 LogoutUseCase = Annotated[
     LogoutUseCaseProtocol,
-    Depends(get_logout_use_case),
+    container.depends(LogoutUseCaseProtocol),
 ]
 RefreshUseCase = Annotated[
     RefreshUseCaseProtocol,
-    Depends(get_refresh_use_case),
+    container.depends(RefreshUseCaseProtocol),
 ]
@@ -11,6 +11,7 @@ class TokenPayloadFieldsEnum(StrEnum):
     ACCESS_TOKEN_TYPE = "access"
     REFRESH_TOKEN_TYPE = "refresh"
     ROLES_FIELD = "roles"
+    JTI_FIELD = "jti"
 
 
 class ActionsEnum(StrEnum):
@@ -18,6 +19,7 @@ class ActionsEnum(StrEnum):
     VIEW = auto()
     EDIT = auto()
     DELETE = auto()
+    EXPORT = auto()
 
 
 class ResourcesEnum(StrEnum):
@@ -25,3 +27,7 @@ class ResourcesEnum(StrEnum):
     USERS = auto()
     LAB = auto()
     REPORTS = auto()
+    ROLES = auto()
+    AUTH_TOKENS = auto()
+    REFERENCES = auto()
+    METRICS = auto()
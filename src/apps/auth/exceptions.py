@@ -74,3 +74,17 @@ class NotEnoughPermissions(HTTPException):
             detail="Not enough permissions.",
             headers=headers,
         )
+
+
+class RoutePermissionsError(Exception):
+    """
+    Error that occurs when route permissions are misconfigured.
+    """
+
+    def __init__(self, path: str, message: str, *args: object) -> None:
+        super().__init__(*args)
+        self.path = path
+        self.message = f"{path}: {message}"
+
+    def __str__(self) -> str:
+        return self.message
@@ -1,4 +1,6 @@
-from sqlalchemy import select, update
+from datetime import datetime
+
+from sqlalchemy import select, update, delete, or_
 
 from src.core.repositories.db_repository import (
     DBRepositoryProtocol,
@@ -12,6 +14,7 @@ from ..schemas.tokens import (
     TokenCreateSchema,
     TokenUpdateSchema,
 )
+from ..tools.jwts import token_digest
 
 
 class AuthTokensRepositoryProtocol(
@@ -26,6 +29,13 @@ class AuthTokensRepositoryProtocol(
 
     async def get_token(self, token: str) -> TokenReadSchema: ...
 
+    async def delete_stale_batch(
+        self,
+        now: datetime,
+        after_id: int,
+        batch_size: int,
+    ) -> list[int]: ...
+
 
 class AuthTokensRepositoryImpl(
     AuthTokensRepositoryProtocol,
@@ -36,23 +46,68 @@ class AuthTokensRepositoryImpl(
         TokenUpdateSchema,
     ],
 ):
+    """
+    Tokens are looked up by the unique SHA-256 digest of the raw JWT.
+    """
+
     model_type = AuthToken
     read_schema_type = TokenReadSchema
 
     async def set_token_used(self, token: str) -> bool:
-        async with self.session as s, s.begin():
-            statement = (
-                update(self.model_type)
-                .where(self.model_type.token == token)
-                .values(is_used=True)
+        """
+        Mark active token as used.
+        :returns: False if token is unknown or already used.
+        """
+        statement = (
+            update(self.model_type)
+            .where(
+                self.model_type.token_digest == token_digest(token),
+                self.model_type.is_used.is_(False),
             )
-            await s.execute(statement)
-            return True
+            .values(is_used=True)
+            .returning(self.model_type.id)
+        )
+        return (await self.session.execute(statement)).scalar_one_or_none() is not None
 
     async def get_token(self, token: str) -> TokenReadSchema:
-        async with self.session as s:
-            statement = select(self.model_type).where(self.model_type.token == token)
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
-                raise ModelNotFoundException(self.model_type)
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+        statement = select(
+            self.model_type.id,
+            self.model_type.jti,
+            self.model_type.user_id,
+            self.model_type.is_used,
+        ).where(self.model_type.token_digest == token_digest(token))
+        row = (await self.session.execute(statement)).one_or_none()
+        if row is None:
+            raise ModelNotFoundException(self.model_type)
+        return self.read_schema_type.model_validate(row, from_attributes=True)
+
+    async def delete_stale_batch(
+        self,
+        now: datetime,
+        after_id: int,
+        batch_size: int,
+    ) -> list[int]:
+        """
+        Delete next batch of expired or used tokens with id > after_id.
+        Rows locked by other transactions are skipped.
+        :returns: deleted ids in ascending order.
+        """
+        batch = (
+            select(self.model_type.id)
+            .where(
+                self.model_type.id > after_id,
+                or_(
+                    self.model_type.expires_at < now,
+                    self.model_type.is_used.is_(True),
+                ),
+            )
+            .order_by(self.model_type.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            delete(self.model_type)
+            .where(self.model_type.id.in_(batch.scalar_subquery()))
+            .returning(self.model_type.id)
+        )
+        return sorted((await self.session.execute(statement)).scalars().all())
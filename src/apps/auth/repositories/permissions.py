@@ -27,6 +27,13 @@ class PermissionsRepositoryProtocol(
 ):
     async def get_permissions_map(self) -> AccessControlMap: ...
 
+    async def grant(
+        self,
+        role: str,
+        resource: ResourcesEnum,
+        action: ActionsEnum,
+    ) -> bool: ...
+
 
 class PermissionsRepositoryImpl(
     PermissionsRepositoryProtocol,
@@ -41,22 +48,70 @@ class PermissionsRepositoryImpl(
     read_schema_type = PermissionReadSchema
 
     async def get_permissions_map(self) -> AccessControlMap:
-        async with self.session as s:
-            statement = (
-                select(
-                    PermissionRole.id,
-                    Role.name,
-                    Resource.name,
-                    Action.name,
-                )
-                .join(Role, PermissionRole.role_id == Role.id)
-                .join(Permission, PermissionRole.permission_id == Permission.id)
-                .join(Resource, Permission.resource_id == Resource.id)
-                .join(Action, Permission.action_id == Action.id)
+        statement = (
+            select(
+                PermissionRole.id,
+                Role.name,
+                Resource.name,
+                Action.name,
+            )
+            .join(Role, PermissionRole.role_id == Role.id)
+            .join(Permission, PermissionRole.permission_id == Permission.id)
+            .join(Resource, Permission.resource_id == Resource.id)
+            .join(Action, Permission.action_id == Action.id)
+        )
+        models = (await self.session.execute(statement)).all()
+        acl = parse_permissions(models)
+        return acl
+
+    async def grant(
+        self,
+        role: str,
+        resource: ResourcesEnum,
+        action: ActionsEnum,
+    ) -> bool:
+        """
+        Grant ``action`` on ``resource`` to an existing role by names,
+        missing resource/action/permission rows are created.
+        Returns False when the role does not exist or already has it.
+        """
+        role_id = await self._scalar(select(Role.id).where(Role.name == role))
+        if role_id is None:
+            return False
+        resource_id = await self._get_or_create(Resource, name=resource)
+        action_id = await self._get_or_create(Action, name=action)
+        permission_id = await self._get_or_create(
+            Permission,
+            resource_id=resource_id,
+            action_id=action_id,
+            defaults={"name": f"{resource}:{action}"},
+        )
+        granted = await self._scalar(
+            select(PermissionRole.id).where(
+                PermissionRole.role_id == role_id,
+                PermissionRole.permission_id == permission_id,
             )
-            models = (await s.execute(statement)).all()
-            acl = parse_permissions(models)
-            return acl
+        )
+        if granted is not None:
+            return False
+        self.session.add(PermissionRole(role_id=role_id, permission_id=permission_id))
+        await self.session.flush()
+        return True
+
+    async def _scalar(self, statement):
+        return (await self.session.execute(statement.limit(1))).scalar_one_or_none()
+
+    async def _get_or_create(
+        self, model, defaults: dict | None = None, **fields
+    ) -> int:
+        filters = [getattr(model, name) == value for name, value in fields.items()]
+        id_ = await self._scalar(select(model.id).where(*filters))
+        if id_ is None:
+            obj = model(**fields, **(defaults or {}))
+            self.session.add(obj)
+            await self.session.flush()
+            id_ = obj.id
+        return id_
 
 
 def parse_permissions(raw_data: list[tuple[int, str, str, str]]) -> AccessControlMap:
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Response
 
 from src.core.schemas import SuccessResponseSchema
+from src.core.responses import JSONRoute
 from .schemas.credentials import CredentialsSchema
 from .schemas.tokens import TokenInfo
 
@@ -10,8 +11,10 @@ from .depends import RegisterUseCase, LoginUseCase, LogoutUseCase, RefreshUseCas
 router = APIRouter(
     prefix="/auth",
     tags=["Auth"],
+    route_class=JSONRoute,
 )
 
+
 @router.post("/register")
 async def register(
     use_case: RegisterUseCase,
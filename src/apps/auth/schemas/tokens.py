@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from pydantic import BaseModel
 from src.core.schemas import CreateBaseModel, UpdateBaseModel, ResponseSchema
 
@@ -14,20 +15,27 @@ class TokenInfo(ResponseSchema):
     token_type: str = "Bearer"
 
 
+class RefreshTokenSchema(BaseModel):
+    token: str
+    jti: uuid.UUID
+    expires_at: datetime
+
+
 class TokenReadSchema(BaseModel):
     id: int
-    token: str
+    jti: uuid.UUID
     user_id: uuid.UUID
     is_used: bool
 
 
 class TokenCreateSchema(CreateBaseModel):
-    token: str
+    jti: uuid.UUID
+    token_digest: bytes
     user_id: uuid.UUID
+    expires_at: datetime
     is_used: bool = False
 
 
 class TokenUpdateSchema(UpdateBaseModel):
-    id: int | None = None
-    token: str
+    id: int
     is_used: bool = True
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Protocol
+
+from pydantic import BaseModel
+
+from src.settings import settings
+from src.core.cache import invalidation
+from src.core.database import db_provider
+from src.core.repositories.cache_repository import SingleFlight
+
+from ..repositories.permissions import PermissionsRepositoryImpl
+from ..tools.acl import CompiledACL
+
+logger = logging.getLogger(__name__)
+
+
+class ACLCacheStats(BaseModel):
+    version: int
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    failed_refreshes: int
+
+
+@dataclass(frozen=True, slots=True)
+class _ACLEntry:
+    value: CompiledACL
+    version: int
+    loaded_at: float
+
+
+class ACLCacheProtocol(Protocol):
+    async def get(self) -> CompiledACL: ...
+
+    def invalidate(self) -> int: ...
+
+    def stats(self) -> ACLCacheStats: ...
+
+
+class ACLCacheImpl:
+    """
+    Process-wide cache of the compiled access control map.
+
+    - fresh entry (younger than ``ttl``) is returned as is;
+    - stale entry (younger than ``ttl + stale_ttl``) is returned immediately
+      and refreshed in background;
+    - missing, expired or invalidated entry is reloaded before returning.
+    Concurrent reloads are collapsed into a single loader call.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[CompiledACL]],
+        ttl: float,
+        stale_ttl: float = 0,
+    ) -> None:
+        self.loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entry: _ACLEntry | None = None
+        self._version = 0
+        self._flight = SingleFlight()
+        # metrics
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._failed_refreshes = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    async def get(self) -> CompiledACL:
+        entry = self._entry
+        if entry is not None and entry.version == self._version:
+            age = monotonic() - entry.loaded_at
+            if age < self.ttl:
+                self._hits += 1
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self._stale_hits += 1
+                self._start_refresh()
+                return entry.value
+        self._misses += 1
+        return await asyncio.shield(self._start_refresh())
+
+    def invalidate(self) -> int:
+        """
+        Bump the ACL version, the next lookup reloads the map.
+        """
+        self._version += 1
+        logger.debug("ACL cache invalidated, version %s", self._version)
+        return self._version
+
+    def stats(self) -> ACLCacheStats:
+        return ACLCacheStats(
+            version=self._version,
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            failed_refreshes=self._failed_refreshes,
+        )
+
+    def _start_refresh(self) -> asyncio.Future[CompiledACL]:
+        return self._flight.start("acl", self._refresh)
+
+    async def _refresh(self) -> CompiledACL:
+        version = self._version
+        try:
+            value = await self.loader()
+        except Exception:
+            self._failed_refreshes += 1
+            logger.exception("ACL refresh failed")
+            raise
+        self._entry = _ACLEntry(value=value, version=version, loaded_at=monotonic())
+        self._refreshes += 1
+        return value
+
+
+async def load_compiled_acl() -> CompiledACL:
+    async with db_provider.transaction() as session:
+        repository = PermissionsRepositoryImpl(session=session)
+        return CompiledACL.compile(await repository.get_permissions_map())
+
+
+acl_cache = ACLCacheImpl(
+    loader=load_compiled_acl,
+    ttl=settings.rbac.acl_ttl_seconds,
+    stale_ttl=settings.rbac.acl_stale_ttl_seconds,
+)
+
+
+async def invalidate_acl_cache() -> None:
+    acl_cache.invalidate()
+
+
+invalidation.subscribe(invalidate_acl_cache)
@@ -1,11 +1,16 @@
-from datetime import timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Protocol
 
 from src.settings import settings
 from src.apps.users.schemas.users import UserReadSchema
 
 from ..repositories.auth_tokens import AuthTokensRepositoryProtocol
-from ..schemas.tokens import TokenCreateSchema, TokenReadSchema
+from ..schemas.tokens import (
+    RefreshTokenSchema,
+    TokenCreateSchema,
+    TokenReadSchema,
+)
 
 from ..enums import TokenPayloadFieldsEnum as tf
 from ..tools.jwts import encode_jwt
@@ -15,7 +20,9 @@ class JWTServiceProtocol(Protocol):
 
     def create_access_token(self, user_schema: UserReadSchema) -> str: ...
 
-    def create_refresh_token(self, user_schema: UserReadSchema) -> str: ...
+    def create_refresh_token(
+        self, user_schema: UserReadSchema
+    ) -> RefreshTokenSchema: ...
 
     async def get_refresh_token(self, token: str) -> TokenReadSchema: ...
 
@@ -29,6 +36,7 @@ class JWTServiceProtocol(Protocol):
         token_data: dict,
         expire_time_minutes: int,
         expire_timedelta: timedelta | None,
+        now: datetime | None,
     ) -> str: ...
 
 
@@ -52,16 +60,24 @@ class JWTServiceImpl:
             expire_time_minutes=settings.auth_jwt.access_token_expire_minutes,
         )
 
-    def create_refresh_token(self, user_schema: UserReadSchema) -> str:
+    def create_refresh_token(self, user_schema: UserReadSchema) -> RefreshTokenSchema:
+        jti = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        expire_timedelta = timedelta(days=settings.auth_jwt.refresh_token_expire_days)
         jwt_payload = {
             tf.SUB_FIELD: str(user_schema.id),
+            tf.JTI_FIELD: str(jti),
         }
-        return self._create_jwt(
+        token = self._create_jwt(
             token_type=tf.REFRESH_TOKEN_TYPE,
             token_data=jwt_payload,
-            expire_timedelta=timedelta(
-                days=settings.auth_jwt.refresh_token_expire_days
-            ),
+            expire_timedelta=expire_timedelta,
+            now=now,
+        )
+        return RefreshTokenSchema(
+            token=token,
+            jti=jti,
+            expires_at=now + expire_timedelta,
         )
 
     async def get_refresh_token(self, token: str) -> TokenReadSchema:
@@ -81,6 +97,7 @@ class JWTServiceImpl:
         token_data: dict,
         expire_time_minutes: int = settings.auth_jwt.access_token_expire_minutes,
         expire_timedelta: timedelta | None = None,
+        now: datetime | None = None,
     ) -> str:
         jwt_payload = {tf.TOKEN_TYPE_FIELD: token_type}
         jwt_payload.update(token_data)
@@ -88,4 +105,5 @@ class JWTServiceImpl:
             payload=jwt_payload,
             expire_minutes=expire_time_minutes,
             expire_timedelta=expire_timedelta,
+            now=now,
         )
@@ -1,36 +1,50 @@
 import bcrypt
 from typing import Protocol
 
+from src.core.executors import CPUExecutor, crypto_executor
+
+
+def hash_password(password: str) -> bytes:
+    """
+    Hash password from string.
+    """
+    salt = bcrypt.gensalt()
+    pwd_bytes: bytes = password.encode()
+    return bcrypt.hashpw(password=pwd_bytes, salt=salt)
+
+
+def check_password(password: str, hashed_password: bytes) -> bool:
+    """
+    Compare hashed_password with password from input.
+    """
+    return bcrypt.checkpw(
+        password=password.encode(),
+        hashed_password=hashed_password,
+    )
+
 
 class SecurityServiceProtocol(Protocol):
 
-    @staticmethod
-    def encode_password(password: str) -> bytes: ...
+    async def encode_password(self, password: str) -> bytes: ...
 
-    @staticmethod
-    def validate_password(
+    async def validate_password(
+        self,
         password: str,
         hashed_password: bytes,
     ) -> bool: ...
 
 
 class SecurityServiceImpl:
+    """
+    Password hashing service.
+    bcrypt calls are offloaded to the CPU executor to keep the event loop free.
+    """
+
+    def __init__(self, executor: CPUExecutor = crypto_executor) -> None:
+        self.executor = executor
+
+    async def encode_password(self, password: str) -> bytes:
+        return await self.executor.run(hash_password, password)
 
-    @staticmethod
-    def encode_password(password: str) -> bytes:
-        """
-        Hash password from string.
-        """
-        salt = bcrypt.gensalt()
-        pwd_bytes: bytes = password.encode()
-        return bcrypt.hashpw(password=pwd_bytes, salt=salt)
-
-    @staticmethod
-    def validate_password(password: str, hashed_password: bytes) -> bool:
-        """
-        Compare hashed_password with password from input.
-        """
-        return bcrypt.checkpw(
-            password=password.encode(),
-            hashed_password=hashed_password,
-        )
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        return await self.executor.run(check_password, password, hashed_password)
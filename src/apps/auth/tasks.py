@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.settings import settings
+from src.core.database import db_provider
+
+from .repositories.auth_tokens import AuthTokensRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_lock key, one purge at a time across workers and hosts
+PURGE_LOCK = 0x70757267
+
+
+async def purge_auth_tokens(
+    batch_size: int = settings.auth_jwt.purge_batch_size,
+    pause: float = settings.auth_jwt.purge_pause_seconds,
+) -> int:
+    """
+    Delete expired and used refresh tokens.
+    Every batch runs in its own short transaction, walking ids in order.
+    The connection holds a session advisory lock meanwhile: workers (and
+    hosts) running the task at the same time skip it instead of deleting
+    the same rows.
+    """
+    async with db_provider.engine.connect() as connection:
+        locked = await connection.scalar(
+            sa.select(sa.func.pg_try_advisory_lock(PURGE_LOCK))
+        )
+        await connection.commit()
+        if not locked:
+            logger.debug("Auth tokens purge running elsewhere, skipped")
+            return 0
+        try:
+            return await _purge_stale_tokens(connection, batch_size, pause)
+        finally:
+            await connection.execute(sa.select(sa.func.pg_advisory_unlock(PURGE_LOCK)))
+            await connection.commit()
+
+
+async def _purge_stale_tokens(
+    connection: AsyncConnection, batch_size: int, pause: float
+) -> int:
+    now = datetime.now(timezone.utc)
+    after_id, total = 0, 0
+    while True:
+        async with (
+            db_provider.session_factory(bind=connection) as session,
+            session.begin(),
+        ):
+            repository = AuthTokensRepositoryImpl(session=session)
+            deleted = await repository.delete_stale_batch(
+                now=now,
+                after_id=after_id,
+                batch_size=batch_size,
+            )
+        total += len(deleted)
+        if len(deleted) < batch_size:
+            break
+        after_id = deleted[-1]
+        await asyncio.sleep(pause)
+    logger.info("%s stale auth tokens purged", total)
+    return total
@@ -0,0 +1,65 @@
+from types import MappingProxyType
+from typing import Mapping
+
+from ..enums import ActionsEnum, ResourcesEnum
+from ..schemas.rbac import AccessControlMap
+
+_RESOURCES: tuple[ResourcesEnum, ...] = tuple(ResourcesEnum)
+_ACTIONS: tuple[ActionsEnum, ...] = tuple(ActionsEnum)
+
+PERMISSION_BITS: Mapping[tuple[ResourcesEnum, ActionsEnum], int] = MappingProxyType(
+    {
+        (resource, action): 1 << (r_idx * len(_ACTIONS) + a_idx)
+        for r_idx, resource in enumerate(_RESOURCES)
+        for a_idx, action in enumerate(_ACTIONS)
+    }
+)
+
+
+def permission_bit(resource: ResourcesEnum | str, action: ActionsEnum | str) -> int:
+    """
+    Bit of (resource, action) pair, 0 for unknown pairs.
+    """
+    return PERMISSION_BITS.get((resource, action), 0)
+
+
+class CompiledACL:
+    """
+    Access control map compiled into integer bitmasks.
+
+    Every (resource, action) pair owns one bit, each role is a mask of
+    granted bits. Masks of role sets are memoized, so a check is a dict
+    lookup and a bitwise AND.
+    """
+
+    __slots__ = ("role_masks", "_memo", "_memo_size")
+
+    def __init__(self, role_masks: dict[str, int], memo_size: int = 1024) -> None:
+        self.role_masks = role_masks
+        self._memo: dict[frozenset[str], int] = {}
+        self._memo_size = memo_size
+
+    @classmethod
+    def compile(cls, acl: AccessControlMap) -> "CompiledACL":
+        role_masks: dict[str, int] = {}
+        for role, resources in acl.roles.items():
+            mask = 0
+            for resource, actions in resources.items():
+                for action in actions:
+                    mask |= PERMISSION_BITS[(resource, action)]
+            role_masks[role] = mask
+        return cls(role_masks)
+
+    def mask_for(self, roles: frozenset[str]) -> int:
+        mask = self._memo.get(roles)
+        if mask is None:
+            mask = 0
+            for role in roles:  # unknown roles grant nothing
+                mask |= self.role_masks.get(role, 0)
+            if len(self._memo) >= self._memo_size:
+                self._memo.clear()
+            self._memo[roles] = mask
+        return mask
+
+    def allows(self, roles: frozenset[str], bit: int) -> bool:
+        return bit != 0 and self.mask_for(roles) & bit == bit
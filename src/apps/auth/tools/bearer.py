@@ -8,7 +8,7 @@ from fastapi.security import (
     HTTPAuthorizationCredentials,
 )
 
-from .jwts import decode_jwt
+from .claims import get_verified_claims
 from ..enums import TokenPayloadFieldsEnum as tf
 from ..schemas.tokens import TokenPayload
 from ..exceptions import InvalidToken, ExpiredToken, InvalidTokenType
@@ -29,7 +29,7 @@ def get_current_token(
     return token
 
 
-def get_current_token_payload(
+async def get_current_token_payload(
     token: Annotated[str, Depends(get_current_token)],
 ) -> TokenPayload:
     """
@@ -37,7 +37,7 @@ def get_current_token_payload(
     :returns: TokenPayload(token: str, payload: dict)
     """
     try:
-        payload = decode_jwt(token)
+        payload = await get_verified_claims(token)
         token_payload = TokenPayload(token=token, payload=payload)
     except ExpiredSignatureError:
         raise ExpiredToken
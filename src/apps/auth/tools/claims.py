@@ -0,0 +1,44 @@
+import copy
+from time import time
+
+import jwt
+
+from src.settings import settings
+from src.core.cache import cache_provider
+
+from .jwts import decode_jwt, token_digest
+from .keyring import jwt_keyring
+
+claims_cache = cache_provider.repository("jwt_claims", local=True)
+
+
+async def get_verified_claims(token: str) -> dict:
+    """
+    Decode and verify JWT, verified claims are cached by token digest
+    until the token expires (or for max TTL, whichever is sooner).
+    Callers get their own copy, the cached claims are never mutated.
+    Tokens without ``exp`` are rejected, they could not be evicted in time.
+    Entries are bound to the key set that verified them (``generation``),
+    a reload on an unknown ``kid`` invalidates them too.
+    """
+    key = f"{jwt_keyring.generation}:{token_digest(token).hex()}"
+    payload = await claims_cache.get(key)
+    if payload is not None and payload["exp"] > time():
+        return copy.deepcopy(payload)
+
+    payload = decode_jwt(token)
+    exp = payload.get("exp")
+    if exp is None:
+        raise jwt.MissingRequiredClaimError("exp")
+    ttl = min(exp - time(), settings.auth_jwt.claims_cache_max_ttl_seconds)
+    if ttl > 0:
+        await claims_cache.set(key, copy.deepcopy(payload), ttl=ttl)
+    return payload
+
+
+async def reload_keys() -> None:
+    """
+    Reload rotated JWT keys, drop claims verified with the previous key set.
+    """
+    if jwt_keyring.reload_if_changed():
+        await claims_cache.clear()
@@ -4,7 +4,7 @@ from fastapi import Depends, Request
 
 from jwt import InvalidTokenError, ExpiredSignatureError
 
-from .jwts import decode_jwt
+from .claims import get_verified_claims
 from ..schemas.tokens import TokenPayload
 from ..exceptions import UnauthorizedException, InvalidToken, ExpiredToken
 
@@ -16,14 +16,14 @@ def get_refresh_token_from_cookie(request: Request) -> Optional[str]:
     raise UnauthorizedException
 
 
-def get_refresh_token(
+async def get_refresh_token(
     token: Annotated[
         str,
         Depends(get_refresh_token_from_cookie),
     ],
 ) -> TokenPayload:
     try:
-        payload = decode_jwt(token)
+        payload = await get_verified_claims(token)
         token_payload = TokenPayload(token=token, payload=payload)
     except ExpiredSignatureError:
         raise ExpiredToken
@@ -1,6 +1,6 @@
 import uuid
 from typing import Annotated
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from .bearer import AccessToken
 from .rbac import RBAC
@@ -9,10 +9,11 @@ from ..exceptions import NotEnoughPermissions
 
 
 async def get_current_user(
+    request: Request,
     token: AccessToken,
     rbac: RBAC,
 ) -> uuid.UUID:
-    if not await rbac.check_permissions(token):
+    if not await rbac.check_permissions(token, request.scope["endpoint"]):
         raise NotEnoughPermissions
     user_id = token.payload.get(tf.SUB_FIELD)
     return user_id
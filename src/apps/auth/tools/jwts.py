@@ -1,18 +1,20 @@
+import hashlib
 import jwt
 from datetime import timedelta, datetime, timezone
 
 from src.settings import settings
+from .keyring import KeyRing, jwt_keyring
 
 
 def encode_jwt(
     payload: dict,
-    private_key: str = settings.auth_jwt.private_key_path.read_text(),
-    algorithm: str = settings.auth_jwt.algorithm,
     expire_minutes: int = settings.auth_jwt.access_token_expire_minutes,
     expire_timedelta: timedelta | None = None,
+    keyring: KeyRing = jwt_keyring,
+    now: datetime | None = None,
 ) -> str:
     to_encode = payload.copy()
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
 
     if expire_timedelta:
         expire = now + expire_timedelta
@@ -20,14 +22,49 @@ def encode_jwt(
         expire = now + timedelta(minutes=expire_minutes)
 
     to_encode.update(iat=now, exp=expire)
-    encoded = jwt.encode(to_encode, private_key, algorithm=algorithm)
+    key = keyring.signing_key
+    encoded = jwt.encode(
+        to_encode,
+        key.private_key,
+        algorithm=key.algorithm,
+        headers={"kid": key.kid},
+    )
     return encoded
 
 
+# Errors of a key that did not sign the token, the next candidate is tried.
+# Any other error (expired, malformed claims) means the signature matched.
+KEY_MISMATCH_ERRORS = (jwt.InvalidSignatureError, jwt.InvalidAlgorithmError)
+
+
 def decode_jwt(
     token: str | bytes,
-    public_key: str = settings.auth_jwt.public_key_path.read_text(),
-    algorithm: str = settings.auth_jwt.algorithm,
+    keyring: KeyRing = jwt_keyring,
 ) -> dict:
-    decoded = jwt.decode(token, public_key, algorithms=[algorithm])
-    return decoded
+    """
+    Verify token against the key with matching `kid` header.
+    Tokens without `kid` are checked against every active key
+    of the `alg` from the header.
+    """
+    header = jwt.get_unverified_header(token)
+    kid = header.get("kid")
+    algorithm = header.get("alg")
+    keys = [key for key in keyring.get(kid) if key.algorithm == algorithm]
+    if not keys:
+        raise jwt.InvalidSignatureError(f"Unknown signing key: {kid} ({algorithm})")
+    error: jwt.InvalidTokenError | None = None
+    for key in keys:
+        try:
+            return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+        except KEY_MISMATCH_ERRORS as e:  # InvalidKeyError is an InvalidAlgorithmError
+            error = e
+    raise error
+
+
+def token_digest(token: str | bytes) -> bytes:
+    """
+    Fixed-size SHA-256 digest of the raw token.
+    """
+    if isinstance(token, str):
+        token = token.encode()
+    return hashlib.sha256(token).digest()
@@ -0,0 +1,180 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PrivateKeyTypes,
+    PublicKeyTypes,
+)
+
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class JWTKey:
+    kid: str
+    algorithm: str
+    public_key: PublicKeyTypes
+    private_key: PrivateKeyTypes | None = None
+
+
+def key_id(public_key: PublicKeyTypes) -> str:
+    """
+    Key id is a thumbprint of the DER-encoded public key.
+    """
+    der = public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return hashlib.sha256(der).hexdigest()[:16]
+
+
+EC_CURVE_ALGORITHMS: dict[str, str] = {
+    "secp256r1": "ES256",
+    "secp384r1": "ES384",
+    "secp521r1": "ES512",
+}
+
+
+def key_algorithm(public_key: PublicKeyTypes, rsa_algorithm: str = "RS256") -> str:
+    """
+    JWT algorithm of the key, RSA keys use configured `rsa_algorithm`.
+    """
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        try:
+            return EC_CURVE_ALGORITHMS[public_key.curve.name]
+        except KeyError:
+            raise ValueError(f"Unsupported EC curve: {public_key.curve.name}")
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return rsa_algorithm
+    raise ValueError(f"Unsupported key type: {type(public_key).__name__}")
+
+
+class KeyRing:
+    """
+    Parsed JWT keys.
+
+    Every ``*.pem`` file of ``keys_dir`` is a verification key (public or
+    private), the private key at ``signing_key_path`` signs new tokens.
+    The algorithm follows the key type (RSA, EC P-256/384/521, Ed25519),
+    so keys of different algorithms can be verified side by side.
+    Keys are parsed once and reloaded only when the files change.
+
+    An unknown ``kid`` triggers a reload (at most once per
+    ``miss_reload_interval``): after a rotation, tokens signed by another
+    worker with the new key are accepted before the periodic reload.
+    ``generation`` changes on every load.
+    """
+
+    def __init__(
+        self,
+        keys_dir: Path,
+        signing_key_path: Path,
+        rsa_algorithm: str = "RS256",
+        miss_reload_interval: float = 1.0,
+    ) -> None:
+        self.keys_dir = keys_dir
+        self.signing_key_path = signing_key_path
+        self.rsa_algorithm = rsa_algorithm
+        self.miss_reload_interval = miss_reload_interval
+        self.generation = 0
+        self._signing_key: JWTKey | None = None
+        self._keys: dict[str, JWTKey] = {}
+        self._fingerprint: tuple = ()
+        self._miss_reload_at = float("-inf")
+
+    @property
+    def signing_key(self) -> JWTKey:
+        if self._signing_key is None:
+            self.load()
+        return self._signing_key
+
+    def get(self, kid: str | None) -> list[JWTKey]:
+        """
+        Verification candidates: the key with ``kid`` or all active keys.
+        """
+        if self._signing_key is None:
+            self.load()
+        if kid is not None:
+            key = self._keys.get(kid)
+            if key is None and self._reload_on_miss():
+                key = self._keys.get(kid)
+            return [key] if key is not None else []
+        return list(self._keys.values())
+
+    def _reload_on_miss(self) -> bool:
+        now = monotonic()
+        if now - self._miss_reload_at < self.miss_reload_interval:
+            return False
+        self._miss_reload_at = now
+        return self.reload_if_changed()
+
+    def load(self) -> None:
+        fingerprint = self._files_fingerprint()
+        keys: dict[str, JWTKey] = {}
+        signing_key: JWTKey | None = None
+        for path, *_ in fingerprint:
+            key = self._load_key(Path(path))
+            if key.kid not in keys or key.private_key is not None:
+                keys[key.kid] = key
+            if Path(path) == self.signing_key_path:
+                signing_key = key
+        if signing_key.private_key is None:
+            raise ValueError(f"{self.signing_key_path} is not a private key")
+
+        self._keys = keys
+        self._signing_key = signing_key
+        self._fingerprint = fingerprint
+        self.generation += 1
+        logger.info("JWT keys loaded: %s, signing: %s", list(keys), signing_key.kid)
+
+    def reload_if_changed(self) -> bool:
+        if self._files_fingerprint() == self._fingerprint:
+            return False
+        self.load()
+        return True
+
+    def _files_fingerprint(self) -> tuple:
+        """
+        Key files with mtime and size, the signing key also when stored
+        outside of ``keys_dir``.
+        """
+        paths = sorted(self.keys_dir.glob("*.pem"))
+        if self.signing_key_path not in paths:
+            paths.append(self.signing_key_path)
+        return tuple(
+            (str(path), stat.st_mtime_ns, stat.st_size)
+            for path in paths
+            if (stat := path.stat())
+        )
+
+    def _load_key(self, path: Path) -> JWTKey:
+        data = path.read_bytes()
+        if b"PRIVATE KEY" in data:
+            private_key = serialization.load_pem_private_key(data, password=None)
+            public_key = private_key.public_key()
+        else:
+            private_key = None
+            public_key = serialization.load_pem_public_key(data)
+        return JWTKey(
+            kid=key_id(public_key),
+            algorithm=key_algorithm(public_key, self.rsa_algorithm),
+            public_key=public_key,
+            private_key=private_key,
+        )
+
+
+jwt_keyring = KeyRing(
+    keys_dir=settings.auth_jwt.keys_dir,
+    signing_key_path=settings.auth_jwt.private_key_path,
+    rsa_algorithm=settings.auth_jwt.algorithm,
+    miss_reload_interval=settings.auth_jwt.key_miss_reload_interval_seconds,
+)
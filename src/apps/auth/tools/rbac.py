@@ -1,55 +1,78 @@
-from typing import Protocol, Annotated
-from fastapi import Depends, Request
+from typing import Protocol, Annotated, Callable, TypeVar
 
+from src.core.container import container, Scope
+
+from ..enums import TokenPayloadFieldsEnum as tf, ResourcesEnum, ActionsEnum
 from ..schemas.tokens import TokenPayload
-from ..repositories.permissions import PermissionsRepositoryProtocol
-from ..depends import PermissionsRepository
+from ..services.acl import ACLCacheProtocol, acl_cache
+
+EndpointType = TypeVar("EndpointType", bound=Callable)
+
+PERMISSION_ATTR = "__rbac_permission__"
+
+# Endpoint -> required permission bit, filled once by `resolve_route_permissions`
+route_permissions: dict[Callable, int] = {}
+
+
+def requires_permission(
+    resource: ResourcesEnum,
+    action: ActionsEnum,
+) -> Callable[[EndpointType], EndpointType]:
+    """
+    Declare (resource, action) permission required by the endpoint.
+    """
+
+    def decorator(endpoint: EndpointType) -> EndpointType:
+        setattr(endpoint, PERMISSION_ATTR, (resource, action))
+        return endpoint
 
-redis_roles = {}
+    return decorator
 
 
 class RBACProtocol(Protocol):
-    async def check_permissions(self, token: TokenPayload) -> bool: ...
+    async def check_permissions(
+        self, token: TokenPayload, endpoint: Callable
+    ) -> bool: ...
 
 
 class RBACImpl:
+    """
+    Role sets are memoized per roles claim, tokens of the same roles share
+    one frozenset (and its cached hash) instead of building it per request.
+    """
+
     def __init__(
-        self, repository: PermissionsRepositoryProtocol, request: Request
+        self,
+        acl: ACLCacheProtocol,
+        permissions: dict[Callable, int],
+        memo_size: int = 1024,
     ) -> None:
-        self.repository = repository
-        self.request = request
-
-    async def check_permissions(self, token: TokenPayload) -> bool:
-        roles = token.payload.get("roles")
-
-        scope = self.request.scope
-        route_name: str = scope["route"].name
-        resource, action = tuple(route_name.split("."))
-
-        if redis_roles:
-            print("GET FROM REDIS")
-            r = redis_roles
-        else:
-            print("GET FROM DB")
-            roles_permissions = await self.repository.get_permissions_map()
-            print(roles_permissions)
-            # print("SAVE IN REDIS")
-            # redis_roles.update(roles_permissions.roles)
-            # r = redis_roles
-            r = roles_permissions.roles
-            print(r)
-
-        for role in roles:
-            actions = r.get(role).get(resource)
-            if not actions:  # skip role that has no access to resource
-                continue
-            if action in actions:
-                return True
-        return False
-
-
-def get_rbac(repository: PermissionsRepository, request: Request) -> RBACProtocol:
-    return RBACImpl(repository=repository, request=request)
-
-
-RBAC = Annotated[RBACProtocol, Depends(get_rbac)]
+        self.acl = acl
+        self.permissions = permissions
+        self._role_sets: dict[tuple[str, ...], frozenset[str]] = {}
+        self._memo_size = memo_size
+
+    def role_set(self, token: TokenPayload) -> frozenset[str]:
+        key = tuple(token.payload.get(tf.ROLES_FIELD) or ())
+        roles = self._role_sets.get(key)
+        if roles is None:
+            if len(self._role_sets) >= self._memo_size:
+                self._role_sets.clear()
+            roles = self._role_sets[key] = frozenset(key)
+        return roles
+
+    async def check_permissions(self, token: TokenPayload, endpoint: Callable) -> bool:
+        roles = self.role_set(token)
+        bit = self.permissions.get(endpoint, 0)
+
+        compiled_acl = await self.acl.get()
+        return compiled_acl.allows(roles, bit)
+
+
+container.register(
+    RBACProtocol,
+    lambda r: RBACImpl(acl=acl_cache, permissions=route_permissions),
+    Scope.APP,
+)
+
+RBAC = Annotated[RBACProtocol, container.depends(RBACProtocol)]
@@ -0,0 +1,41 @@
+from typing import Callable, Iterable
+
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+from .acl import PERMISSION_BITS
+from .deps import get_current_user
+from .rbac import PERMISSION_ATTR, route_permissions
+from ..exceptions import RoutePermissionsError
+
+
+def _depends_on(dependant: Dependant, call: Callable) -> bool:
+    return any(
+        sub.call is call or _depends_on(sub, call) for sub in dependant.dependencies
+    )
+
+
+def resolve_route_permissions(routes: Iterable[BaseRoute]) -> dict[Callable, int]:
+    """
+    Build endpoint -> permission bit table.
+    Fails on protected routes without declared permission and on unknown pairs.
+    """
+    route_permissions.clear()
+    for route in routes:
+        if not isinstance(route, APIRoute):
+            continue
+        permission = getattr(route.endpoint, PERMISSION_ATTR, None)
+        if permission is None:
+            if _depends_on(route.dependant, get_current_user):
+                raise RoutePermissionsError(
+                    route.path, "protected route does not declare a permission."
+                )
+            continue
+        bit = PERMISSION_BITS.get(permission)
+        if bit is None:
+            raise RoutePermissionsError(
+                route.path, f"unknown permission {permission!r}."
+            )
+        route_permissions[route.endpoint] = bit
+    return route_permissions
@@ -1,10 +1,13 @@
 from typing import Protocol
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.apps.users.services.users import UsersServiceProtocol
 from ..services.jwt_service import JWTServiceProtocol
 from ..services.security import SecurityServiceProtocol
 from ..schemas.credentials import CredentialsSchema
 from ..schemas.tokens import TokenInfo, TokenCreateSchema
+from ..tools.jwts import token_digest
 from ..exceptions import UnauthorizedException, InactiveUserException
 
 
@@ -18,7 +21,9 @@ class LoginUseCaseImpl:
         users_service: UsersServiceProtocol,
         security_service: SecurityServiceProtocol,
         jwt_service: JWTServiceProtocol,
+        session: AsyncSession,
     ) -> None:
+        self.session = session
         self.users_service = users_service
         self.security_service = security_service
         self.jwt_service = jwt_service
@@ -29,9 +34,12 @@ class LoginUseCaseImpl:
             user = await self.users_service.get_user_by_username(login_user.username)
         except Exception:
             raise UnauthorizedException
+        # End the read transaction: the pooled connection must not be held
+        # while the password waits for the bcrypt executor
+        await self.session.commit()
 
         # 2. Validate password (security service)
-        if not self.security_service.validate_password(
+        if not await self.security_service.validate_password(
             password=login_user.password,
             hashed_password=user.hashed_password,
         ):
@@ -46,10 +54,15 @@ class LoginUseCaseImpl:
         refresh_token = self.jwt_service.create_refresh_token(user)
 
         # 5. Save refresh token in DB (jwt_service)
-        token_save = TokenCreateSchema(token=refresh_token, user_id=user.id)
+        token_save = TokenCreateSchema(
+            jti=refresh_token.jti,
+            token_digest=token_digest(refresh_token.token),
+            user_id=user.id,
+            expires_at=refresh_token.expires_at,
+        )
         await self.jwt_service.save_refresh_token(token_save)
 
         return TokenInfo(
             access_token=access_token,
-            refresh_token=refresh_token,
+            refresh_token=refresh_token.token,
         )
@@ -24,7 +24,7 @@ class RegisterUseCaseImpl:
 
     async def __call__(self: Self, register_schema: CredentialsSchema) -> bool:
         # 1. Hash input password
-        hashed_password = self.security_service.encode_password(
+        hashed_password = await self.security_service.encode_password(
             password=register_schema.password,
         )
         # 2. Create new user
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from src.core.container import container, Scope
+from src.core.database.db_provider import db_provider
+from .services import ExportServiceProtocol, ExportServiceImpl
+
+container.register(
+    ExportServiceProtocol,
+    lambda r: ExportServiceImpl(transaction=db_provider.transaction),
+    Scope.APP,
+)
+
+ExportService = Annotated[
+    ExportServiceProtocol, container.depends(ExportServiceProtocol)
+]
@@ -0,0 +1,80 @@
+import csv
+import io
+from typing import Protocol, Sequence
+
+from pydantic import BaseModel
+
+from .enums import ExportFormatEnum
+
+# Cells starting with these are evaluated as formulas by spreadsheets
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def escape_cell(value):
+    """
+    Quote text cells a spreadsheet would run as a formula (CSV injection).
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class ExportEncoderProtocol(Protocol):
+    media_type: str
+    extension: str
+
+    def header(self, schema: type[BaseModel]) -> bytes: ...
+
+    def encode(self, objects: Sequence[BaseModel]) -> bytes: ...
+
+
+class NDJSONEncoder:
+    """
+    One JSON document per line.
+    """
+
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def header(self, schema: type[BaseModel]) -> bytes:
+        return b""
+
+    def encode(self, objects: Sequence[BaseModel]) -> bytes:
+        return b"".join(
+            obj.model_dump_json(by_alias=True).encode() + b"\n" for obj in objects
+        )
+
+
+class CSVEncoder:
+    """
+    RFC 4180 CSV, header row uses serialization aliases.
+    Text cells that look like formulas are prefixed with ``'``.
+    """
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def header(self, schema: type[BaseModel]) -> bytes:
+        fields = [
+            field.serialization_alias or name
+            for name, field in schema.model_fields.items()
+        ]
+        return self._rows([fields])
+
+    def encode(self, objects: Sequence[BaseModel]) -> bytes:
+        return self._rows(
+            map(escape_cell, obj.model_dump(mode="json", by_alias=True).values())
+            for obj in objects
+        )
+
+    @staticmethod
+    def _rows(rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+
+
+ENCODERS: dict[ExportFormatEnum, ExportEncoderProtocol] = {
+    ExportFormatEnum.NDJSON: NDJSONEncoder(),
+    ExportFormatEnum.CSV: CSVEncoder(),
+}
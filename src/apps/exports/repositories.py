@@ -0,0 +1,28 @@
+from src.core.repositories.db_repository import DBRepositoryImpl
+from src.core.models.auth_token import AuthToken
+from src.core.models.roles import Role
+from src.core.models.users import User
+from src.core.schemas import CreateBaseModel, UpdateBaseModel
+
+from .schemas import UserExportSchema, RoleExportSchema, TokenExportSchema
+
+
+class UsersExportRepositoryImpl(
+    DBRepositoryImpl[User, UserExportSchema, CreateBaseModel, UpdateBaseModel],
+):
+    model_type = User
+    read_schema_type = UserExportSchema
+
+
+class RolesExportRepositoryImpl(
+    DBRepositoryImpl[Role, RoleExportSchema, CreateBaseModel, UpdateBaseModel],
+):
+    model_type = Role
+    read_schema_type = RoleExportSchema
+
+
+class TokensExportRepositoryImpl(
+    DBRepositoryImpl[AuthToken, TokenExportSchema, CreateBaseModel, UpdateBaseModel],
+):
+    model_type = AuthToken
+    read_schema_type = TokenExportSchema
@@ -0,0 +1,68 @@
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from src.apps.auth.enums import ResourcesEnum, ActionsEnum
+from src.apps.auth.tools.deps import CurrentUser
+from src.apps.auth.tools.rbac import requires_permission
+from src.core.repositories.db_repository import DBRepositoryImpl
+from src.core.responses import JSONRoute
+from .depends import ExportService
+from .encoders import ENCODERS
+from .enums import ExportFormatEnum
+from .repositories import (
+    UsersExportRepositoryImpl,
+    RolesExportRepositoryImpl,
+    TokensExportRepositoryImpl,
+)
+
+router = APIRouter(
+    prefix="/exports",
+    tags=["Exports"],
+    route_class=JSONRoute,
+)
+
+
+def export_response(
+    service: ExportService,
+    repository_type: type[DBRepositoryImpl],
+    export_format: ExportFormatEnum,
+    name: str,
+) -> StreamingResponse:
+    encoder = ENCODERS[export_format]
+    return StreamingResponse(
+        service.stream(repository_type, export_format),
+        media_type=encoder.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{encoder.extension}"'
+        },
+    )
+
+
+@router.get("/users", response_class=StreamingResponse)
+@requires_permission(ResourcesEnum.USERS, ActionsEnum.EXPORT)
+async def export_users(
+    service: ExportService,
+    _: CurrentUser,
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+) -> StreamingResponse:
+    return export_response(service, UsersExportRepositoryImpl, format, "users")
+
+
+@router.get("/roles", response_class=StreamingResponse)
+@requires_permission(ResourcesEnum.ROLES, ActionsEnum.EXPORT)
+async def export_roles(
+    service: ExportService,
+    _: CurrentUser,
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+) -> StreamingResponse:
+    return export_response(service, RolesExportRepositoryImpl, format, "roles")
+
+
+@router.get("/auth-tokens", response_class=StreamingResponse)
+@requires_permission(ResourcesEnum.AUTH_TOKENS, ActionsEnum.EXPORT)
+async def export_auth_tokens(
+    service: ExportService,
+    _: CurrentUser,
+    format: ExportFormatEnum = ExportFormatEnum.NDJSON,
+) -> StreamingResponse:
+    return export_response(service, TokensExportRepositoryImpl, format, "auth_tokens")
@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime
+
+from src.core.schemas import ResponseSchema
+
+
+class UserExportSchema(ResponseSchema):
+    id: uuid.UUID
+    username: str
+    is_active: bool
+    location_id: int
+
+
+class RoleExportSchema(ResponseSchema):
+    id: int
+    name: str
+
+
+class TokenExportSchema(ResponseSchema):
+    """
+    Token digests never leave the database.
+    """
+
+    id: int
+    jti: uuid.UUID
+    user_id: uuid.UUID
+    is_used: bool
+    created_at: datetime
+    expires_at: datetime
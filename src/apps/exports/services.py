@@ -0,0 +1,53 @@
+from typing import AsyncContextManager, AsyncIterator, Callable, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repositories.db_repository import DBRepositoryImpl
+from src.core.schemas import SortSchema
+
+from .encoders import ENCODERS
+from .enums import ExportFormatEnum
+
+
+class ExportServiceProtocol(Protocol):
+    def stream(
+        self,
+        repository_type: type[DBRepositoryImpl],
+        export_format: ExportFormatEnum,
+    ) -> AsyncIterator[bytes]: ...
+
+
+class ExportServiceImpl:
+    """
+    Encode a whole table chunk by chunk from a server-side cursor.
+
+    The stream opens its own transaction: request dependencies are closed
+    before the response body is sent. Chunks are produced only when the
+    client has consumed the previous one, so memory is bounded by
+    ``chunk_size`` rows whatever the table size.
+    """
+
+    def __init__(
+        self,
+        transaction: Callable[[], AsyncContextManager[AsyncSession]],
+        chunk_size: int | None = None,
+    ) -> None:
+        self.transaction = transaction
+        self.chunk_size = chunk_size
+
+    async def stream(
+        self,
+        repository_type: type[DBRepositoryImpl],
+        export_format: ExportFormatEnum,
+    ) -> AsyncIterator[bytes]:
+        encoder = ENCODERS[export_format]
+        header = encoder.header(repository_type.read_schema_type)
+        if header:
+            yield header
+        async with self.transaction() as session:
+            repository = repository_type(session=session)
+            async for chunk in repository.iter_chunks(
+                sorting=[SortSchema(field="id", order="asc")],
+                chunk_size=self.chunk_size,
+            ):
+                yield encoder.encode(chunk)
@@ -1,12 +1,31 @@
 from fastapi import APIRouter
 from src.core.schemas import SuccessResponseSchema
+from src.core.cache import cache_provider
+from src.core.executors import crypto_executor
+from src.apps.auth.enums import ResourcesEnum, ActionsEnum
+from src.apps.auth.services.acl import acl_cache
+from src.apps.auth.tools.deps import CurrentUser
+from src.apps.auth.tools.rbac import requires_permission
+from src.core.responses import JSONRoute
+from .schemas import MetricsSchema
 
 router = APIRouter(
     prefix="/health",
     tags=["Health"],
+    route_class=JSONRoute,
 )
 
 
 @router.get("", response_model=SuccessResponseSchema)
 async def health_check() -> SuccessResponseSchema:
     return SuccessResponseSchema()
+
+
+@router.get("/metrics", response_model=MetricsSchema)
+@requires_permission(ResourcesEnum.METRICS, ActionsEnum.VIEW)
+async def metrics(_: CurrentUser) -> MetricsSchema:
+    return MetricsSchema(
+        crypto=crypto_executor.stats(),
+        acl=acl_cache.stats(),
+        cache=cache_provider.stats(),
+    )
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from src.core.executors import CPUExecutorStats
+from src.core.repositories.cache_repository import CacheStats
+from src.apps.auth.services.acl import ACLCacheStats
+
+
+class MetricsSchema(BaseModel):
+    crypto: CPUExecutorStats
+    acl: ACLCacheStats
+    cache: dict[str, CacheStats]
@@ -0,0 +1,78 @@
+import hashlib
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from src.settings import settings
+from src.core.cache import cache_provider, invalidation
+from src.core.database.db_provider import db_provider
+
+from .repository import ReferencesRepositoryImpl
+
+references_cache = cache_provider.repository(
+    "references",
+    default_ttl=settings.references.cache_ttl_seconds,
+)
+
+PAYLOAD_KEY = "payload"
+DELTA_KEY = "delta:{since}:{until}"
+
+
+class EncodedReferences(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def encode_references(data: BaseModel) -> EncodedReferences:
+    body = data.model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return EncodedReferences(body=body, etag=etag)
+
+
+async def load_encoded_references(
+    since: int | None = None,
+    until: int | None = None,
+) -> EncodedReferences:
+    async with db_provider.transaction() as session:
+        repository = ReferencesRepositoryImpl(session=session)
+        if since is None:
+            data = await repository.get_all()
+        else:
+            data = await repository.get_changes(since, until)
+    return encode_references(data)
+
+
+async def get_references_version() -> int:
+    async with db_provider.transaction() as session:
+        return await ReferencesRepositoryImpl(session=session).get_version()
+
+
+async def get_encoded_references(since: int | None = None) -> EncodedReferences:
+    """
+    Reference data (or changes since ``since``) serialized once and cached
+    with its content ETag. A delta is cached by its version range, it
+    never goes stale: new writes move the current version, hence the key.
+    """
+    if since is None:
+        return await references_cache.get_or_load(
+            PAYLOAD_KEY, lambda: load_encoded_references()
+        )
+    until = await get_references_version()
+    return await references_cache.get_or_load(
+        DELTA_KEY.format(since=since, until=until),
+        lambda: load_encoded_references(since, until),
+    )
+
+
+async def invalidate_references() -> None:
+    await references_cache.clear()
+
+
+invalidation.subscribe(invalidate_references)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
@@ -1,15 +1,17 @@
 from typing import Annotated
-from fastapi import Depends
-
-from src.core.database.db_provider import SessionDep
-from .repository import ReferencesRepositoryProtocol, ReferencesRepositoryImpl
 
+from sqlalchemy.ext.asyncio import AsyncSession
 
-def get_references_repository(session: SessionDep) -> ReferencesRepositoryProtocol:
-    return ReferencesRepositoryImpl(session=session)
+from src.core.container import container, Scope
+from .repository import ReferencesRepositoryProtocol, ReferencesRepositoryImpl
 
+container.register(
+    ReferencesRepositoryProtocol,
+    lambda r: ReferencesRepositoryImpl(session=r.get(AsyncSession)),
+    Scope.REQUEST,
+)
 
 ReferencesRepository = Annotated[
     ReferencesRepositoryProtocol,
-    Depends(get_references_repository),
+    container.depends(ReferencesRepositoryProtocol),
 ]
@@ -1,51 +1,83 @@
 from collections import defaultdict
 from typing import Protocol
 
-from sqlalchemy import select, literal_column, union_all
+from sqlalchemy import select, literal_column, text, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.models.references import Location, Gender, Status
-from .schemas import Reference, ReferenceData
+from src.core.models.references import VERSION_WATERMARK, reference_models
+from .schemas import Reference, ReferenceChange, ReferenceData, ReferenceDelta
 
 
 class ReferencesRepositoryProtocol(Protocol):
 
+    async def get_version(self) -> int: ...
+
     async def get_all(self) -> ReferenceData: ...
 
+    async def get_changes(self, since: int, until: int) -> ReferenceDelta: ...
 
-class ReferencesRepositoryImpl:
 
-    tables = [
-        ("locations", Location),
-        ("genders", Gender),
-        ("statuses", Status),
-        # others references
-    ]
+class ReferencesRepositoryImpl:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+        self.tables = reference_models()
+
+    async def get_version(self) -> int:
+        """
+        Committed high-water mark: every transaction that wrote a version
+        below it has finished, so rows under it never change retroactively.
+        """
+        return (await self.session.execute(text(VERSION_WATERMARK))).scalar_one()
 
     async def get_all(self) -> ReferenceData:
-        async with self.session as s:
-            combined_query = union_all(
-                *(
-                    select(
-                        literal_column(f"'{table_name}'").label("table_name"),
-                        model.id,
-                        model.name,
-                    )
-                    for table_name, model in self.tables
-                )
+        """
+        Live rows of every reference table and the version to sync from.
+        """
+        version = await self.get_version()
+        combined_query = union_all(
+            *(
+                select(
+                    literal_column(f"'{table_name}'").label("table_name"),
+                    model.id,
+                    model.name,
+                ).where(model.deleted.is_(False))
+                for table_name, model in self.tables.items()
             )
-            result = await s.execute(combined_query)
+        )
+        result = await self.session.execute(combined_query)
 
-            grouped_data: defaultdict[str, list[Reference]] = defaultdict(list)
-            for table_name, id_, name in result:
-                grouped_data[table_name].append(Reference(id=id_, name=name))
+        # Rows committed at or above the version are re-sent by the next
+        # delta, which is harmless.
+        grouped_data: defaultdict[str, list[Reference]] = defaultdict(list)
+        for table_name, id_, name in result:
+            grouped_data[table_name].append(Reference(id=id_, name=name))
 
-            return ReferenceData(
-                locations=grouped_data["locations"],
-                genders=grouped_data["genders"],
-                statuses=grouped_data["statuses"],
-                # others references
+        return ReferenceData(version=version, **grouped_data)
+
+    async def get_changes(self, since: int, until: int) -> ReferenceDelta:
+        """
+        Rows inserted, updated or deleted (tombstones) with version in
+        ``[since, until)``, ``until`` being a version from ``get_version``.
+        The result never changes, later writes get versions above ``until``.
+        """
+        combined_query = union_all(
+            *(
+                select(
+                    literal_column(f"'{table_name}'").label("table_name"),
+                    model.id,
+                    model.name,
+                    model.deleted,
+                ).where(model.version >= since, model.version < until)
+                for table_name, model in self.tables.items()
+            )
+        )
+        result = await self.session.execute(combined_query)
+
+        grouped_data: defaultdict[str, list[ReferenceChange]] = defaultdict(list)
+        for table_name, id_, name, deleted in result:
+            grouped_data[table_name].append(
+                ReferenceChange(id=id_, name=name, deleted=deleted)
             )
+
+        return ReferenceDelta(version=max(since, until), since=since, **grouped_data)
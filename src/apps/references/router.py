@@ -1,17 +1,61 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from .depends import ReferencesRepository
-from .schemas import ReferenceData
+from fastapi import APIRouter, Header, Query, Response, status
+
+from src.apps.auth.enums import ResourcesEnum, ActionsEnum
+from src.apps.auth.tools.deps import CurrentUser
+from src.apps.auth.tools.rbac import requires_permission
+from src.core.schemas import SuccessResponseSchema
+from src.settings import settings
+from src.core.responses import JSONRoute
+from src.core.cache import invalidation
+from .cache import get_encoded_references, etag_matches
+from .schemas import ReferenceData, ReferenceDelta
 
 router = APIRouter(
     prefix="/references",
     tags=["References"],
+    route_class=JSONRoute,
 )
 
 
-@router.get("")
+@router.get(
+    "",
+    response_model=ReferenceData | ReferenceDelta,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
+)
 async def get_references(
-    repository: ReferencesRepository,
-) -> ReferenceData:
-    result = await repository.get_all()
-    return result
+    since: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            description="Return only changes since this version "
+            "(``version`` of a previous response)",
+        ),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    references = await get_encoded_references(since)
+    headers = {
+        "ETag": references.etag,
+        "Cache-Control": (
+            f"public, max-age={settings.references.max_age_seconds}, must-revalidate"
+        ),
+    }
+    if etag_matches(if_none_match, references.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=references.body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.post("/invalidate")
+@requires_permission(ResourcesEnum.REFERENCES, ActionsEnum.EDIT)
+async def invalidate_references_cache(_: CurrentUser) -> SuccessResponseSchema:
+    """
+    Drop cached references (and ACL) in every worker.
+    """
+    await invalidation.publish()
+    return SuccessResponseSchema()
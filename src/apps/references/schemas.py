@@ -1,5 +1,7 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
+
+from src.core.models.references import reference_models
 
 
 class Reference(BaseModel):
@@ -7,8 +9,27 @@ class Reference(BaseModel):
     name: str
 
 
-class ReferenceData(BaseModel):
-    locations: List[Reference]
-    genders: List[Reference]
-    statuses: List[Reference]
-    #  others references
+class ReferenceChange(Reference):
+    deleted: bool
+
+
+class ReferenceVersion(BaseModel):
+    version: int
+
+
+class ReferenceDeltaVersion(ReferenceVersion):
+    since: int
+
+
+# One list field per reference table, e.g. `locations`, `genders`, `statuses`
+ReferenceData = create_model(
+    "ReferenceData",
+    __base__=ReferenceVersion,
+    **{table: (List[Reference], []) for table in reference_models()},
+)
+
+ReferenceDelta = create_model(
+    "ReferenceDelta",
+    __base__=ReferenceDeltaVersion,
+    **{table: (List[ReferenceChange], []) for table in reference_models()},
+)
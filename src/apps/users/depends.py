@@ -1,7 +1,8 @@
 from typing import Annotated
-from fastapi import Depends
 
-from src.core.database import SessionDep
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.container import container, Scope
 
 from .repositories.users import UsersRepositoryProtocol, UsersRepositoryImpl
 from .services.users import UsersServiceProtocol, UsersServiceImpl
@@ -9,35 +10,39 @@ from .use_cases.user_info import UserInfoUseCaseProtocol, UserInfoUseCaseImpl
 
 
 # === REPOSITORIES ===
-def get_users_repository(session: SessionDep) -> UsersRepositoryProtocol:
-    return UsersRepositoryImpl(session=session)
-
+container.register(
+    UsersRepositoryProtocol,
+    lambda r: UsersRepositoryImpl(session=r.get(AsyncSession)),
+    Scope.REQUEST,
+)
 
 UsersRepository = Annotated[
     UsersRepositoryProtocol,
-    Depends(get_users_repository),
+    container.depends(UsersRepositoryProtocol),
 ]
 
 
 # === SERVICES ===
-def get_users_service(repository: UsersRepository) -> UsersServiceProtocol:
-    return UsersServiceImpl(repository=repository)
-
+container.register(
+    UsersServiceProtocol,
+    lambda r: UsersServiceImpl(repository=r.get(UsersRepositoryProtocol)),
+    Scope.REQUEST,
+)
 
 UsersService = Annotated[
     UsersServiceProtocol,
-    Depends(get_users_service),
+    container.depends(UsersServiceProtocol),
 ]
 
 
 # === USE CASES ===
-def get_user_info_use_case(
-    user_service: UsersService,
-) -> UserInfoUseCaseProtocol:
-    return UserInfoUseCaseImpl(users_service=user_service)
-
+container.register(
+    UserInfoUseCaseProtocol,
+    lambda r: UserInfoUseCaseImpl(users_service=r.get(UsersServiceProtocol)),
+    Scope.REQUEST,
+)
 
 UserInfoUseCase = Annotated[
     UserInfoUseCaseProtocol,
-    Depends(get_user_info_use_case),
+    container.depends(UserInfoUseCaseProtocol),
 ]
@@ -1,21 +1,29 @@
 import uuid
+from typing import Any, TypeVar
 
-from sqlalchemy import select, insert
-from sqlalchemy.orm import selectinload
+from pydantic import BaseModel
+from sqlalchemy import select, insert, func, null, String
+from sqlalchemy.dialects.postgresql import ARRAY, array_agg
+from sqlalchemy.sql import Select
 
 from src.core.repositories.db_repository import (
     DBRepositoryProtocol,
     DBRepositoryImpl,
 )
 from src.core.models.users import User
+from src.core.models.roles import Role
+from src.core.models.users_roles import UserRole
 from src.core.exceptions import ModelNotFoundException
 
 from ..schemas.users import (
     UserReadSchema,
+    UserResponseSchema,
     UserCreateSchema,
     UserUpdateSchema,
 )
 
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
 
 class UsersRepositoryProtocol(
     DBRepositoryProtocol[
@@ -31,6 +39,8 @@ class UsersRepositoryProtocol(
 
     async def get_user_by_uuid(self, uid: uuid.UUID) -> UserReadSchema: ...
 
+    async def get_user_profile(self, uid: uuid.UUID) -> UserResponseSchema: ...
+
 
 class UsersRepositoryImpl(
     UsersRepositoryProtocol,
@@ -45,49 +55,58 @@ class UsersRepositoryImpl(
     read_schema_type = UserReadSchema
 
     async def create_user(self, create_object: UserCreateSchema) -> uuid.UUID:
-        async with self.session as s, s.begin():
-            statement = (
-                insert(self.model_type)
-                .values(**create_object.model_dump(exclude={"id"}))
-                .returning(self.model_type.id)
-            )
-            model = (await s.execute(statement)).scalar_one()
-            return model
+        statement = (
+            insert(self.model_type)
+            .values(**create_object.model_dump(exclude={"id"}))
+            .returning(self.model_type.id)
+        )
+        model = (await self.session.execute(statement)).scalar_one()
+        return model
 
     async def get_user_by_username(self, username: str) -> UserReadSchema:
-        async with self.session as s:
-            statement = (
-                select(self.model_type)
-                .filter_by(username=username)
-                .options(selectinload(self.model_type.roles))
-            )
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
-                raise ModelNotFoundException(self.model_type)
-
-            model_dict = model.__dict__.copy()
-            model_dict["roles"] = [role.name for role in model.roles]
-
-            return self.read_schema_type.model_validate(
-                model_dict,
-                from_attributes=True,
-            )
+        statement = self._user_with_roles(
+            UserReadSchema,
+            self.model_type.username == username,
+        )
+        return await self._fetch_user(statement, UserReadSchema)
 
     async def get_user_by_uuid(self, uid: uuid.UUID) -> UserReadSchema:
-        async with self.session as s:
-            statement = (
-                select(self.model_type)
-                .filter_by(id=uid)
-                .options(selectinload(self.model_type.roles))
-            )
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
-                raise ModelNotFoundException(self.model_type)
-
-            model_dict = model.__dict__.copy()
-            model_dict["roles"] = [role.name for role in model.roles]
-
-            return self.read_schema_type.model_validate(
-                model_dict,
-                from_attributes=True,
-            )
+        statement = self._user_with_roles(UserReadSchema, self.model_type.id == uid)
+        return await self._fetch_user(statement, UserReadSchema)
+
+    async def get_user_profile(self, uid: uuid.UUID) -> UserResponseSchema:
+        statement = self._user_with_roles(
+            UserResponseSchema,
+            self.model_type.id == uid,
+        )
+        return await self._fetch_user(statement, UserResponseSchema)
+
+    def _user_with_roles(self, schema: type[BaseModel], *where: Any) -> Select:
+        """
+        Select schema fields and aggregated role names in one statement.
+        """
+        roles = func.array_remove(
+            array_agg(Role.name),
+            null(),
+            type_=ARRAY(String),
+        ).label("roles")
+        columns = [
+            getattr(self.model_type, field)
+            for field in schema.model_fields
+            if field != "roles"
+        ]
+        return (
+            select(*columns, roles)
+            .outerjoin(UserRole, UserRole.user_id == self.model_type.id)
+            .outerjoin(Role, Role.id == UserRole.role_id)
+            .where(*where)
+            .group_by(self.model_type.id)
+        )
+
+    async def _fetch_user(
+        self, statement: Select, schema: type[SchemaType]
+    ) -> SchemaType:
+        row = (await self.session.execute(statement)).one_or_none()
+        if row is None:
+            raise ModelNotFoundException(self.model_type)
+        return schema.model_validate(row, from_attributes=True)
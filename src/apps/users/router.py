@@ -1,5 +1,8 @@
 from fastapi import APIRouter
+from src.apps.auth.enums import ResourcesEnum, ActionsEnum
 from src.apps.auth.tools.deps import CurrentUser
+from src.apps.auth.tools.rbac import requires_permission
+from src.core.responses import JSONRoute
 from .schemas.users import UserResponseSchema
 from .depends import UserInfoUseCase
 
@@ -7,10 +10,12 @@ from .depends import UserInfoUseCase
 router = APIRouter(
     prefix="/users",
     tags=["Users"],
+    route_class=JSONRoute,
 )
 
 
-@router.get("/profile", name="users.view")
+@router.get("/profile")
+@requires_permission(ResourcesEnum.USERS, ActionsEnum.VIEW)
 async def get_user_info(
     use_case: UserInfoUseCase,
     user_id: CurrentUser,
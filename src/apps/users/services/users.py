@@ -33,10 +33,7 @@ class UsersServiceImpl:
 
     async def get_user_by_uuid(self, user_id: uuid.UUID) -> UserResponseSchema:
         try:
-            user = await self.repository.get_user_by_uuid(user_id)
-            user_response = UserResponseSchema(
-                **user.model_dump(exclude={"hashed_password"})
-            )
+            user = await self.repository.get_user_profile(user_id)
         except Exception:
             raise
-        return user_response
+        return user
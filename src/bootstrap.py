@@ -3,11 +3,21 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.core.cache import cache_provider, invalidation
+from src.core.container import container
 from src.core.database import db_provider
+from src.core.executors import crypto_executor
+from src.core.responses import PydanticJSONResponse
+from src.core.tasks import PeriodicTask
+from src.apps.auth.tools.keyring import jwt_keyring
+from src.apps.auth.tools.claims import reload_keys
+from src.apps.auth.services.acl import acl_cache
+from src.apps.auth.tasks import purge_auth_tokens
 from src.middleware import apply_middleware
 from src.router import apply_routes
 
 from src.tools.database.loaddata import load_data
+from src.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +26,55 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     logging.basicConfig(level=logging.DEBUG)
     logger.info("Start application")
-    await load_data()
+    if not getattr(app.state, "preloaded", False):
+        await load_data()
+        jwt_keyring.load()
+    await container.startup()
+    invalidation.start()
+    keys_reloader = PeriodicTask(
+        name="jwt-keys-reload",
+        func=reload_keys,
+        interval=settings.auth_jwt.key_reload_interval_seconds,
+    )
+    tokens_purger = PeriodicTask(
+        name="auth-tokens-purge",
+        func=purge_auth_tokens,
+        interval=settings.auth_jwt.purge_interval_seconds,
+    )
+    keys_reloader.start()
+    tokens_purger.start()
     yield
     logger.info("Dispose application")
+    invalidation.stop()
+    await tokens_purger.stop()
+    await keys_reloader.stop()
+    await container.shutdown()
+    await db_provider.dispose()
+    await cache_provider.close()
+    crypto_executor.shutdown()
+
+
+async def preload(app: FastAPI) -> None:
+    """
+    Startup work done once in the parent of forked workers: seed, keys,
+    app-scoped services and the compiled ACL are inherited by every worker.
+    Connections and pools are closed afterwards, workers open their own.
+    """
+    await load_data()
+    jwt_keyring.load()
+    await container.startup()
+    await acl_cache.get()
     await db_provider.dispose()
+    await cache_provider.close()
+    crypto_executor.shutdown()
+    app.state.preloaded = True
 
 
 def create_app() -> FastAPI:
     app = FastAPI(
         title="FastAPI template",
         lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
     )
     app = apply_middleware(app)
     app = apply_routes(app)
@@ -0,0 +1,4 @@
+__all__ = ("cache_provider", "invalidation")
+
+from .cache_provider import cache_provider
+from .invalidation import invalidation
@@ -0,0 +1,89 @@
+from typing import Literal
+
+from src.settings import settings
+from ..cache.resp import RESPClient
+from ..repositories.cache_repository import (
+    CacheBackendProtocol,
+    CacheRepositoryImpl,
+    CacheRepositoryProtocol,
+    CacheStats,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+
+
+class CacheProvider:
+    """
+    Owns cache backends and hands out namespaced repositories.
+
+    ``shared`` repositories use the configured backend (memory or redis),
+    ``local`` ones always live in process memory, use them for values that
+    are cheap to rebuild but must not leave the process.
+    """
+
+    def __init__(
+        self,
+        backend: Literal["memory", "redis"] = "memory",
+        url: str | None = None,
+        key_prefix: str = "app",
+        default_ttl: float | None = None,
+        max_entries: int = 10_000,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        pool_size: int = 10,
+    ) -> None:
+        self.key_prefix = key_prefix
+        self.default_ttl = default_ttl
+        self.memory_backend = MemoryCacheBackend(
+            max_entries=max_entries,
+            max_memory_bytes=max_memory_bytes,
+        )
+        self.shared_backend: CacheBackendProtocol = self.memory_backend
+        if backend == "redis":
+            if not url:
+                raise ValueError("Cache url is required for redis backend")
+            self.shared_backend = RedisCacheBackend(RESPClient(url, pool_size))
+        self._repositories: dict[str, CacheRepositoryImpl] = {}
+
+    def repository(
+        self,
+        namespace: str,
+        local: bool = False,
+        default_ttl: float | None = None,
+    ) -> CacheRepositoryProtocol:
+        """
+        Repository shared by all callers of the same namespace and TTL.
+        """
+        name = f"local:{namespace}" if local else namespace
+        if default_ttl is not None:
+            name = f"{name}@{default_ttl:g}s"
+        repository = self._repositories.get(name)
+        if repository is None:
+            backend = self.memory_backend if local else self.shared_backend
+            repository = CacheRepositoryImpl(
+                backend=backend,
+                prefix=f"{self.key_prefix}:{namespace}",
+                default_ttl=(
+                    default_ttl if default_ttl is not None else self.default_ttl
+                ),
+            )
+            self._repositories[name] = repository
+        return repository
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {name: repo.stats() for name, repo in self._repositories.items()}
+
+    async def close(self) -> None:
+        await self.shared_backend.close()
+        if self.shared_backend is not self.memory_backend:
+            await self.memory_backend.close()
+
+
+cache_provider = CacheProvider(
+    backend=settings.cache.backend,
+    url=settings.cache.url,
+    key_prefix=settings.cache.key_prefix,
+    default_ttl=settings.cache.default_ttl_seconds,
+    max_entries=settings.cache.max_entries,
+    max_memory_bytes=settings.cache.max_memory_mb * 1024 * 1024,
+    pool_size=settings.cache.pool_size,
+)
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import os
+import signal
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_SIGNAL = signal.SIGUSR1
+
+
+class Invalidation:
+    """
+    Drops process-local caches in every worker.
+
+    Subscribers clear their caches of this process. ``publish`` runs them
+    and, in a worker of the pre-fork runner (``parent_pid`` set), signals
+    the runner, which relays the signal to all workers. The signal carries
+    no payload, every subscriber runs on every invalidation.
+    """
+
+    def __init__(self) -> None:
+        self.parent_pid: int | None = None
+        self._subscribers: list[Callable[[], Awaitable[None]]] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._listening = False
+
+    def subscribe(self, callback: Callable[[], Awaitable[None]]) -> None:
+        self._subscribers.append(callback)
+
+    async def publish(self) -> None:
+        await self.invalidate_local()
+        if self.parent_pid is not None:
+            os.kill(self.parent_pid, INVALIDATE_SIGNAL)
+
+    async def invalidate_local(self) -> None:
+        for callback in self._subscribers:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("Invalidation of %r failed", callback)
+
+    def start(self) -> None:
+        """
+        Listen for relayed invalidations (workers of the runner only).
+        """
+        if self.parent_pid is not None and not self._listening:
+            asyncio.get_running_loop().add_signal_handler(
+                INVALIDATE_SIGNAL, self._received
+            )
+            self._listening = True
+
+    def stop(self) -> None:
+        if self._listening:
+            asyncio.get_running_loop().remove_signal_handler(INVALIDATE_SIGNAL)
+            # the default action of the signal would terminate the process
+            signal.signal(INVALIDATE_SIGNAL, signal.SIG_IGN)
+            self._listening = False
+
+    def _received(self) -> None:
+        logger.debug("Invalidation received")
+        task = asyncio.create_task(self.invalidate_local())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+invalidation = Invalidation()
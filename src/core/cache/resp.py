@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any
+from urllib.parse import urlparse
+
+
+class RESPError(Exception):
+    """
+    Error reply returned by a Redis-protocol server.
+    """
+
+
+def encode_command(*args: bytes | str | int | float) -> bytes:
+    chunks = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        chunks.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(chunks)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    reply = await _read_reply(reader)
+    if isinstance(reply, RESPError):
+        raise reply
+    return reply
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    """
+    Error replies are returned, not raised: an error inside an array must
+    not leave the rest of the array unread on the connection.
+    """
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server")
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b"+":
+        return body.decode()
+    if prefix == b"-":
+        return RESPError(body.decode())
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length == -1:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(body)
+        if length == -1:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unknown reply prefix: {prefix!r}")
+
+
+class RESPConnection:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: bytes | str | int | float) -> Any:
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+        return await read_reply(self.reader)
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class RESPClient:
+    """
+    Minimal pooled client for Redis-protocol servers (RESP2).
+    Url format: redis://[:password@]host[:port][/db]
+    """
+
+    def __init__(self, url: str, pool_size: int = 10, timeout: float = 5) -> None:
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._pool: asyncio.LifoQueue[RESPConnection] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def _connect(self) -> RESPConnection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            timeout=self.timeout,
+        )
+        connection = RESPConnection(reader, writer)
+        if self.password:
+            await connection.execute("AUTH", self.password)
+        if self.db:
+            await connection.execute("SELECT", self.db)
+        return connection
+
+    async def execute(self, *args: bytes | str | int | float) -> Any:
+        async with self._slots:
+            try:
+                connection = self._pool.get_nowait()
+            except asyncio.QueueEmpty:
+                connection = await self._connect()
+            try:
+                result = await asyncio.wait_for(
+                    connection.execute(*args),
+                    timeout=self.timeout,
+                )
+            except RESPError:
+                self._pool.put_nowait(connection)
+                raise
+            except BaseException:
+                await connection.close()
+                raise
+            self._pool.put_nowait(connection)
+            return result
+
+    async def close(self) -> None:
+        while not self._pool.empty():
+            await self._pool.get_nowait().close()
@@ -0,0 +1,133 @@
+import logging
+from dataclasses import dataclass
+from enum import StrEnum, auto
+from typing import Any, Callable, TypeVar
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import SessionDep
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Scope(StrEnum):
+    APP = auto()  # built once, shared by all requests
+    REQUEST = auto()  # built once per request
+    TRANSIENT = auto()  # built on every resolve
+
+
+@dataclass(frozen=True, slots=True)
+class Provider:
+    factory: Callable[["Resolver"], Any]
+    scope: Scope
+
+
+class Resolver:
+    """
+    Resolves providers for one request.
+    ``seeds`` are request values known upfront (session, request).
+    """
+
+    __slots__ = ("container", "instances")
+
+    def __init__(self, container: "Container", seeds: dict[Any, Any]) -> None:
+        self.container = container
+        self.instances = seeds
+
+    def get(self, key: type[T]) -> T:
+        if key in self.instances:
+            return self.instances[key]
+        provider = self.container.provider(key)
+        if provider.scope == Scope.APP:
+            return self.container.get(key)
+        instance = provider.factory(self)
+        if provider.scope == Scope.REQUEST:
+            self.instances[key] = instance
+        return instance
+
+
+class Container:
+    """
+    Dependency container with app, request and transient scopes.
+
+    Providers are registered by key (usually the protocol type) at import
+    time of each app ``depends`` module. App-scoped instances are built by
+    ``startup`` in the lifespan (or lazily on first use), so stateless
+    services are not rebuilt on every request.
+    """
+
+    def __init__(self) -> None:
+        self._providers: dict[Any, Provider] = {}
+        self._instances: dict[Any, Any] = {}
+
+    def register(
+        self,
+        key: type[T],
+        factory: Callable[[Resolver], T],
+        scope: Scope = Scope.REQUEST,
+    ) -> None:
+        self._providers[key] = Provider(factory=factory, scope=scope)
+        self._instances.pop(key, None)
+
+    def provider(self, key: Any) -> Provider:
+        try:
+            return self._providers[key]
+        except KeyError:
+            raise LookupError(f"No provider registered for {key!r}") from None
+
+    def get(self, key: type[T]) -> T:
+        """
+        App-scoped instance, built on first use.
+        """
+        instance = self._instances.get(key)
+        if instance is None:
+            provider = self.provider(key)
+            if provider.scope != Scope.APP:
+                raise LookupError(f"{key!r} is not app-scoped")
+            instance = self._instances[key] = provider.factory(Resolver(self, {}))
+        return instance
+
+    def resolver(self, seeds: dict[Any, Any] | None = None) -> Resolver:
+        return Resolver(self, seeds or {})
+
+    def depends(self, key: type[T]) -> Any:
+        """
+        FastAPI dependency resolving ``key``.
+        App-scoped keys do not touch the request scope (nor open a session).
+        Dependencies are coroutines: sync ones would run in the threadpool.
+        """
+        if self.provider(key).scope == Scope.APP:
+
+            async def app_dependency() -> T:
+                return self.get(key)
+
+            return Depends(app_dependency)
+
+        async def dependency(
+            resolver: Resolver = Depends(get_request_resolver),
+        ) -> T:
+            return resolver.get(key)
+
+        return Depends(dependency)
+
+    async def startup(self) -> None:
+        for key, provider in self._providers.items():
+            if provider.scope == Scope.APP:
+                self.get(key)
+        logger.info("Container started: %s app-scoped providers", len(self._instances))
+
+    async def shutdown(self) -> None:
+        self._instances.clear()
+
+
+container = Container()
+
+
+async def get_request_resolver(request: Request, session: SessionDep) -> Resolver:
+    """
+    Request scope, cached by FastAPI so all dependencies of a request share it.
+    """
+    return container.resolver({Request: request, AsyncSession: session})
@@ -1,4 +1,5 @@
-from typing import AsyncGenerator, Annotated
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Annotated
 from fastapi import Depends
 
 from sqlalchemy.ext.asyncio import (
@@ -9,7 +10,6 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.settings import settings
-from ..models.base import Base
 
 
 class DatabaseProvider:
@@ -21,10 +21,24 @@ class DatabaseProvider:
         max_overflow: int = 10,
         pool_size: int = 50,
     ) -> None:
+        self.url = url
+        self.echo = echo
+        self.echo_pool = echo_pool
+        self.configure(pool_size=pool_size, max_overflow=max_overflow)
+
+    def configure(self, pool_size: int, max_overflow: int) -> None:
+        """
+        (Re)build the engine with new pool limits.
+        Called in forked workers, connections of the parent are not reused.
+        """
+        if getattr(self, "engine", None) is not None:
+            self.engine.sync_engine.dispose(close=False)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         self.engine: AsyncEngine = create_async_engine(
-            url=url,
-            echo=echo,
-            echo_pool=echo_pool,
+            url=self.url,
+            echo=self.echo,
+            echo_pool=self.echo_pool,
             max_overflow=max_overflow,
             pool_size=pool_size,
         )
@@ -39,11 +53,29 @@ class DatabaseProvider:
         await self.engine.dispose()
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Request-scoped unit of work.
+        All repositories of a request share one session, its transaction is
+        committed when the request succeeds and rolled back on error.
+        A use case may commit early to return the connection to the pool
+        before slow work (login before bcrypt), the next statement begins
+        a new transaction.
+        """
         async with self.session_factory() as session:
             try:
                 yield session
-            finally:
-                await session.close()
+            except BaseException:
+                await session.rollback()
+                raise
+            await session.commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSession]:
+        """
+        Unit of work outside of request (tasks, tools).
+        """
+        async with self.session_factory() as session, session.begin():
+            yield session
 
 
 db_provider = DatabaseProvider(
@@ -55,10 +87,4 @@ db_provider = DatabaseProvider(
 )
 
 
-async def init_db():
-    async with db_provider.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-
-
 SessionDep = Annotated[AsyncSession, Depends(db_provider.session_getter)]
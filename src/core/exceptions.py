@@ -30,6 +30,23 @@ class ModelNotFoundException(HTTPException, Generic[ModelType]):
         )
 
 
+class InvalidCursorException(HTTPException):
+    """
+    Pagination cursor is malformed or does not match requested sorting.
+    """
+
+    def __init__(
+        self,
+        detail: str = "Invalid cursor.",
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+            headers=headers,
+        )
+
+
 class ModelAlreadyExistsError(Exception):
     """
     Error that occurs when trying to create a model with an existing unique field.
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from time import perf_counter
+from typing import Callable, Literal, TypeVar, ParamSpec
+
+from pydantic import BaseModel
+
+from src.settings import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class CPUExecutorStats(BaseModel):
+    kind: ExecutorKind
+    max_workers: int
+    max_concurrency: int
+    queue_depth: int
+    in_flight: int
+    completed: int
+    failed: int
+    avg_wait_ms: float
+    avg_run_ms: float
+    max_run_ms: float
+
+
+class CPUExecutor:
+    """
+    Run CPU-bound callables outside the event loop.
+
+    The pool is created lazily on first use. ``max_concurrency`` caps the
+    number of jobs submitted to the pool at once, callers above the cap
+    wait in an asyncio queue so the pool backlog stays bounded.
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKind = "thread",
+        max_workers: int | None = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.kind = kind
+        self.max_workers = max_workers or min(max_concurrency, os.cpu_count() or 1)
+        self.max_concurrency = max_concurrency
+        self._pool: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # metrics
+        self._waiting = 0
+        self._started = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    @property
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="cpu-executor",
+                )
+            logger.debug("CPU executor started: %s x%s", self.kind, self.max_workers)
+        return self._pool
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """
+        Execute ``func`` in the pool and await its result.
+        """
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        loop = asyncio.get_running_loop()
+
+        self._waiting += 1
+        queued_at = perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        started_at = perf_counter()
+        self._wait_total += started_at - queued_at
+        self._started += 1
+        self._in_flight += 1
+        try:
+            result = await loop.run_in_executor(self.pool, func, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        else:
+            self._completed += 1
+            return result
+        finally:
+            elapsed = perf_counter() - started_at
+            self._run_total += elapsed
+            self._run_max = max(self._run_max, elapsed)
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def resize(self, max_workers: int) -> None:
+        """
+        Shrink the pool before first use, ``max_concurrency`` follows so
+        callers above the pool size wait in the (measured) queue.
+        """
+        if self._pool is not None:
+            raise RuntimeError("CPU executor already started")
+        self.max_workers = max_workers
+        self.max_concurrency = min(self.max_concurrency, max_workers)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def stats(self) -> CPUExecutorStats:
+        finished = (self._completed + self._failed) or 1
+        return CPUExecutorStats(
+            kind=self.kind,
+            max_workers=self.max_workers,
+            max_concurrency=self.max_concurrency,
+            queue_depth=self._waiting,
+            in_flight=self._in_flight,
+            completed=self._completed,
+            failed=self._failed,
+            avg_wait_ms=self._wait_total / (self._started or 1) * 1000,
+            avg_run_ms=self._run_total / finished * 1000,
+            max_run_ms=self._run_max * 1000,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+crypto_executor = CPUExecutor(
+    kind=settings.crypto.executor,
+    max_workers=settings.crypto.max_workers,
+    max_concurrency=settings.crypto.max_concurrency,
+)
@@ -9,6 +9,7 @@ __all__ = (
     "Resource",
     "Permission",
     "PermissionRole",
+    "SeedMigration",
     # References
     "Location",
     "Gender",
@@ -21,4 +22,5 @@ from .users import User
 from .roles import Role
 from .users_roles import UserRole
 from .rbac import Action, Resource, Permission, PermissionRole
+from .seed_migration import SeedMigration
 from .references import Location, Gender, Status
@@ -1,12 +1,14 @@
 import uuid
+from datetime import datetime
 
 from typing import TYPE_CHECKING
 
 from fastapi import Request
 from jinja2 import Template
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
 
 from src.core.models.base import Base
 
@@ -18,11 +20,26 @@ class AuthToken(Base):
     __tablename__ = "auth_tokens"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(nullable=False)
+    jti: Mapped[uuid.UUID] = mapped_column(UUID, unique=True, nullable=False)
+    token_digest: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
+        unique=True,
+        nullable=False,
+    )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"),
+        ForeignKey("users.id", ondelete="CASCADE", deferrable=True),
     )
     is_used: Mapped[bool] = mapped_column(nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        index=True,
+        nullable=False,
+    )
     user: Mapped["User"] = relationship(back_populates="tokens")
 
     # ADMIN REPRESENTATION
@@ -57,9 +57,11 @@ class Permission(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
 
     resource_id: Mapped[int] = mapped_column(
-        ForeignKey("resources.id", ondelete="CASCADE")
+        ForeignKey("resources.id", ondelete="CASCADE", deferrable=True)
+    )
+    action_id: Mapped[int] = mapped_column(
+        ForeignKey("actions.id", ondelete="CASCADE", deferrable=True)
     )
-    action_id: Mapped[int] = mapped_column(ForeignKey("actions.id", ondelete="CASCADE"))
 
     __table_args__ = (UniqueConstraint("resource_id", "action_id"),)
 
@@ -85,5 +87,7 @@ class PermissionRole(Base):
     __tablename__ = "permissions_roles"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    permission_id: Mapped[int] = mapped_column(ForeignKey("permissions.id"))
-    role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"))
+    permission_id: Mapped[int] = mapped_column(
+        ForeignKey("permissions.id", deferrable=True)
+    )
+    role_id: Mapped[int] = mapped_column(ForeignKey("roles.id", deferrable=True))
@@ -3,19 +3,33 @@ from typing import TYPE_CHECKING
 from fastapi import Request
 from jinja2 import Template
 
-from sqlalchemy import Integer, String
+from sqlalchemy import BigInteger, FetchedValue, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.core.models.base import Base
 
 
 if TYPE_CHECKING:
     from src.core.models.users import User
+
     # from src.core.models.example import Example
 
 
+# Version of a row is the id of the transaction that wrote it (64-bit,
+# never wraps). Ids are assigned at the first write, not in commit order:
+# readers only expose versions below the oldest running transaction
+# (see ``VERSION_WATERMARK``), so a late commit is never skipped.
+CURRENT_VERSION = "pg_current_xact_id()::text::bigint"
+VERSION_WATERMARK = "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+
+
 class Reference(Base):
     """
     Base class for Reference models.
+
+    Every insert and update sets ``version`` to the writing transaction id,
+    by a trigger, so raw SQL and COPY writes are versioned too (PostgreSQL 13+).
+    Rows are removed by setting ``deleted`` (tombstone), so delta sync can
+    report removals; hard deletes are invisible to clients.
     """
 
     __abstract__ = True
@@ -26,6 +40,13 @@ class Reference(Base):
         autoincrement=True,
     )
     name: Mapped[str] = mapped_column(String(50), unique=True)
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=text(CURRENT_VERSION),
+        server_onupdate=FetchedValue(),
+        index=True,
+    )
+    deleted: Mapped[bool] = mapped_column(default=False, server_default="false")
 
     # ADMIN REPRESENTATION
     async def __admin_repr__(self, request: Request):
@@ -61,3 +82,48 @@ class Status(Reference):
     # Relationships
     # Add relationships here
     # example: Mapped["Example"] = relationship(back_populates="status")
+
+
+def reference_models() -> dict[str, type[Reference]]:
+    """
+    Concrete reference models by table name, in definition order.
+    """
+    models: dict[str, type[Reference]] = {}
+    subclasses = list(Reference.__subclasses__())
+    while subclasses:
+        model = subclasses.pop(0)
+        if not model.__dict__.get("__abstract__", False):
+            models[model.__tablename__] = model
+        subclasses.extend(model.__subclasses__())
+    return models
+
+
+# Version DDL, applied by migrations: a new reference model needs a
+# migration running ``version_trigger_ddl`` for its table, startup fails
+# on tables without the trigger (see ``MISSING_VERSION_TRIGGERS``).
+VERSION_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION set_reference_version() RETURNS trigger AS $$
+BEGIN
+    NEW.version := {CURRENT_VERSION};
+    RETURN NEW;
+END $$ LANGUAGE plpgsql
+"""
+
+MISSING_VERSION_TRIGGERS = """
+SELECT name FROM unnest(CAST(:tables AS text[])) AS name
+WHERE NOT EXISTS (
+    SELECT 1 FROM pg_trigger
+    WHERE tgname = name || '_version' AND tgrelid = to_regclass(quote_ident(name))
+)
+"""
+
+
+def version_trigger_ddl(table: str) -> list[str]:
+    """
+    Statements (re)creating the version trigger of a reference table.
+    """
+    return [
+        f'DROP TRIGGER IF EXISTS {table}_version ON "{table}"',
+        f'CREATE TRIGGER {table}_version BEFORE INSERT OR UPDATE ON "{table}" '
+        "FOR EACH ROW EXECUTE FUNCTION set_reference_version()",
+    ]
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.models.base import Base
+
+
+class SeedMigration(Base):
+    """
+    Seed file applied by the loader, with the checksum of its content.
+    """
+
+    __tablename__ = "seed_migrations"
+
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checksum: Mapped[str] = mapped_column(String(64), nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
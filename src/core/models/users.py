@@ -29,7 +29,7 @@ class User(Base):
     hashed_password: Mapped[bytes] = mapped_column(nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     location_id: Mapped[int] = mapped_column(
-        ForeignKey("locations.id", ondelete="CASCADE"),
+        ForeignKey("locations.id", ondelete="CASCADE", deferrable=True),
     )
 
     # RELATIONSHIPS
@@ -10,5 +10,5 @@ class UserRole(Base):
     __tablename__ = "users_roles"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
-    role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"))
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", deferrable=True))
+    role_id: Mapped[int] = mapped_column(ForeignKey("roles.id", deferrable=True))
@@ -0,0 +1,53 @@
+import base64
+import binascii
+import json
+from enum import StrEnum, auto
+from typing import Any, List
+
+from pydantic_core import to_jsonable_python
+
+from .schemas import SortSchema
+from .exceptions import InvalidCursorException
+
+
+class CountStrategy(StrEnum):
+    """
+    How paginated queries count rows.
+    """
+
+    EXACT = auto()  # separate count(*) query
+    WINDOW = auto()  # count(*) OVER () in the page query
+    ESTIMATE = auto()  # planner estimate (pg_class.reltuples / EXPLAIN)
+    CACHED = auto()  # exact count cached with TTL
+    NONE = auto()  # no count, only `has_more`
+
+
+def sort_signature(sorting: List[SortSchema]) -> List[str]:
+    return [f"{st.field}:{st.order}" for st in sorting]
+
+
+def encode_cursor(sorting: List[SortSchema], values: List[Any]) -> str:
+    """
+    Opaque cursor: urlsafe base64 of sort signature and last row values.
+    """
+    raw = json.dumps(
+        {"k": sort_signature(sorting), "v": to_jsonable_python(values)},
+        separators=(",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sorting: List[SortSchema]) -> List[Any]:
+    """
+    :returns: JSON values of cursor sort keys.
+    :raises InvalidCursorException: malformed cursor or different sorting.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        keys, values = data["k"], data["v"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorException("Malformed cursor.")
+    if keys != sort_signature(sorting) or len(values) != len(sorting):
+        raise InvalidCursorException("Cursor does not match sorting.")
+    return values
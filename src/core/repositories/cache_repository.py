@@ -1,5 +1,325 @@
-from typing import Protocol
+import asyncio
+import pickle
+import sys
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Awaitable, Callable, Hashable, Protocol, TypeVar, TYPE_CHECKING
 
+from pydantic import BaseModel, computed_field
 
+if TYPE_CHECKING:
+    from ..cache.resp import RESPClient
+
+T = TypeVar("T")
+
+MISSING: Any = object()
+
+
+class CacheStats(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    loads: int
+    evictions: int
+    entries: int | None = None
+    memory_bytes: int | None = None
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls with the same key into one in-flight call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def start(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> asyncio.Future[T]:
+        """
+        Start ``fn`` unless a call for ``key`` is in flight, return its future.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+        return future
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        return await asyncio.shield(self.start(key, fn))
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()  # mark as retrieved for background calls
+
+
+# ==== Backends ====
+class CacheBackendProtocol(Protocol):
+    name: str
+    evictions: int
+
+    async def get(self, key: str) -> Any: ...
+
+    async def set(self, key: str, value: Any, ttl: float | None) -> None: ...
+
+    async def delete(self, key: str) -> bool: ...
+
+    async def delete_prefix(self, prefix: str) -> int: ...
+
+    def size(self) -> tuple[int | None, int | None]: ...
+
+    async def close(self) -> None: ...
+
+
+def approx_size(value: Any) -> int:
+    """
+    Serialized size: ``sys.getsizeof`` of a container does not count its items.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return sys.getsizeof(value)
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache with per-entry TTL, entries and memory caps.
+    Returns MISSING for absent or expired keys.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        sizeof: Callable[[Any], int] = approx_size,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.sizeof = sizeof
+        # key -> (value, expires_at, size)
+        self._data: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._memory = 0
+        self.evictions = 0
+
+    def get_nowait(self, key: str) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return MISSING
+        value, expires_at, _ = item
+        if expires_at is not None and expires_at <= monotonic():
+            self._pop(key)
+            self.evictions += 1
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set_nowait(self, key: str, value: Any, ttl: float | None) -> None:
+        size = self.sizeof(key) + self.sizeof(value)
+        if size > self.max_memory_bytes:
+            return
+        self._pop(key)
+        expires_at = monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at, size)
+        self._memory += size
+        while (
+            len(self._data) > self.max_entries or self._memory > self.max_memory_bytes
+        ):
+            oldest = next(iter(self._data))
+            self._pop(oldest)
+            self.evictions += 1
+
+    async def get(self, key: str) -> Any:
+        return self.get_nowait(key)
+
+    async def set(self, key: str, value: Any, ttl: float | None) -> None:
+        self.set_nowait(key, value, ttl)
+
+    async def delete(self, key: str) -> bool:
+        return self._pop(key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._data if key.startswith(prefix)]
+        for key in keys:
+            self._pop(key)
+        return len(keys)
+
+    def size(self) -> tuple[int | None, int | None]:
+        return len(self._data), self._memory
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._memory = 0
+
+    def _pop(self, key: str) -> bool:
+        item = self._data.pop(key, None)
+        if item is None:
+            return False
+        self._memory -= item[2]
+        return True
+
+
+class RedisCacheBackend:
+    """
+    Backend for any Redis-protocol server. Values are pickled.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: "RESPClient", scan_count: int = 500) -> None:
+        self.client = client
+        self.scan_count = scan_count
+        self.evictions = 0
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.execute("GET", key)
+        if raw is None:
+            return MISSING
+        return pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float | None) -> None:
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if ttl is None:
+            await self.client.execute("SET", key, raw)
+        else:
+            await self.client.execute("SET", key, raw, "PX", max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self.client.execute("DEL", key))
+
+    async def delete_prefix(self, prefix: str) -> int:
+        deleted, cursor = 0, b"0"
+        while True:
+            cursor, keys = await self.client.execute(
+                "SCAN", cursor, "MATCH", f"{prefix}*", "COUNT", self.scan_count
+            )
+            if keys:
+                deleted += await self.client.execute("DEL", *keys)
+            if cursor in (b"0", "0"):
+                return deleted
+
+    def size(self) -> tuple[int | None, int | None]:
+        return None, None
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+# ==== Repositories ====
 class CacheRepositoryProtocol(Protocol):
-    pass
+    async def get(self, key: str, default: Any = None) -> Any: ...
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+    async def delete(self, key: str) -> bool: ...
+
+    async def clear(self) -> int: ...
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+    ) -> T: ...
+
+    def namespace(self, name: str) -> "CacheRepositoryProtocol": ...
+
+    def stats(self) -> CacheStats: ...
+
+
+class CacheRepositoryImpl:
+    """
+    Namespaced view over a cache backend.
+    ``None`` is a valid cached value, misses are detected with a sentinel.
+    """
+
+    separator = ":"
+
+    def __init__(
+        self,
+        backend: CacheBackendProtocol,
+        prefix: str = "",
+        default_ttl: float | None = None,
+    ) -> None:
+        self.backend = backend
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self._flight = SingleFlight()
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+
+    def key(self, key: str) -> str:
+        return f"{self.prefix}{self.separator}{key}" if self.prefix else key
+
+    def namespace(self, name: str) -> "CacheRepositoryImpl":
+        return type(self)(
+            backend=self.backend,
+            prefix=self.key(name),
+            default_ttl=self.default_ttl,
+        )
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = await self.backend.get(self.key(key))
+        if value is MISSING:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        await self.backend.set(self.key(key), value, self._ttl(ttl))
+
+    async def delete(self, key: str) -> bool:
+        return await self.backend.delete(self.key(key))
+
+    async def clear(self) -> int:
+        return await self.backend.delete_prefix(self.key(""))
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+    ) -> T:
+        """
+        Return cached value or load it once for all concurrent callers.
+        """
+        value = await self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        async def load() -> T:
+            loaded = await loader()
+            self._loads += 1
+            await self.set(key, loaded, ttl)
+            return loaded
+
+        return await self._flight.do(key, load)
+
+    def stats(self) -> CacheStats:
+        entries, memory = self.backend.size()
+        return CacheStats(
+            backend=self.backend.name,
+            hits=self._hits,
+            misses=self._misses,
+            loads=self._loads,
+            evictions=self.backend.evictions,
+            entries=entries,
+            memory_bytes=memory,
+        )
+
+    def _ttl(self, ttl: float | None) -> float | None:
+        return self.default_ttl if ttl is None else ttl
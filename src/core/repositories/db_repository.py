@@ -1,25 +1,61 @@
+import hashlib
+import json
+import logging
 import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
 from pydantic import BaseModel
-from typing import Protocol, TypeVar, Any, List, Dict
+from typing import (
+    Protocol,
+    TypeVar,
+    Any,
+    AsyncIterator,
+    Iterator,
+    List,
+    Dict,
+    Sequence,
+)
 
-from sqlalchemy import select, insert, update, delete
-from sqlalchemy.sql import Select
-from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy import select, insert, update, delete, and_, or_, tuple_, literal, text
+from sqlalchemy import BigInteger, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.sql import ClauseElement, Executable, Select
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
 from sqlalchemy.sql.expression import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import cache_provider
+from ..database import db_provider
 from ..models.base import Base
+from ..pagination import CountStrategy, encode_cursor, decode_cursor
 from ..schemas import (
     CreateBaseModel,
     UpdateBaseModel,
     PaginationResultSchema,
+    CursorPaginationResultSchema,
     SortSchema,
 )
 from ..exceptions import (
+    InvalidCursorException,
     ModelNotFoundException,
     SortingFieldNotFoundError,
 )
 
+logger = logging.getLogger(__name__)
+
+# cursor values serialized as JSON strings (see ``encode_cursor``)
+CURSOR_PARSERS: Dict[type, Any] = {
+    uuid.UUID: uuid.UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    Decimal: Decimal,
+}
+# value bits of integer columns, an out of range cursor value fails in the database
+INTEGER_BITS: Dict[type, int] = {SmallInteger: 15, Integer: 31, BigInteger: 63}
 
 ModelType = TypeVar("ModelType", bound=Base, covariant=True)
 ReadSchemaType = TypeVar("ReadSchemaType", bound=BaseModel)
@@ -27,6 +63,22 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=CreateBaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=UpdateBaseModel)
 
 
+class Explain(Executable, ClauseElement):
+    """
+    ``EXPLAIN (FORMAT JSON)`` of a statement, parameters stay bound.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 class DBRepositoryProtocol(
     Protocol[
         ModelType,
@@ -47,14 +99,63 @@ class DBRepositoryProtocol(
 
     async def filter(self, filters: Dict[str, Any] = None) -> ReadSchemaType: ...
 
+    async def create_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]: ...
+
+    async def upsert_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        index_elements: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]: ...
+
+    async def update_many(
+        self,
+        update_objects: Sequence[UpdateSchemaType],
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]: ...
+
+    async def delete_many(
+        self,
+        ids: Sequence[uuid.UUID | int],
+        chunk_size: int | None = None,
+    ) -> int: ...
+
     async def query_all(
         self,
         limit: int,
         offset: int,
         filters: Dict[str, Any] = None,
         sorting: List[SortSchema] = None,
+        count_strategy: CountStrategy | None = None,
     ) -> PaginationResultSchema[ReadSchemaType]: ...
 
+    async def query_cursor(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaType]: ...
+
+    def stream(
+        self,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[ReadSchemaType]: ...
+
+    def iter_chunks(
+        self,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[List[ReadSchemaType]]: ...
+
     async def _filter(self, statement: Select, filters: Dict[str, Any]) -> Select: ...
 
     async def _paginate(self, statement: Select, limit: int, offset: int) -> Select: ...
@@ -72,65 +173,189 @@ class DBRepositoryImpl(
 ):
     model_type: type[ModelType]
     read_schema_type: type[ReadSchemaType]
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cache_ttl: float = 60
+    bulk_chunk_size: int = 1000
+    stream_chunk_size: int = 1000
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def get_one(self, id_: uuid.UUID | int) -> ReadSchemaType:
-        async with self.session as s:
-            statement = select(self.model_type).where(self.model_type.id == id_)
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
-                raise ModelNotFoundException(self.model_type, id_)
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+        statement = select(self.model_type).where(self.model_type.id == id_)
+        model = (await self.session.execute(statement)).scalar_one_or_none()
+        if model is None:
+            raise ModelNotFoundException(self.model_type, id_)
+        return self.read_schema_type.model_validate(model, from_attributes=True)
 
     async def get_all(self) -> List[ReadSchemaType]:
-        async with self.session as s:
-            statement = select(self.model_type)
-            models = (await s.execute(statement)).scalars().all()
-            return [
-                self.read_schema_type.model_validate(model, from_attributes=True)
-                for model in models
-            ]
+        statement = select(self.model_type)
+        models = (await self.session.execute(statement)).scalars().all()
+        return [
+            self.read_schema_type.model_validate(model, from_attributes=True)
+            for model in models
+        ]
 
     async def create(self, create_object: CreateSchemaType) -> ReadSchemaType:
-        async with self.session as s, s.begin():
-            statement = (
-                insert(self.model_type)
-                .values(**create_object.model_dump(exclude={"id"}))
-                .returning(self.model_type)
-            )
-            model = (await s.execute(statement)).scalar_one()
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+        statement = (
+            insert(self.model_type)
+            .values(**create_object.model_dump(exclude={"id"}))
+            .returning(self.model_type)
+        )
+        model = (await self.session.execute(statement)).scalar_one()
+        return self.read_schema_type.model_validate(model, from_attributes=True)
 
     async def update(self, update_object: UpdateSchemaType) -> ReadSchemaType:
-        async with self.session as s, s.begin():
-            pk = update_object.id
-            statement = (
-                update(self.model_type)
-                .where(self.model_type.id == pk)
-                .values(update_object.model_dump(exclude={"id"}, exclude_unset=True))
-                .returning(self.model_type)
-            )
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
-                raise ModelNotFoundException(self.model_type, update_object.id)
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+        pk = update_object.id
+        statement = (
+            update(self.model_type)
+            .where(self.model_type.id == pk)
+            .values(update_object.model_dump(exclude={"id"}, exclude_unset=True))
+            .returning(self.model_type)
+        )
+        model = (await self.session.execute(statement)).scalar_one_or_none()
+        if model is None:
+            raise ModelNotFoundException(self.model_type, update_object.id)
+        return self.read_schema_type.model_validate(model, from_attributes=True)
 
     async def delete(self, id_: uuid.UUID | int) -> bool:
-        async with self.session as s, s.begin():
-            statement = delete(self.model_type).where(self.model_type.id == id_)
-            await s.execute(statement)
-            return True
+        statement = delete(self.model_type).where(self.model_type.id == id_)
+        await self.session.execute(statement)
+        return True
 
     async def filter(self, filters: Dict[str, Any] = None) -> ReadSchemaType:
-        async with self.session as s:
-            statement = select(self.model_type)
-            statement = await self._filter(statement, filters)
-            model = (await s.execute(statement)).scalar_one_or_none()
-            if model is None:
+        statement = select(self.model_type)
+        statement = await self._filter(statement, filters)
+        model = (await self.session.execute(statement)).scalar_one_or_none()
+        if model is None:
+            raise ModelNotFoundException(self.model_type)
+        return self.read_schema_type.model_validate(model, from_attributes=True)
+
+    async def create_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]:
+        """
+        Insert rows in chunks, one batched INSERT ... RETURNING per chunk.
+        Result keeps the order of ``create_objects``.
+        """
+        statement = insert(self.model_type).returning(
+            self.model_type, sort_by_parameter_order=True
+        )
+        objects = []
+        for chunk in self._chunks(create_objects, chunk_size):
+            values = [obj.model_dump(exclude={"id"}) for obj in chunk]
+            models = (await self.session.scalars(statement, values)).all()
+            objects.extend(self._validate_many(models))
+        return objects
+
+    async def upsert_many(
+        self,
+        create_objects: Sequence[CreateSchemaType],
+        index_elements: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]:
+        """
+        INSERT ... ON CONFLICT (index_elements) DO UPDATE in chunks.
+        ``update_fields`` defaults to every inserted field except the conflict
+        target, empty ``update_fields`` means DO NOTHING (skipped rows are not
+        returned). A chunk must not contain the same conflict key twice.
+        Result keeps the order of ``create_objects``.
+        """
+        objects = []
+        for chunk in self._chunks(create_objects, chunk_size):
+            values = [obj.model_dump(exclude={"id"}) for obj in chunk]
+            statement = pg_insert(self.model_type)
+            if update_fields is None:
+                fields = [f for f in values[0] if f not in index_elements]
+            else:
+                fields = list(update_fields)
+            if fields:
+                statement = statement.on_conflict_do_update(
+                    index_elements=index_elements,
+                    set_={field: statement.excluded[field] for field in fields},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(
+                    index_elements=index_elements
+                )
+            # skipped rows return nothing: RETURNING rows are matched to the
+            # input by conflict key, not by position (sort_by_parameter_order)
+            statement = statement.returning(self.model_type).execution_options(
+                populate_existing=True
+            )
+            models = {
+                tuple(getattr(model, key) for key in index_elements): model
+                for model in (await self.session.scalars(statement, values)).all()
+            }
+            keys = [tuple(row[key] for key in index_elements) for row in values]
+            objects.extend(
+                self._validate_many(models[key] for key in keys if key in models)
+            )
+        return objects
+
+    async def update_many(
+        self,
+        update_objects: Sequence[UpdateSchemaType],
+        chunk_size: int | None = None,
+    ) -> List[ReadSchemaType]:
+        """
+        Bulk UPDATE by primary key (executemany), then one SELECT per chunk
+        to return fresh rows in the order of ``update_objects``.
+        """
+        objects = []
+        for chunk in self._chunks(update_objects, chunk_size):
+            ids = [obj.id for obj in chunk]
+            values = [
+                obj.model_dump(exclude_unset=True) | {"id": obj.id} for obj in chunk
+            ]
+            try:
+                await self.session.execute(update(self.model_type), values)
+            except StaleDataError:
                 raise ModelNotFoundException(self.model_type)
-            return self.read_schema_type.model_validate(model, from_attributes=True)
+            statement = (
+                select(self.model_type)
+                .where(self.model_type.id.in_(ids))
+                .execution_options(populate_existing=True)
+            )
+            models = {
+                model.id: model
+                for model in (await self.session.scalars(statement)).all()
+            }
+            for id_ in ids:
+                if id_ not in models:
+                    raise ModelNotFoundException(self.model_type, id_)
+            objects.extend(self._validate_many(models[id_] for id_ in ids))
+        return objects
+
+    async def delete_many(
+        self,
+        ids: Sequence[uuid.UUID | int],
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Delete rows by primary key, returns the number of deleted rows.
+        """
+        deleted = 0
+        for chunk in self._chunks(ids, chunk_size):
+            statement = delete(self.model_type).where(self.model_type.id.in_(chunk))
+            deleted += (await self.session.execute(statement)).rowcount
+        return deleted
+
+    def _chunks(
+        self, items: Sequence[Any], chunk_size: int | None
+    ) -> Iterator[Sequence[Any]]:
+        size = chunk_size or self.bulk_chunk_size
+        for start in range(0, len(items), size):
+            yield items[start : start + size]
+
+    def _validate_many(self, models: Any) -> List[ReadSchemaType]:
+        return [
+            self.read_schema_type.model_validate(model, from_attributes=True)
+            for model in models
+        ]
 
     async def query_all(
         self,
@@ -138,25 +363,186 @@ class DBRepositoryImpl(
         offset: int,
         filters: Dict[str, Any] = None,
         sorting: List[SortSchema] = None,
+        count_strategy: CountStrategy | None = None,
     ) -> PaginationResultSchema[ReadSchemaType]:
-        async with self.session as s:
-            statement = select(self.model_type)
-
-            statement = await self._filter(statement, filters)
-
-            count_statement = select(func.count()).select_from(statement.subquery())
-            count = (await s.execute(count_statement)).scalar_one()
-
-            statement = await self._sort(statement, sorting)
-            statement = await self._paginate(statement, limit, offset)
-
-            models = (await s.execute(statement)).scalars().all()
-            objects = [
-                self.read_schema_type.model_validate(model, from_attributes=True)
-                for model in models
-            ]
+        """
+        Offset pagination, see `CountStrategy` for the count options.
+        Repository default is `count_strategy` class attribute.
+        """
+        strategy = count_strategy or self.count_strategy
+        statement = select(self.model_type)
+
+        statement = await self._filter(statement, filters)
+        filtered = statement
+
+        count, has_more = None, None
+        if strategy == CountStrategy.WINDOW:
+            statement = statement.add_columns(func.count().over().label("total"))
+        elif strategy == CountStrategy.NONE:
+            limit += 1
+        else:
+            count = await self._count(filtered, strategy, bool(filters))
+
+        statement = await self._sort(statement, sorting)
+        statement = await self._paginate(statement, limit, offset)
+
+        if strategy == CountStrategy.WINDOW:
+            rows = (await self.session.execute(statement)).all()
+            models = [row[0] for row in rows]
+            if rows:
+                count = rows[0].total
+            elif offset:  # page beyond the end, total is unknown
+                count = await self._exact_count(filtered)
+            else:
+                count = 0
+        else:
+            models = (await self.session.execute(statement)).scalars().all()
+        if strategy == CountStrategy.NONE:
+            limit -= 1
+            has_more = len(models) > limit
+            models = models[:limit]
+        elif count is not None:
+            has_more = offset + len(models) < count
+
+        objects = [
+            self.read_schema_type.model_validate(model, from_attributes=True)
+            for model in models
+        ]
+
+        return PaginationResultSchema(count=count, has_more=has_more, objects=objects)
+
+    async def query_cursor(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+    ) -> CursorPaginationResultSchema[ReadSchemaType]:
+        """
+        Keyset pagination: rows after the cursor in (sorting..., id) order.
+        Page cost does not depend on its depth.
+        Sort fields must be non-nullable.
+        """
+        sorting = self._keyset_sorting(sorting)
+        statement = select(self.model_type)
+        statement = await self._filter(statement, filters)
+        statement = await self._sort(statement, sorting)
+        if cursor is not None:
+            values = decode_cursor(cursor, sorting)
+            statement = statement.where(self._keyset_where(sorting, values))
+        statement = statement.limit(limit + 1)
+
+        models = (await self.session.execute(statement)).scalars().all()
+        next_cursor = None
+        if len(models) > limit:
+            models = models[:limit]
+            last = models[-1]
+            next_cursor = encode_cursor(
+                sorting, [getattr(last, st.field) for st in sorting]
+            )
+        objects = [
+            self.read_schema_type.model_validate(model, from_attributes=True)
+            for model in models
+        ]
+        return CursorPaginationResultSchema(objects=objects, next_cursor=next_cursor)
 
-            return PaginationResultSchema(count=count, objects=objects)
+    async def stream(
+        self,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[ReadSchemaType]:
+        """
+        Iterate over all matching rows, see `iter_chunks`.
+        """
+        async for chunk in self.iter_chunks(filters, sorting, chunk_size):
+            for obj in chunk:
+                yield obj
+
+    async def iter_chunks(
+        self,
+        filters: Dict[str, Any] = None,
+        sorting: List[SortSchema] = None,
+        chunk_size: int | None = None,
+    ) -> AsyncIterator[List[ReadSchemaType]]:
+        """
+        Read matching rows through a server-side cursor, ``chunk_size`` rows
+        at a time, so memory does not grow with the result size.
+        Must run inside a transaction, which the session provides.
+        """
+        size = chunk_size or self.stream_chunk_size
+        statement = select(self.model_type)
+        statement = await self._filter(statement, filters)
+        statement = await self._sort(statement, sorting)
+        statement = statement.execution_options(yield_per=size)
+
+        result = await self.session.stream(statement)
+        try:
+            async for models in result.scalars().partitions():
+                yield self._validate_many(models)
+        finally:
+            await result.close()
+
+    async def _count(
+        self,
+        statement: Select,
+        strategy: CountStrategy,
+        filtered: bool,
+    ) -> int:
+        if strategy == CountStrategy.ESTIMATE:
+            return await self._estimate_count(statement, filtered)
+        if strategy == CountStrategy.CACHED:
+            return await self._cached_count(statement)
+        return await self._exact_count(statement)
+
+    async def _exact_count(self, statement: Select) -> int:
+        count_statement = select(func.count()).select_from(statement.subquery())
+        return (await self.session.execute(count_statement)).scalar_one()
+
+    async def _cached_count(self, statement: Select) -> int:
+        cache = cache_provider.repository("counts")
+        compiled = statement.compile(compile_kwargs={"render_postcompile": True})
+        key = hashlib.sha256(
+            f"{compiled}|{sorted(compiled.params.items())!r}".encode()
+        ).hexdigest()
+        count_statement = select(func.count()).select_from(statement.subquery())
+
+        async def load() -> int:
+            # own unit of work: concurrent callers of other requests await
+            # this load, it must not depend on the first caller's session
+            async with db_provider.transaction() as session:
+                return (await session.execute(count_statement)).scalar_one()
+
+        return await cache.get_or_load(
+            f"{self.model_type.__tablename__}:{key}",
+            load,
+            ttl=self.count_cache_ttl,
+        )
+
+    async def _estimate_count(self, statement: Select, filtered: bool) -> int:
+        """
+        Planner estimate: table statistics for the whole table,
+        EXPLAIN row estimate for filtered queries.
+        Falls back to exact count when no estimate is available.
+        """
+        connection = await self.session.connection()
+        if not filtered:
+            estimate = (
+                await connection.execute(
+                    text(
+                        "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"
+                    ),
+                    {"t": self.model_type.__tablename__},
+                )
+            ).scalar_one_or_none()
+            if estimate is not None and estimate >= 0:  # -1: never analyzed
+                return estimate
+            return await self._exact_count(statement)
+
+        plan = (await connection.execute(Explain(statement))).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
 
     async def _filter(self, statement: Select, filters: Dict[str, Any]) -> Select:
         if filters:
@@ -189,3 +575,68 @@ class DBRepositoryImpl(
             except AttributeError as attribute_error:
                 raise SortingFieldNotFoundError(st.field) from attribute_error
         return order_by_expr
+
+    def _keyset_sorting(self, sorting: List[SortSchema] | None) -> List[SortSchema]:
+        """
+        Sorting with primary key as the last tie-breaker.
+        """
+        sorting = list(sorting or [])
+        if not any(st.field == "id" for st in sorting):
+            order = sorting[-1].order if sorting else "asc"
+            sorting.append(SortSchema(field="id", order=order))
+        return sorting
+
+    def _keyset_where(
+        self,
+        sorting: List[SortSchema],
+        values: List[Any],
+    ) -> ColumnElement[bool]:
+        columns = [getattr(self.model_type, st.field) for st in sorting]
+        try:
+            values = [
+                literal(self._cursor_value(c, v), c.type)
+                for c, v in zip(columns, values)
+            ]
+        except (TypeError, ValueError, ArithmeticError) as value_error:
+            raise InvalidCursorException("Malformed cursor.") from value_error
+
+        orders = {st.order for st in sorting}
+        if len(orders) == 1:  # row comparison, can use composite index
+            if orders == {"desc"}:
+                return tuple_(*columns) < tuple_(*values)
+            return tuple_(*columns) > tuple_(*values)
+
+        clauses = []
+        for i, (st, column, value) in enumerate(zip(sorting, columns, values)):
+            equal = [columns[j] == values[j] for j in range(i)]
+            after = column < value if st.order == "desc" else column > value
+            clauses.append(and_(*equal, after))
+        return or_(*clauses)
+
+    @staticmethod
+    def _cursor_value(column: Any, value: Any) -> Any:
+        """
+        Restore python value of cursor JSON value by column type.
+        :raises TypeError, ValueError: value does not fit the column.
+        """
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            raise TypeError(f"{column} can not be a cursor key")
+        parser = CURSOR_PARSERS.get(python_type)
+        if parser is not None:
+            if not isinstance(value, str):
+                raise TypeError(f"{column} cursor value must be a string")
+            return parser(value)
+        if issubclass(python_type, Enum):
+            return python_type(value)
+        if python_type is float and type(value) is int:
+            value = float(value)
+        # bool is an int subclass, an exact type match rejects it for int keys
+        if type(value) is not python_type:
+            raise TypeError(f"{column} cursor value must be {python_type.__name__}")
+        if python_type is int:
+            bits = INTEGER_BITS.get(type(column.type), 31)
+            if not -(2**bits) <= value < 2**bits:
+                raise ValueError(f"{column} cursor value out of range")
+        return value
@@ -0,0 +1,118 @@
+import asyncio
+import dataclasses
+from typing import Any, Callable, Coroutine, Mapping
+
+from fastapi import Request, Response
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute, run_endpoint_function
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+
+
+class PydanticJSONResponse(Response):
+    """
+    JSON response rendered by pydantic-core straight to bytes.
+    Models are dumped with their serialization aliases (camelCase for
+    ``ResponseSchema``), other content goes through ``pydantic_core.to_json``.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> None:
+        self.dump_options = {
+            "by_alias": by_alias,
+            "exclude_unset": exclude_unset,
+            "exclude_defaults": exclude_defaults,
+            "exclude_none": exclude_none,
+        }
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, **self.dump_options)
+        # exclude_unset/exclude_defaults only apply to models
+        return to_json(
+            content,
+            by_alias=self.dump_options["by_alias"],
+            exclude_none=self.dump_options["exclude_none"],
+        )
+
+
+def _uses_response(dependant: Dependant) -> bool:
+    return dependant.response_param_name is not None or any(
+        map(_uses_response, dependant.dependencies)
+    )
+
+
+class JSONRoute(APIRoute):
+    """
+    Route that returns ``response_model`` instances without FastAPI's
+    ``jsonable_encoder`` pass and re-validation: the returned model is already
+    validated, it is rendered once by ``PydanticJSONResponse``.
+
+    Status code, headers and cookies set on the endpoint ``Response`` param
+    are kept. Other return values (dicts, other models, ``Response``), routes
+    with ``response_model_include``/``exclude`` and routes whose dependencies
+    take a ``Response`` param take the regular FastAPI path.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        model = self.response_model
+        if (
+            isinstance(model, type)
+            and issubclass(model, BaseModel)
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and not any(map(_uses_response, self.dependant.dependencies))
+        ):
+            self.dependant = dataclasses.replace(
+                self.dependant,
+                call=self._fast_json_call(self.dependant, model),
+            )
+        return super().get_route_handler()
+
+    def _fast_json_call(
+        self,
+        dependant: Dependant,
+        model: type[BaseModel],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        is_coroutine = asyncio.iscoroutinefunction(dependant.call)
+        response_param = dependant.response_param_name
+
+        async def call(**values: Any) -> Any:
+            result = await run_endpoint_function(
+                dependant=dependant,
+                values=values,
+                is_coroutine=is_coroutine,
+            )
+            if type(result) is not model:
+                return result
+            sub_response: Response | None = values.get(response_param)
+            status_code = self.status_code or 200
+            if sub_response is not None and sub_response.status_code:
+                status_code = sub_response.status_code
+            response = PydanticJSONResponse(
+                result,
+                status_code=status_code,
+                by_alias=self.response_model_by_alias,
+                exclude_unset=self.response_model_exclude_unset,
+                exclude_defaults=self.response_model_exclude_defaults,
+                exclude_none=self.response_model_exclude_none,
+            )
+            if sub_response is not None:
+                response.headers.raw.extend(sub_response.headers.raw)
+            return response
+
+        return call
@@ -57,6 +57,7 @@ class SortSchema(BaseModel):
 class QuerySchema(BaseModel):
     limit: int = Field(default=10, gt=0, le=50)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None
     sort: Optional[List[SortSchema]] = None
     filters: Optional[Dict[str, Any]] = None
 
@@ -66,4 +67,10 @@ TRead = TypeVar("TRead")
 
 class PaginationResultSchema(BaseModel, Generic[TRead]):
     objects: list[TRead]
-    count: int
+    count: int | None = None
+    has_more: bool | None = None
+
+
+class CursorPaginationResultSchema(BaseModel, Generic[TRead]):
+    objects: list[TRead]
+    next_cursor: str | None = None
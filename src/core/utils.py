@@ -33,6 +33,10 @@ def get_query_params(allowed_sort_fields: Optional[Set[str]] = None) -> Callable
     def dependency(
         limit: int = Query(10, gt=0, le=50),
         offset: int = Query(0, ge=0),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor of the next page, replaces offset.",
+        ),
         sort: Optional[List[str]] = Query(
             None,
             description=f"Allowed fields: {allowed_sort_fields}",
@@ -42,6 +46,11 @@ def get_query_params(allowed_sort_fields: Optional[Set[str]] = None) -> Callable
             sort=sort,
             allowed_fields=allowed_sort_fields,
         )
-        return QuerySchema(limit=limit, offset=offset, sort=parsed_sort)
+        return QuerySchema(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort=parsed_sort,
+        )
 
     return dependency
@@ -0,0 +1,138 @@
+"""
+Auth tokens by jti/digest, reference versions and tombstones, seed checksums.
+
+Tokens of the old format (plain ``token`` column) cannot be converted, the
+table is recreated and users log in again. Databases where ``create_all``
+already added the new tables or columns are upgraded in place: every step
+is skipped when its result exists.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.core.models.references import (
+    CURRENT_VERSION,
+    VERSION_FUNCTION,
+    version_trigger_ddl,
+)
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# reference tables of this revision, later ones get their own migration
+REFERENCE_TABLES = ("locations", "genders", "statuses")
+
+
+def has_plain_tokens() -> bool:
+    """
+    ``auth_tokens`` of the baseline, always assumed by the SQL script (offline).
+    """
+    if op.get_context().as_sql:
+        return True
+    columns = sa.inspect(op.get_bind()).get_columns("auth_tokens")
+    return any(column["name"] == "token" for column in columns)
+
+
+def create_auth_tokens() -> None:
+    op.create_table(
+        "auth_tokens",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("jti", sa.UUID(), nullable=False),
+        sa.Column("token_digest", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("is_used", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_auth_tokens_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_auth_tokens")),
+        sa.UniqueConstraint("jti", name=op.f("uq_auth_tokens_jti")),
+        sa.UniqueConstraint("token_digest", name=op.f("uq_auth_tokens_token_digest")),
+    )
+    op.create_index(op.f("ix_auth_tokens_expires_at"), "auth_tokens", ["expires_at"])
+
+
+def upgrade() -> None:
+    if has_plain_tokens():
+        op.drop_table("auth_tokens")
+        create_auth_tokens()
+
+    op.execute(VERSION_FUNCTION)
+    for table in REFERENCE_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "version",
+                sa.BigInteger(),
+                server_default=sa.text(CURRENT_VERSION),
+                nullable=False,
+            ),
+            if_not_exists=True,
+        )
+        op.add_column(
+            table,
+            sa.Column("deleted", sa.Boolean(), server_default="false", nullable=False),
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f(f"ix_{table}_version"), table, ["version"], if_not_exists=True
+        )
+        for statement in version_trigger_ddl(table):
+            op.execute(statement)
+
+    op.create_table(
+        "seed_migrations",
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("checksum", sa.String(length=64), nullable=False),
+        sa.Column(
+            "applied_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_seed_migrations")),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("seed_migrations")
+    for table in REFERENCE_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_version ON "{table}"')
+        op.drop_index(op.f(f"ix_{table}_version"), table_name=table)
+        op.drop_column(table, "deleted")
+        op.drop_column(table, "version")
+    op.execute("DROP FUNCTION IF EXISTS set_reference_version()")
+
+    op.drop_table("auth_tokens")
+    op.create_table(
+        "auth_tokens",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("token", sa.String(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("is_used", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_auth_tokens_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_auth_tokens")),
+    )
@@ -0,0 +1,43 @@
+"""
+Deferrable foreign keys, checked at commit after SET CONSTRAINTS ALL DEFERRED.
+
+Still checked per statement by default (INITIALLY IMMEDIATE). The bulk
+loader defers them, so a batch may be written before its parent rows.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FOREIGN_KEYS = (
+    ("users", "fk_users_location_id_locations"),
+    ("permissions", "fk_permissions_resource_id_resources"),
+    ("permissions", "fk_permissions_action_id_actions"),
+    ("permissions_roles", "fk_permissions_roles_permission_id_permissions"),
+    ("permissions_roles", "fk_permissions_roles_role_id_roles"),
+    ("users_roles", "fk_users_roles_user_id_users"),
+    ("users_roles", "fk_users_roles_role_id_roles"),
+    ("auth_tokens", "fk_auth_tokens_user_id_users"),
+)
+
+
+def upgrade() -> None:
+    for table, name in FOREIGN_KEYS:
+        op.execute(
+            f'ALTER TABLE "{table}" ALTER CONSTRAINT {name} '
+            "DEFERRABLE INITIALLY IMMEDIATE"
+        )
+
+
+def downgrade() -> None:
+    for table, name in FOREIGN_KEYS:
+        op.execute(f'ALTER TABLE "{table}" ALTER CONSTRAINT {name} NOT DEFERRABLE')
@@ -3,6 +3,8 @@ from src.apps.healthcheck.router import router as healthcheck_router
 from src.apps.auth.router import router as auth_router
 from src.apps.users.router import router as users_router
 from src.apps.references.router import router as references_router
+from src.apps.exports.router import router as exports_router
+from src.apps.auth.tools.routes import resolve_route_permissions
 from src.settings import settings
 
 
@@ -14,6 +16,9 @@ def apply_routes(app: FastAPI) -> FastAPI:
     router.include_router(auth_router)
     router.include_router(users_router)
     router.include_router(references_router)
+    router.include_router(exports_router)
     # Include main router
     app.include_router(router)
+    # Resolve RBAC permissions of protected routes
+    resolve_route_permissions(app.routes)
     return app
@@ -0,0 +1,228 @@
+"""
+Production runner: a pre-forking supervisor around uvicorn.
+
+The parent builds the app, applies seed data, loads JWT keys, app-scoped
+services and the compiled ACL once, binds the socket and forks the workers,
+which inherit all of it. The database connection budget
+(``DB__MAX_CONNECTIONS``) is split between workers, so the whole server
+never opens more connections than configured. SIGTERM/SIGINT are forwarded
+to the workers, which finish in-flight requests before exiting; workers
+that die are restarted. Cache invalidations of one worker are relayed to
+all of them (SIGUSR1), so process-local caches never outlive a change.
+
+Usage:
+    python -m src.server --workers 4
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.bootstrap import create_app, preload
+from src.core.cache import invalidation
+from src.core.cache.invalidation import INVALIDATE_SIGNAL
+from src.core.database import db_provider
+from src.core.executors import crypto_executor
+from src.settings import settings
+
+logger = logging.getLogger("src.server")
+
+POLL_INTERVAL_SECONDS = 0.2
+# Workers dying faster than this are restarted with a delay
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+KILL_GRACE_SECONDS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class PoolLimits:
+    pool_size: int
+    max_overflow: int
+
+
+def default_workers() -> int:
+    return os.process_cpu_count() or 1
+
+
+def pool_limits(workers: int) -> PoolLimits:
+    """
+    Per-worker pool, ``max_connections`` split evenly between workers with
+    the configured pool_size/max_overflow ratio. Without a budget every
+    worker keeps the configured pool.
+    """
+    if settings.db.max_connections is None:
+        return PoolLimits(settings.db.pool_size, settings.db.max_overflow)
+    per_worker = settings.db.max_connections // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"{settings.db.max_connections} connections for {workers} workers"
+        )
+    configured = settings.db.pool_size + settings.db.max_overflow
+    pool_size = max(per_worker * settings.db.pool_size // configured, 1)
+    return PoolLimits(pool_size=pool_size, max_overflow=per_worker - pool_size)
+
+
+def configure_worker(workers: int, limits: PoolLimits) -> None:
+    """
+    Runs in the forked worker before the event loop starts.
+    """
+    db_provider.configure(
+        pool_size=limits.pool_size,
+        max_overflow=limits.max_overflow,
+    )
+    invalidation.parent_pid = os.getppid()
+    if settings.crypto.max_workers is None:
+        # share the cores between workers instead of one pool per core each
+        crypto_executor.resize(
+            max(min(crypto_executor.max_workers, default_workers() // workers), 1)
+        )
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket, workers: int) -> None:
+    # own process group: a terminal ^C reaches the parent only, which
+    # forwards it once (a second signal makes uvicorn exit immediately)
+    os.setpgid(0, 0)
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+        signal.signal(signum, signal.SIG_DFL)
+    configure_worker(workers, pool_limits(workers))
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Supervisor:
+    def __init__(self, config: uvicorn.Config, workers: int) -> None:
+        self.config = config
+        self.workers = workers
+        self.children: dict[int, float] = {}  # pid -> start time
+        self.stopping = False
+
+    def spawn(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # until the app listens, a relayed invalidation must not kill it
+            signal.signal(INVALIDATE_SIGNAL, signal.SIG_IGN)
+            code = 0
+            try:
+                run_worker(self.config, sock, self.workers)
+            except BaseException:
+                logger.exception("Worker %s failed", os.getpid())
+                code = 1
+            finally:
+                logging.shutdown()
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+        logger.info("Worker %s started", pid)
+
+    def stop(self, signum: int, frame) -> None:
+        if self.stopping:
+            return
+        logger.info("%s received, stopping workers", signal.Signals(signum).name)
+        self.stopping = True
+        self.signal_children(signal.SIGTERM)
+
+    def relay_invalidation(self, signum: int, frame) -> None:
+        self.signal_children(INVALIDATE_SIGNAL)
+
+    def signal_children(self, signum: int) -> None:
+        for pid in self.children:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def reap(self) -> list[float]:
+        """
+        Collect exited workers, returns their lifetimes.
+        """
+        lifetimes = []
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            started = self.children.pop(pid, None)
+            if started is None:
+                continue
+            lifetimes.append(time.monotonic() - started)
+            code = os.waitstatus_to_exitcode(status)
+            if code != 0 and not self.stopping:
+                logger.warning("Worker %s exited with %s", pid, code)
+        return lifetimes
+
+    def run(self, sock: socket.socket) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(INVALIDATE_SIGNAL, self.relay_invalidation)
+        for _ in range(self.workers):
+            self.spawn(sock)
+
+        while not self.stopping:
+            lifetimes = self.reap()
+            if any(t < MIN_WORKER_LIFETIME_SECONDS for t in lifetimes):
+                time.sleep(MIN_WORKER_LIFETIME_SECONDS)
+            while not self.stopping and len(self.children) < self.workers:
+                self.spawn(sock)
+            time.sleep(POLL_INTERVAL_SECONDS)
+
+        deadline = time.monotonic() + (
+            settings.run.graceful_shutdown_seconds + KILL_GRACE_SECONDS
+        )
+        while self.children and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(POLL_INTERVAL_SECONDS)
+        if self.children:
+            logger.warning("Killing workers %s", list(self.children))
+            self.signal_children(signal.SIGKILL)
+            while self.children:
+                self.reap()
+                time.sleep(POLL_INTERVAL_SECONDS)
+        logger.info("Server stopped")
+
+
+def serve(app: FastAPI, host: str, port: int, workers: int) -> None:
+    limits = pool_limits(workers)
+    logger.info(
+        "Starting %s workers on %s:%s, db pool %s+%s per worker",
+        workers,
+        host,
+        port,
+        limits.pool_size,
+        limits.max_overflow,
+    )
+    asyncio.run(preload(app))
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        lifespan="on",
+        timeout_graceful_shutdown=settings.run.graceful_shutdown_seconds,
+    )
+    sock = config.bind_socket()
+    try:
+        Supervisor(config, workers).run(sock)
+    finally:
+        sock.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the production server.")
+    parser.add_argument("--host", default=settings.run.host)
+    parser.add_argument("--port", type=int, default=settings.run.port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.run.workers or default_workers(),
+        help="Worker processes (default: one per CPU core)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    serve(create_app(), args.host, args.port, max(args.workers, 1))
+
+
+if __name__ == "__main__":
+    main()
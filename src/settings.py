@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic import PostgresDsn
@@ -19,6 +20,8 @@ class AdminConfig(BaseModel):
 class RunConfig(BaseModel):
     host: str = "127.0.0.1"
     port: int = 8000
+    workers: int | None = None  # production runner, default: one per CPU core
+    graceful_shutdown_seconds: int = 30
 
 
 class ApiPrefix(BaseModel):
@@ -26,11 +29,45 @@ class ApiPrefix(BaseModel):
 
 
 class AuthJWTConfig(BaseModel):
+    keys_dir: Path = CERTS_DIR
+    key_reload_interval_seconds: float = 60
+    key_miss_reload_interval_seconds: float = 1  # min pause of reloads on unknown kid
     private_key_path: Path = CERTS_DIR / "jwt-private.pem"
     public_key_path: Path = CERTS_DIR / "jwt-public.pem"
-    algorithm: str = "RS256"
+    algorithm: str = "RS256"  # RSA keys only, EC/Ed25519 keys imply ES*/EdDSA
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    claims_cache_max_ttl_seconds: float = 30 * 60
+    purge_interval_seconds: float = 60 * 60
+    purge_batch_size: int = 500
+    purge_pause_seconds: float = 0.1
+
+
+class RBACConfig(BaseModel):
+    acl_ttl_seconds: float = 60
+    acl_stale_ttl_seconds: float = 300
+    admin_role: str = "admin"  # receives DEFAULT_GRANTS on startup
+
+
+class CryptoConfig(BaseModel):
+    executor: Literal["thread", "process"] = "thread"
+    max_workers: int | None = None
+    max_concurrency: int = 4
+
+
+class CacheConfig(BaseModel):
+    backend: Literal["memory", "redis"] = "memory"
+    url: str | None = None
+    key_prefix: str = "app"
+    default_ttl_seconds: float | None = 300
+    max_entries: int = 10_000
+    max_memory_mb: int = 64
+    pool_size: int = 10
+
+
+class ReferencesConfig(BaseModel):
+    cache_ttl_seconds: float | None = 60 * 60
+    max_age_seconds: int = 60  # Cache-Control max-age for clients
 
 
 class DatabaseConfig(BaseModel):
@@ -39,6 +76,8 @@ class DatabaseConfig(BaseModel):
     echo_pool: bool = False
     max_overflow: int = 10
     pool_size: int = 50
+    # connections of all workers together, split between them by the runner
+    max_connections: int | None = None
 
 
 class Settings(BaseSettings):
@@ -56,6 +95,10 @@ class Settings(BaseSettings):
     run: RunConfig = RunConfig()
     api: ApiPrefix = ApiPrefix()
     auth_jwt: AuthJWTConfig = AuthJWTConfig()
+    crypto: CryptoConfig = CryptoConfig()
+    rbac: RBACConfig = RBACConfig()
+    cache: CacheConfig = CacheConfig()
+    references: ReferencesConfig = ReferencesConfig()
     db: DatabaseConfig
 
 
@@ -0,0 +1,145 @@
+"""
+Compare per-request dependency resolution: FastAPI factory graph vs container.
+
+The "factories" app rebuilds repositories, services and use cases with one
+``Depends`` factory per object (the previous ``depends`` modules), the
+"container" app uses the project container, where stateless services are
+app-scoped and the request graph is a single dependency. No database is
+touched, the session dependency is replaced by a stub.
+
+Usage:
+    python -m src.tools.benchmarks.dependencies --requests 5000
+"""
+
+import argparse
+import asyncio
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, FastAPI
+
+from src.core.database import db_provider, SessionDep
+from src.apps.auth.depends import LoginUseCase
+from src.apps.auth.repositories.auth_tokens import AuthTokensRepositoryImpl
+from src.apps.auth.services.jwt_service import JWTServiceImpl
+from src.apps.auth.services.security import SecurityServiceImpl
+from src.apps.auth.use_cases.login import LoginUseCaseImpl
+from src.apps.users.depends import UserInfoUseCase
+from src.apps.users.repositories.users import UsersRepositoryImpl
+from src.apps.users.services.users import UsersServiceImpl
+from src.apps.users.use_cases.user_info import UserInfoUseCaseImpl
+from .json_responses import measure
+
+
+# ==== Factory graph, one object per dependency per request ====
+def users_repository(session: SessionDep) -> UsersRepositoryImpl:
+    return UsersRepositoryImpl(session=session)
+
+
+def users_service(
+    repository: Annotated[UsersRepositoryImpl, Depends(users_repository)],
+) -> UsersServiceImpl:
+    return UsersServiceImpl(repository=repository)
+
+
+def security_service() -> SecurityServiceImpl:
+    return SecurityServiceImpl()
+
+
+def jwt_repository(session: SessionDep) -> AuthTokensRepositoryImpl:
+    return AuthTokensRepositoryImpl(session=session)
+
+
+def jwt_service(
+    repository: Annotated[AuthTokensRepositoryImpl, Depends(jwt_repository)],
+) -> JWTServiceImpl:
+    return JWTServiceImpl(repository=repository)
+
+
+def login_use_case(
+    users: Annotated[UsersServiceImpl, Depends(users_service)],
+    security: Annotated[SecurityServiceImpl, Depends(security_service)],
+    jwt: Annotated[JWTServiceImpl, Depends(jwt_service)],
+    session: SessionDep,
+) -> LoginUseCaseImpl:
+    return LoginUseCaseImpl(
+        users_service=users,
+        security_service=security,
+        jwt_service=jwt,
+        session=session,
+    )
+
+
+def user_info_use_case(
+    users: Annotated[UsersServiceImpl, Depends(users_service)],
+) -> UserInfoUseCaseImpl:
+    return UserInfoUseCaseImpl(users_service=users)
+
+
+async def stub_session():
+    yield None
+
+
+def factories_app() -> FastAPI:
+    router = APIRouter()
+
+    @router.post("/login")
+    async def login(
+        use_case: Annotated[LoginUseCaseImpl, Depends(login_use_case)],
+    ) -> dict:
+        return {"ok": True}
+
+    @router.get("/profile")
+    async def profile(
+        use_case: Annotated[UserInfoUseCaseImpl, Depends(user_info_use_case)],
+    ) -> dict:
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[db_provider.session_getter] = stub_session
+    return app
+
+
+def container_app() -> FastAPI:
+    router = APIRouter()
+
+    @router.post("/login")
+    async def login(use_case: LoginUseCase) -> dict:
+        return {"ok": True}
+
+    @router.get("/profile")
+    async def profile(use_case: UserInfoUseCase) -> dict:
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[db_provider.session_getter] = stub_session
+    return app
+
+
+async def run(requests: int) -> None:
+    apps = {"factories": factories_app(), "container": container_app()}
+    endpoints = [("POST", "/login"), ("GET", "/profile")]
+
+    print(
+        f"{'endpoint':<16}{'factories us':>14}{'container us':>14}{'speedup':>9}"
+        f"{'factories KiB':>15}{'container KiB':>15}"
+    )
+    for method, path in endpoints:
+        old_us, old_kib = await measure(apps["factories"], method, path, requests)
+        new_us, new_kib = await measure(apps["container"], method, path, requests)
+        print(
+            f"{method + ' ' + path:<16}{old_us:>14.1f}{new_us:>14.1f}"
+            f"{old_us / new_us:>8.2f}x{old_kib:>15.1f}{new_kib:>15.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dependency resolution benchmark.")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Compare FastAPI default response serialization with ``JSONRoute``.
+
+Every endpoint is served by two in-process apps: the FastAPI default
+(``jsonable_encoder`` + re-validation + ``JSONResponse``) and ``JSONRoute``
+(``model_dump_json`` straight to bytes). Requests are sent as raw ASGI calls,
+so the numbers include routing and dependency resolution but no network.
+
+Usage:
+    python -m src.tools.benchmarks.json_responses --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import tracemalloc
+import uuid
+from time import perf_counter
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from src.core.responses import JSONRoute, PydanticJSONResponse
+from src.apps.auth.schemas.tokens import TokenInfo
+from src.apps.references.schemas import Reference, ReferenceData
+from src.apps.users.schemas.users import UserResponseSchema
+
+PROFILE = UserResponseSchema(
+    id=uuid.uuid4(),
+    username="benchmark",
+    is_active=True,
+    roles=["user", "admin"],
+)
+TOKEN = TokenInfo(access_token="x" * 600)
+REFERENCES = ReferenceData(
+    version=1,
+    **{
+        table: [Reference(id=i, name=f"{table}-{i}") for i in range(200)]
+        for table in ReferenceData.model_fields
+        if table != "version"
+    },
+)
+
+
+def build_app(route_class: type[APIRoute], response_class: type[Response]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/profile")
+    async def profile() -> UserResponseSchema:
+        return PROFILE
+
+    @router.post("/login", response_model_exclude_none=True)
+    async def login(response: Response) -> TokenInfo:
+        response.set_cookie(key="refreshToken", value="y" * 600, httponly=True)
+        return TOKEN
+
+    @router.get("/references")
+    async def references() -> ReferenceData:
+        return REFERENCES
+
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(router)
+    return app
+
+
+async def call(app: FastAPI, method: str, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 80),
+    }
+    body = bytearray()
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app: FastAPI, method: str, path: str, requests: int) -> tuple:
+    """
+    Mean latency (us) and mean peak traced memory (KiB) per request.
+    """
+    for _ in range(100):  # warm up
+        await call(app, method, path)
+
+    started = perf_counter()
+    for _ in range(requests):
+        await call(app, method, path)
+    latency = (perf_counter() - started) / requests * 1e6
+
+    samples = min(requests, 500)
+    peak = 0
+    tracemalloc.start()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        await call(app, method, path)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return latency, peak / samples / 1024
+
+
+async def run(requests: int) -> None:
+    default_app = build_app(APIRoute, JSONResponse)
+    fast_app = build_app(JSONRoute, PydanticJSONResponse)
+    endpoints = [("GET", "/profile"), ("POST", "/login"), ("GET", "/references")]
+
+    print(
+        f"{'endpoint':<22}{'default us':>12}{'fast us':>10}{'speedup':>9}"
+        f"{'default KiB':>13}{'fast KiB':>10}"
+    )
+    for method, path in endpoints:
+        default_body = await call(default_app, method, path)
+        fast_body = await call(fast_app, method, path)
+        assert json.loads(default_body) == json.loads(fast_body), path
+
+        default_us, default_kib = await measure(default_app, method, path, requests)
+        fast_us, fast_kib = await measure(fast_app, method, path, requests)
+        print(
+            f"{method + ' ' + path:<22}{default_us:>12.1f}{fast_us:>10.1f}"
+            f"{default_us / fast_us:>8.2f}x{default_kib:>13.1f}{fast_kib:>10.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON responses benchmark.")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
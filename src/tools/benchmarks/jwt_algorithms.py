@@ -0,0 +1,65 @@
+"""
+Compare JWT sign/verify throughput of supported algorithms on this host.
+
+Usage:
+    python -m src.tools.benchmarks.jwt_algorithms --seconds 2
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable
+
+import jwt
+
+from src.tools.keys.generate import ALGORITHMS, generate_private_key
+
+
+def measure(func: Callable[[], object], seconds: float) -> float:
+    """
+    Operations per second of ``func`` over ``seconds``.
+    """
+    count = 0
+    started = perf_counter()
+    deadline = started + seconds
+    while perf_counter() < deadline:
+        for _ in range(10):
+            func()
+        count += 10
+    return count / (perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT algorithms benchmark.")
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    payload = {
+        "type": "access",
+        "sub": "6f1c1e4c-1b8f-4a8e-9d7b-2c6f0f2d4a11",
+        "roles": ["user", "admin"],
+        "iat": now,
+        "exp": now + timedelta(minutes=30),
+    }
+
+    print(f"{'algorithm':<10}{'sign/s':>12}{'verify/s':>12}{'token bytes':>14}")
+    for algorithm in args.algorithms or ALGORITHMS:
+        private_key = generate_private_key(algorithm)
+        public_key = private_key.public_key()
+        token = jwt.encode(payload, private_key, algorithm=algorithm)
+
+        sign = measure(
+            lambda: jwt.encode(payload, private_key, algorithm=algorithm),
+            args.seconds,
+        )
+        verify = measure(
+            lambda: jwt.decode(token, public_key, algorithms=[algorithm]),
+            args.seconds,
+        )
+        print(f"{algorithm:<10}{sign:>12.0f}{verify:>12.0f}{len(token):>14}")
+
+
+if __name__ == "__main__":
+    main()
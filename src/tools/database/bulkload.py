@@ -0,0 +1,300 @@
+"""
+Bulk load seed/fixture files.
+
+Rows are grouped by model and written in batches with COPY (or multi-row
+INSERT ... VALUES). Files are loaded in foreign key dependency order, files
+of the same dependency level concurrently, each in its own transaction.
+Foreign keys are checked when a file commits, rows within a file may come
+in any order.
+
+Input is the seed format: a JSON list (``.json``) or one item per line
+(``.ndjson``/``.jsonl``) of ``{"model": "...", "id": ..., "fields": {...}}``.
+Line-delimited files are streamed, memory is bounded by the batch size.
+
+Usage:
+    python -m src.tools.database.bulkload fixtures/*.ndjson --batch-size 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Iterator, Literal
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database.db_provider import db_provider
+from src.core.models import Base
+from src.apps.auth.services.security import SecurityServiceImpl
+from .loaddata import DEFAULT_PASSWORD, import_from_string, once, sync_sequences
+from .migrate import migrate
+
+logger = logging.getLogger(__name__)
+
+Method = Literal["copy", "values"]
+
+# asyncpg limit of bind parameters per statement
+MAX_PARAMS = 32767
+MODEL_RE = re.compile(rb'"model"\s*:\s*"([^"]+)"')
+LINE_DELIMITED = {".ndjson", ".jsonl"}
+
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    uuid.UUID: uuid.UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    Decimal: Decimal,
+    bytes: bytes.fromhex,
+}
+
+
+@dataclass
+class FileReport:
+    path: Path
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def column_converter(column: sa.Column) -> Callable[[Any], Any] | None:
+    """
+    Convert JSON value to the python type expected by the driver.
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    convert = CONVERTERS.get(python_type)
+    if convert is None:
+        return None
+    return lambda value: (
+        value if value is None or isinstance(value, python_type) else convert(value)
+    )
+
+
+def iter_items(path: Path) -> Iterator[dict]:
+    if path.suffix in LINE_DELIMITED:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f)
+
+
+def file_tables(path: Path) -> set[sa.Table]:
+    """
+    Tables referenced by a file, found without parsing it.
+    """
+    names: set[bytes] = set()
+    with open(path, "rb") as f:
+        for line in f:
+            names.update(MODEL_RE.findall(line))
+    return {import_from_string(name.decode())[0].__table__ for name in names}
+
+
+def dependency_levels(paths: list[Path]) -> list[list[Path]]:
+    """
+    Group files by the FK depth of their deepest table.
+    Files of one level do not depend on each other.
+    """
+    depth: dict[sa.Table, int] = {}
+    for table in Base.metadata.sorted_tables:
+        parents = [
+            fk.column.table for fk in table.foreign_keys if fk.column.table is not table
+        ]
+        depth[table] = 1 + max((depth[parent] for parent in parents), default=-1)
+
+    levels: dict[int, list[Path]] = {}
+    for path in paths:
+        level = max((depth[table] for table in file_tables(path)), default=0)
+        levels.setdefault(level, []).append(path)
+    return [levels[level] for level in sorted(levels)]
+
+
+class BulkWriter:
+    """
+    Buffers rows per (table, columns) and writes them in batches.
+    All buffers are flushed together in FK order. A batch may still be
+    written before parent rows later in the file: the session must defer
+    foreign key checks to commit (``SET CONSTRAINTS ALL DEFERRED``).
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        method: Method,
+        batch_size: int,
+        default_password: Callable,
+    ) -> None:
+        self.session = session
+        self.method = method
+        self.batch_size = batch_size
+        self.default_password = default_password
+        self.buffers: dict[tuple[sa.Table, tuple[str, ...]], list[tuple]] = {}
+        self.converters: dict[tuple[sa.Table, tuple[str, ...]], list] = {}
+        self.defaults: dict[sa.Table, dict[str, Any]] = {}
+        self.order = {table: i for i, table in enumerate(Base.metadata.sorted_tables)}
+        self.tables: set[str] = set()
+        self.rows = 0
+
+    async def add(self, item: dict) -> None:
+        model, model_name = import_from_string(item["model"])
+        row = {"id": item["id"], **item["fields"]}
+        if model_name == "User" and "hashed_password" not in row:
+            row["hashed_password"] = await self.default_password()
+
+        table = model.__table__
+        for name, value in self._defaults(table).items():
+            row.setdefault(name, value)
+        key = (table, tuple(row))
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = []
+            self.converters[key] = [column_converter(table.c[name]) for name in row]
+        buffer.append(
+            tuple(
+                convert(value) if convert else value
+                for convert, value in zip(self.converters[key], row.values())
+            )
+        )
+        if len(buffer) >= self.batch_size:
+            await self.flush()
+
+    def _defaults(self, table: sa.Table) -> dict[str, Any]:
+        """
+        Python-side scalar defaults, COPY only applies server defaults.
+        """
+        defaults = self.defaults.get(table)
+        if defaults is None:
+            defaults = self.defaults[table] = {
+                column.name: column.default.arg
+                for column in table.columns
+                if column.default is not None and column.default.is_scalar
+            }
+        return defaults
+
+    async def flush(self) -> None:
+        for key in sorted(self.buffers, key=lambda key: self.order[key[0]]):
+            records = self.buffers[key]
+            if not records:
+                continue
+            table, columns = key
+            if self.method == "copy":
+                await self._copy(table, columns, records)
+            else:
+                await self._values(table, columns, records)
+            self.tables.add(table.name)
+            self.rows += len(records)
+            records.clear()
+
+    async def _copy(self, table: sa.Table, columns: tuple, records: list) -> None:
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=columns,
+            schema_name=table.schema,
+        )
+
+    async def _values(self, table: sa.Table, columns: tuple, records: list) -> None:
+        chunk_size = max(MAX_PARAMS // len(columns), 1)
+        for start in range(0, len(records), chunk_size):
+            rows = [
+                dict(zip(columns, record))
+                for record in records[start : start + chunk_size]
+            ]
+            await self.session.execute(sa.insert(table).values(rows))
+
+
+async def load_file(
+    path: Path,
+    method: Method,
+    batch_size: int,
+    default_password: Callable,
+) -> FileReport:
+    started = perf_counter()
+    async with db_provider.transaction() as session:
+        await session.execute(sa.text("SET CONSTRAINTS ALL DEFERRED"))
+        writer = BulkWriter(session, method, batch_size, default_password)
+        for item in iter_items(path):
+            await writer.add(item)
+        await writer.flush()
+        await sync_sequences(session, writer.tables)
+    report = FileReport(path=path, rows=writer.rows, seconds=perf_counter() - started)
+    logger.info(
+        "%s: %s rows in %.2fs (%.0f rows/s)",
+        path.name,
+        report.rows,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return report
+
+
+async def bulk_load(
+    paths: list[Path],
+    method: Method = "copy",
+    batch_size: int = 5000,
+    concurrency: int = 4,
+) -> list[FileReport]:
+    await migrate()
+    security = SecurityServiceImpl()
+    default_password = once(lambda: security.encode_password(DEFAULT_PASSWORD))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(path: Path) -> FileReport:
+        async with semaphore:
+            return await load_file(path, method, batch_size, default_password)
+
+    reports = []
+    for level in dependency_levels(paths):
+        reports.extend(await asyncio.gather(*(load(path) for path in level)))
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk load seed/fixture files.")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--method", choices=["copy", "values"], default="copy")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    async def run() -> list[FileReport]:
+        try:
+            return await bulk_load(
+                args.files, args.method, args.batch_size, args.concurrency
+            )
+        finally:
+            await db_provider.dispose()
+
+    started = perf_counter()
+    reports = asyncio.run(run())
+    seconds = perf_counter() - started
+    rows = sum(report.rows for report in reports)
+    print(f"{'file':<40}{'rows':>12}{'seconds':>10}{'rows/s':>12}")
+    for report in reports:
+        print(
+            f"{report.path.name:<40}{report.rows:>12}{report.seconds:>10.2f}"
+            f"{report.rows_per_second:>12.0f}"
+        )
+    print(f"{'total':<40}{rows:>12}{seconds:>10.2f}{rows / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,232 @@
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
 import importlib
 import json
-import os
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database.db_provider import db_provider, init_db
+from src.core.database.db_provider import db_provider
+from src.core.models import Base, SeedMigration
 from src.apps.auth.services.security import SecurityServiceImpl
+from src.apps.auth.enums import ActionsEnum, ResourcesEnum
+from src.apps.auth.repositories.permissions import PermissionsRepositoryImpl
+from src.core.cache import invalidation
 from src.settings import settings
+from .migrate import migrate
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PASSWORD = "qwerty"
+# Never overwritten by a re-applied seed, users may have changed them
+INSERT_ONLY_FIELDS = {"User": {"hashed_password"}}
+# Granted to ``settings.rbac.admin_role`` on startup, seeds predate them
+DEFAULT_GRANTS = [
+    (ResourcesEnum.USERS, ActionsEnum.EXPORT),
+    (ResourcesEnum.ROLES, ActionsEnum.EXPORT),
+    (ResourcesEnum.AUTH_TOKENS, ActionsEnum.EXPORT),
+    (ResourcesEnum.METRICS, ActionsEnum.VIEW),
+]
 
+
+@functools.cache
 def import_from_string(import_str: str):
     package_name, model_name = import_str.rsplit(".", maxsplit=1)
     package = importlib.import_module(package_name)
     return getattr(package, model_name), model_name
 
 
-async def load_data() -> None:
+def file_checksum(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def once(func: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+    """
+    Await ``func`` on first call only, later and concurrent calls share
+    the same result.
+    """
+    future: list[asyncio.Future] = []
+
+    async def wrapper() -> Any:
+        if not future:
+            future.append(asyncio.ensure_future(func()))
+        return await asyncio.shield(future[0])
+
+    return wrapper
+
+
+def upsert_statement(model: Any, fields: list[str], insert_only: set[str]):
+    """
+    INSERT ... ON CONFLICT (pk) DO UPDATE of changed rows only.
+    ``onupdate`` SQL defaults are applied explicitly, ON CONFLICT updates
+    do not run them.
     """
-    Load seed data from json files.
+    statement = pg_insert(model)
+    pk = [column.name for column in model.__table__.primary_key]
+    updated = [
+        field for field in fields if field not in pk and field not in insert_only
+    ]
+    if not updated:
+        return statement.on_conflict_do_nothing(index_elements=pk)
+
+    set_ = {field: statement.excluded[field] for field in updated}
+    for column in model.__table__.columns:
+        if column.onupdate is not None and column.name not in set_:
+            if column.onupdate.is_clause_element or column.onupdate.is_scalar:
+                set_[column.name] = column.onupdate.arg
+    changed = sa.or_(
+        *(
+            model.__table__.c[field].is_distinct_from(statement.excluded[field])
+            for field in updated
+        )
+    )
+    return statement.on_conflict_do_update(index_elements=pk, set_=set_, where=changed)
+
+
+async def apply_seed_file(
+    session: AsyncSession,
+    items: list[dict],
+    default_password: Callable[[], Awaitable[bytes]],
+) -> set[str]:
     """
-    # Clear DB and create tables
-    logger.debug("Init DB")
-    await init_db()
+    Upsert seed items, consecutive items of one model are sent as one batch.
+    Returns names of touched tables.
+    """
+    tables = set()
+    runs = itertools.groupby(
+        items,
+        key=lambda item: (item["model"], tuple(sorted(item["fields"]))),
+    )
+    for (import_str, _), run in runs:
+        model, model_name = import_from_string(import_str)
+        insert_only = INSERT_ONLY_FIELDS.get(model_name, set())
+        rows = [{"id": item["id"], **item["fields"]} for item in run]
+        if model_name == "User":
+            hashed_password = await default_password()
+            for row in rows:
+                row.setdefault("hashed_password", hashed_password)
+
+        statement = upsert_statement(model, list(rows[0]), insert_only)
+        await session.execute(statement, rows)
+        tables.add(model.__tablename__)
+        logger.debug("%s %s rows upserted", len(rows), model_name)
+    return tables
+
+
+def serial_tables(tables: set[str]) -> list[str]:
+    """
+    Tables with an autoincrement integer ``id`` (uuid ids have no sequence).
+    """
+    serial = []
+    for table in sorted(tables):
+        column = Base.metadata.tables[table].autoincrement_column
+        if column is not None and column.name == "id":
+            serial.append(table)
+    return serial
+
+
+async def sync_sequences(session: AsyncSession, tables: set[str]) -> None:
+    """
+    Move id sequences of serial tables past seeded ids.
+    """
+    for table in serial_tables(tables):
+        await session.execute(
+            sa.text(
+                "SELECT setval(pg_get_serial_sequence(:table, 'id'), max(id)) "
+                f'FROM "{table}"'
+            ),
+            {"table": table},
+        )
+
+
+async def apply_seed_files(seed_dir: Path) -> bool:
+    """
+    Apply new or changed seed files of ``seed_dir``.
+    :returns: True if any file was applied.
+    """
+    async with db_provider.transaction() as s:
+        applied = dict(
+            (await s.execute(sa.select(SeedMigration.name, SeedMigration.checksum)))
+            .tuples()
+            .all()
+        )
 
     security = SecurityServiceImpl()
-    seed_dir = Path(settings.base_dir) / "seed"
+    default_password = once(lambda: security.encode_password(DEFAULT_PASSWORD))
+    changed = False
     logger.info("Start seed loading")
-    for seed_file in os.listdir(seed_dir):
-        seed_file_path = seed_dir / seed_file
-        logger.debug("Load file %s", seed_file)
-
-        with open(seed_file_path, encoding="utf-8") as f:
-            items = json.load(f)
-            logger.debug("%s items found", len(items))
-
-        async with db_provider.session_factory() as s, s.begin():
-            for item in items:
-                model, model_name = import_from_string(item["model"])
-                if model_name == "User":
-                    item["fields"]["hashed_password"] = security.encode_password(
-                        "qwerty"
-                    )
-                await s.execute(
-                    sa.insert(model).values({"id": item["id"], **item["fields"]})
+    for seed_file_path in sorted(seed_dir.iterdir()):
+        content = seed_file_path.read_bytes()
+        checksum = file_checksum(content)
+        if applied.get(seed_file_path.name) == checksum:
+            logger.debug("%s is up to date", seed_file_path.name)
+            continue
+
+        items = json.loads(content)
+        logger.debug("Apply %s: %s items", seed_file_path.name, len(items))
+        async with db_provider.transaction() as s:
+            tables = await apply_seed_file(s, items, default_password)
+            await sync_sequences(s, tables)
+            statement = pg_insert(SeedMigration).values(
+                name=seed_file_path.name,
+                checksum=checksum,
+            )
+            await s.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[SeedMigration.name],
+                    set_={"checksum": checksum, "applied_at": sa.func.now()},
                 )
-                logger.debug("%s with id:%s created!", model_name, item["id"])
-        logger.debug("%s loaded!", seed_file)
+            )
+        changed = True
+        logger.debug("%s applied!", seed_file_path.name)
+    return changed
+
+
+async def apply_default_grants(session: AsyncSession) -> bool:
+    """
+    Grant ``DEFAULT_GRANTS`` to the admin role when it exists.
+    :returns: True if any permission was added.
+    """
+    repository = PermissionsRepositoryImpl(session=session)
+    changed = False
+    for resource, action in DEFAULT_GRANTS:
+        if await repository.grant(settings.rbac.admin_role, resource, action):
+            logger.info(
+                "Granted %s:%s to %s", resource, action, settings.rbac.admin_role
+            )
+            changed = True
+    return changed
+
+
+async def load_data() -> None:
+    """
+    Apply new or changed seed files, then the default grants.
+
+    Files are applied in name order, each one in its own transaction with
+    its checksum recorded in ``seed_migrations``. Unchanged files are skipped,
+    so startup on a seeded database only reads the checksums. Rows are
+    upserted by primary key, rows removed from a seed file are not deleted.
+    Default grants apply with or without a seed directory.
+    """
+    logger.debug("Migrate schema")
+    await migrate()
+
+    changed = False
+    seed_dir = Path(settings.base_dir) / "seed"
+    if seed_dir.is_dir():
+        changed = await apply_seed_files(seed_dir)
+    else:
+        logger.info("No seed directory %s", seed_dir)
+
+    async with db_provider.transaction() as s:
+        changed = await apply_default_grants(s) or changed
 
+    if changed:
+        await invalidation.publish()
     logger.info("Seed loading finished!")
@@ -0,0 +1,110 @@
+"""
+Apply schema migrations (alembic, ``src/migrations``).
+
+Run at startup before seeding. Databases created by ``create_all`` before
+migrations existed (tables, no ``alembic_version``) are stamped with the
+baseline revision and upgraded from there. Startup fails when a reference
+table has no version trigger (each new one needs a migration). ``--reset``
+drops every table of the application and rebuilds the schema, all data is
+lost.
+
+Usage:
+    python -m src.tools.database.migrate
+    python -m src.tools.database.migrate --reset
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.engine import Connection
+
+from src.core.database.db_provider import db_provider
+from src.core.models import Base
+from src.core.models.references import MISSING_VERSION_TRIGGERS, reference_models
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+BASELINE_REVISION = "0001"
+# pg_advisory_xact_lock key, concurrent starts migrate one after another
+MIGRATIONS_LOCK = 0x6D696772
+
+
+def alembic_config(connection: Connection) -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    return config
+
+
+def upgrade(connection: Connection) -> None:
+    config = alembic_config(connection)
+    tables = sa.inspect(connection).get_table_names()
+    if "alembic_version" not in tables and "users" in tables:
+        logger.info("Unversioned schema, stamped %s", BASELINE_REVISION)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+    check_version_triggers(connection)
+
+
+def check_version_triggers(connection: Connection) -> None:
+    """
+    Every reference table needs a migration creating its version trigger,
+    without it updates keep the insert version and never reach deltas.
+    """
+    missing = connection.execute(
+        sa.text(MISSING_VERSION_TRIGGERS), {"tables": list(reference_models())}
+    ).scalars()
+    if missing := list(missing):
+        raise RuntimeError(
+            f"Reference tables without version trigger: {', '.join(missing)}. "
+            "Add a migration running version_trigger_ddl(table) for each."
+        )
+
+
+def drop_all(connection: Connection) -> None:
+    Base.metadata.drop_all(connection)
+    connection.execute(sa.text("DROP TABLE IF EXISTS alembic_version"))
+    connection.execute(sa.text("DROP FUNCTION IF EXISTS set_reference_version()"))
+
+
+async def migrate(reset: bool = False) -> None:
+    """
+    Upgrade the schema to the latest revision, ``reset`` drops it first.
+    """
+    async with db_provider.engine.begin() as connection:
+        await connection.execute(
+            sa.text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATIONS_LOCK}
+        )
+        if reset:
+            logger.warning("Drop all tables")
+            await connection.run_sync(drop_all)
+        await connection.run_sync(upgrade)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply schema migrations.")
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Drop all tables and data, then create the schema",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    async def run() -> None:
+        try:
+            await migrate(reset=args.reset)
+        finally:
+            await db_provider.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
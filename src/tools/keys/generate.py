@@ -0,0 +1,89 @@
+"""
+Generate JWT signing key pair in CERTS_DIR.
+
+Usage:
+    python -m src.tools.keys.generate --algorithm EdDSA --name jwt-ed25519
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+from src.settings import CERTS_DIR
+
+logger = logging.getLogger(__name__)
+
+ALGORITHMS = ("RS256", "ES256", "ES384", "ES512", "EdDSA")
+
+
+def generate_private_key(algorithm: str) -> PrivateKeyTypes:
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    if algorithm == "ES384":
+        return ec.generate_private_key(ec.SECP384R1())
+    if algorithm == "ES512":
+        return ec.generate_private_key(ec.SECP521R1())
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+
+def write_key_pair(
+    private_key: PrivateKeyTypes,
+    directory: Path,
+    name: str,
+    force: bool = False,
+) -> tuple[Path, Path]:
+    private_path = directory / f"{name}-private.pem"
+    public_path = directory / f"{name}-public.pem"
+    for path in (private_path, public_path):
+        if path.exists() and not force:
+            raise FileExistsError(f"{path} already exists, use --force to overwrite")
+
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    # created owner-only, never readable by others even for a moment
+    private_path.unlink(missing_ok=True)
+    fd = os.open(private_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(private_pem)
+    public_path.write_bytes(
+        private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return private_path, public_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate JWT signing key pair.")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="EdDSA")
+    parser.add_argument("--name", default="jwt", help="File name prefix.")
+    parser.add_argument("--dir", type=Path, default=CERTS_DIR)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    private_path, public_path = write_key_pair(
+        private_key=generate_private_key(args.algorithm),
+        directory=args.dir,
+        name=args.name,
+        force=args.force,
+    )
+    logger.info("%s keys written: %s, %s", args.algorithm, private_path, public_path)
+    logger.info("Set AUTH_JWT__PRIVATE_KEY_PATH=%s to sign with new key", private_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Import users from CSV or NDJSON.
+
+Passwords are hashed on every core (process pool), users and their roles
+are written in one transaction per batch. Progress is checkpointed after
+each batch, a re-run of the same file resumes after the last committed
+batch; existing usernames are skipped before hashing, so replaying a batch
+is safe and cheap.
+
+CSV columns: ``username,password,roles[,is_active][,location_id]``,
+roles separated by ``|``. NDJSON objects have the same keys, ``roles``
+may be a list.
+
+Usage:
+    python -m src.tools.users.bulk_import users.csv --location-id 1
+"""
+
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database.db_provider import db_provider
+from src.core.executors import CPUExecutor
+from src.core.models import Role, User, UserRole
+from src.tools.database.bulkload import MAX_PARAMS
+from src.apps.auth.services.security import (
+    SecurityServiceImpl,
+    SecurityServiceProtocol,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLES_SEPARATOR = "|"
+TRUE_VALUES = {"1", "true", "yes", "y"}
+USERNAME_MAX_LENGTH = User.__table__.c.username.type.length
+# bcrypt input limit, longer passwords are truncated or rejected by bcrypt
+PASSWORD_MAX_BYTES = 72
+
+
+@dataclass
+class UserRow:
+    line: int
+    username: str
+    password: str
+    roles: list[str]
+    is_active: bool
+    location_id: int
+
+    def __post_init__(self) -> None:
+        if not self.username or len(self.username) > USERNAME_MAX_LENGTH:
+            raise ValueError(f"username must be 1-{USERNAME_MAX_LENGTH} characters")
+        if not isinstance(self.password, str) or not self.password:
+            raise ValueError("password must be a non-empty string")
+        if len(self.password.encode()) > PASSWORD_MAX_BYTES:
+            raise ValueError(f"password longer than {PASSWORD_MAX_BYTES} bytes")
+
+
+@dataclass
+class ImportProgress:
+    rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    rejected: int = 0
+    started: float = field(default_factory=perf_counter)
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = perf_counter() - self.started
+        return self.rows / elapsed if elapsed else 0.0
+
+
+class Checkpoint:
+    """
+    Number of input rows already committed, stored next to the input file.
+    """
+
+    def __init__(self, source: Path) -> None:
+        self.source = source
+        self.path = source.with_name(source.name + ".checkpoint")
+
+    def load(self) -> int:
+        if not self.path.exists():
+            return 0
+        state = json.loads(self.path.read_text())
+        if state["size"] != self.source.stat().st_size:
+            raise SystemExit(f"{self.source} changed since {self.path} was written")
+        return state["rows"]
+
+    def save(self, rows: int) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"rows": rows, "size": self.source.stat().st_size}))
+        tmp.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def parse_roles(value: str | list[str] | None) -> list[str]:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(ROLES_SEPARATOR)
+    return [role.strip() for role in value if role.strip()]
+
+
+def parse_bool(value: str | bool | None, default: bool = True) -> bool:
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    return value.strip().lower() in TRUE_VALUES
+
+
+def iter_records(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix == ".csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_rows(path: Path, location_id: int | None) -> Iterator[UserRow | None]:
+    """
+    Parsed rows, ``None`` for rows that can not be imported.
+    """
+    for line, record in enumerate(iter_records(path), start=1):
+        try:
+            yield UserRow(
+                line=line,
+                username=record["username"].strip(),
+                password=record["password"],
+                roles=parse_roles(record.get("roles")),
+                is_active=parse_bool(record.get("is_active")),
+                location_id=int(record.get("location_id") or location_id),
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            logger.warning("Row %s rejected: %r", line, error)
+            yield None
+
+
+async def load_roles(session: AsyncSession) -> dict[str, int]:
+    return dict((await session.execute(sa.select(Role.name, Role.id))).tuples().all())
+
+
+async def existing_usernames(session: AsyncSession, usernames: list[str]) -> set[str]:
+    """
+    Usernames already imported, looked up with a single array parameter.
+    """
+    statement = sa.select(User.username).where(
+        User.username == sa.any_(sa.literal(usernames, ARRAY(sa.String)))
+    )
+    return set((await session.execute(statement)).scalars())
+
+
+def chunked(values: list[dict]) -> Iterator[list[dict]]:
+    """
+    Rows of a multi-row insert, split within the bind parameter limit.
+    """
+    chunk_size = max(MAX_PARAMS // len(values[0]), 1)
+    for start in range(0, len(values), chunk_size):
+        yield values[start : start + chunk_size]
+
+
+async def write_batch(
+    session: AsyncSession,
+    rows: list[UserRow],
+    hashes: list[bytes],
+    roles: dict[str, int],
+) -> int:
+    """
+    Insert users (skipping existing usernames) and their roles.
+    A username repeated in the batch is imported from its first row only.
+    """
+    unique: dict[str, tuple[UserRow, bytes]] = {}
+    for row, hashed in zip(rows, hashes):
+        unique.setdefault(row.username, (row, hashed))
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "username": row.username,
+            "hashed_password": hashed,
+            "is_active": row.is_active,
+            "location_id": row.location_id,
+        }
+        for row, hashed in unique.values()
+    ]
+    statement = (
+        pg_insert(User)
+        .on_conflict_do_nothing(index_elements=[User.username])
+        .returning(User.id, User.username)
+    )
+    created: dict[str, uuid.UUID] = {}
+    for chunk in chunked(values):
+        result = await session.execute(statement.values(chunk))
+        created.update((username, id_) for id_, username in result.tuples())
+    user_roles = [
+        {"user_id": created[row.username], "role_id": roles[role]}
+        for row, _ in unique.values()
+        if row.username in created
+        for role in dict.fromkeys(row.roles)
+    ]
+    if user_roles:
+        for chunk in chunked(user_roles):
+            await session.execute(sa.insert(UserRole).values(chunk))
+    return len(created)
+
+
+async def import_users(
+    path: Path,
+    security: SecurityServiceProtocol,
+    batch_size: int = 1000,
+    location_id: int | None = None,
+) -> ImportProgress:
+    checkpoint = Checkpoint(path)
+    done = checkpoint.load()
+    progress = ImportProgress()
+    if done:
+        logger.info("Resume after %s rows", done)
+
+    async with db_provider.transaction() as session:
+        roles = await load_roles(session)
+
+    rows = itertools.islice(iter_rows(path, location_id), done, None)
+    total = done
+    while batch := list(itertools.islice(rows, batch_size)):
+        valid = []
+        for row in batch:
+            if row is None:
+                progress.rejected += 1
+                continue
+            unknown = [role for role in row.roles if role not in roles]
+            if unknown:
+                logger.warning("Row %s rejected: unknown roles %s", row.line, unknown)
+                progress.rejected += 1
+                continue
+            valid.append(row)
+
+        created = 0
+        if valid:
+            # bcrypt dominates the import: hash new usernames only, once each
+            async with db_provider.transaction() as session:
+                seen = await existing_usernames(
+                    session, [row.username for row in valid]
+                )
+            new = []
+            for row in valid:
+                if row.username not in seen:
+                    seen.add(row.username)
+                    new.append(row)
+            if new:
+                hashes = await asyncio.gather(
+                    *(security.encode_password(row.password) for row in new)
+                )
+                async with db_provider.transaction() as session:
+                    created = await write_batch(session, new, hashes, roles)
+
+        total += len(batch)
+        checkpoint.save(total)
+        progress.rows += len(batch)
+        progress.created += created
+        progress.skipped += len(valid) - created
+        logger.info(
+            "%s rows: %s created, %s skipped, %s rejected (%.0f rows/s)",
+            total,
+            progress.created,
+            progress.skipped,
+            progress.rejected,
+            progress.rows_per_second,
+        )
+
+    checkpoint.clear()
+    return progress
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk import users.")
+    parser.add_argument("file", type=Path, help="CSV or NDJSON file")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--location-id",
+        type=int,
+        help="Location of rows without location_id",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Hashing processes (default: all cores)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    executor = CPUExecutor(
+        kind="process",
+        max_workers=args.workers,
+        max_concurrency=args.workers * 2,
+    )
+    security = SecurityServiceImpl(executor=executor)
+
+    async def run() -> ImportProgress:
+        try:
+            return await import_users(
+                args.file, security, args.batch_size, args.location_id
+            )
+        finally:
+            await db_provider.dispose()
+            executor.shutdown()
+
+    progress = asyncio.run(run())
+    print(
+        f"rows: {progress.rows}, created: {progress.created}, "
+        f"skipped: {progress.skipped}, rejected: {progress.rejected}, "
+        f"{progress.rows_per_second:.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from src.apps.auth.services import acl
+from src.apps.auth.services.acl import ACLCacheImpl
+from src.apps.auth.tools.acl import CompiledACL
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(acl, "monotonic", clock)
+    return clock
+
+
+class Loader:
+    """
+    Returns a new map per call, blocks while ``gate`` is cleared.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def __call__(self) -> CompiledACL:
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("database is down")
+        return CompiledACL({"loaded": self.calls})
+
+
+async def test_fresh_entry_is_served_from_cache(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10, stale_ttl=5)
+    first = await cache.get()
+    clock.now += 9
+    assert await cache.get() is first
+    assert loader.calls == 1
+    assert (cache.stats().misses, cache.stats().hits) == (1, 1)
+
+
+async def test_stale_entry_is_served_while_refreshing(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10, stale_ttl=5)
+    first = await cache.get()
+
+    clock.now += 12
+    loader.gate.clear()
+    assert await cache.get() is first  # does not wait for the reload
+    assert await cache.get() is first
+    await asyncio.sleep(0)
+    assert loader.calls == 2  # one background refresh for both
+    loader.gate.set()
+    await asyncio.sleep(0)
+    refreshed = await cache.get()
+    assert refreshed is not first
+    assert refreshed.role_masks == {"loaded": 2}
+    assert cache.stats().stale_hits == 2
+
+
+async def test_expired_entry_is_reloaded_before_returning(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10, stale_ttl=5)
+    first = await cache.get()
+    clock.now += 15
+    assert await cache.get() is not first
+    assert cache.stats().misses == 2
+
+
+async def test_failed_background_refresh_keeps_stale_entry(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10, stale_ttl=5)
+    first = await cache.get()
+    clock.now += 12
+    loader.fail = True
+    assert await cache.get() is first
+    await asyncio.sleep(0)
+    assert await cache.get() is first
+    assert cache.stats().failed_refreshes >= 1
+
+
+async def test_invalidate_bumps_version_and_reloads(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10)
+    first = await cache.get()
+    assert cache.invalidate() == 1
+    second = await cache.get()
+    assert second is not first
+    assert cache.stats().version == 1
+
+    # a reload started before the bump does not satisfy the new version
+    cache.invalidate()
+    loader.gate.clear()
+    pending = asyncio.ensure_future(cache.get())
+    while loader.calls < 3:
+        await asyncio.sleep(0)
+    cache.invalidate()
+    loader.gate.set()
+    assert (await pending).role_masks == {"loaded": 3}
+    assert (await cache.get()).role_masks == {"loaded": 4}
+
+
+async def test_concurrent_misses_share_one_load(clock):
+    loader = Loader()
+    cache = ACLCacheImpl(loader, ttl=10)
+    loader.gate.clear()
+    waiters = [asyncio.ensure_future(cache.get()) for _ in range(10)]
+    await asyncio.sleep(0)
+    loader.gate.set()
+    results = await asyncio.gather(*waiters)
+    assert loader.calls == 1
+    assert all(result is results[0] for result in results)
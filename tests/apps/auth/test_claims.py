@@ -0,0 +1,103 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+import pytest_asyncio
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from src.apps.auth.tools import claims
+from src.apps.auth.tools.jwts import decode_jwt, encode_jwt
+from src.apps.auth.tools.keyring import KeyRing
+
+
+def write_key(path) -> None:
+    path.write_bytes(
+        ed25519.Ed25519PrivateKey.generate().private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+
+
+@pytest.fixture
+def ring(tmp_path, monkeypatch) -> KeyRing:
+    write_key(tmp_path / "signing.pem")
+    ring = KeyRing(keys_dir=tmp_path, signing_key_path=tmp_path / "signing.pem")
+    ring.load()
+    monkeypatch.setattr(claims, "jwt_keyring", ring)
+    return ring
+
+
+@pytest_asyncio.fixture
+async def decodes(ring, monkeypatch) -> list[str]:
+    """
+    Tokens verified by ``get_verified_claims`` (cache misses).
+    """
+    calls = []
+
+    def counting_decode(token: str) -> dict:
+        calls.append(token)
+        return decode_jwt(token, keyring=ring)
+
+    monkeypatch.setattr(claims, "decode_jwt", counting_decode)
+    await claims.claims_cache.clear()
+    yield calls
+    await claims.claims_cache.clear()
+
+
+def token(ring: KeyRing, minutes: int = 5) -> str:
+    return encode_jwt(
+        {"sub": "alice", "roles": ["user"]},
+        expire_timedelta=timedelta(minutes=minutes),
+        keyring=ring,
+    )
+
+
+async def test_cached_claims_are_copied_on_read(ring, decodes):
+    access = token(ring)
+    first = await claims.get_verified_claims(access)
+    first["roles"].append("admin")
+    second = await claims.get_verified_claims(access)
+    second["roles"].append("admin")
+    third = await claims.get_verified_claims(access)
+    assert third["roles"] == ["user"]
+    assert decodes == [access]
+
+
+async def test_claims_expire_with_the_token(ring, decodes, monkeypatch):
+    access = token(ring)
+    await claims.get_verified_claims(access)
+    now = time.time()
+    monkeypatch.setattr(claims, "time", lambda: now + 5 * 60 + 1)
+    await claims.get_verified_claims(access)
+    assert decodes == [access, access]
+
+
+async def test_token_without_exp_is_rejected(ring, decodes):
+    key = ring.signing_key
+    access = jwt.encode(
+        {"sub": "alice"},
+        key.private_key,
+        algorithm=key.algorithm,
+        headers={"kid": key.kid},
+    )
+    for _ in range(2):
+        with pytest.raises(jwt.MissingRequiredClaimError):
+            await claims.get_verified_claims(access)
+    assert decodes == [access, access]
+
+
+async def test_reload_keys_drops_cached_claims(ring, decodes, tmp_path):
+    access = token(ring)
+    await claims.get_verified_claims(access)
+    await claims.reload_keys()  # files unchanged, cache kept
+    await claims.get_verified_claims(access)
+    assert decodes == [access]
+
+    write_key(tmp_path / "rotated.pem")
+    await claims.reload_keys()
+    await claims.get_verified_claims(access)
+    assert decodes == [access, access]
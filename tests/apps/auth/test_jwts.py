@@ -0,0 +1,115 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from src.apps.auth.tools.jwts import decode_jwt, encode_jwt
+from src.apps.auth.tools.keyring import KeyRing, key_id
+
+
+def write_key(path, private_key) -> str:
+    path.write_bytes(
+        private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    return key_id(private_key.public_key())
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    keys = tmp_path / "keys"
+    keys.mkdir()
+    return keys
+
+
+def keyring(keys_dir, signing: str = "signing.pem", **kwargs) -> KeyRing:
+    ring = KeyRing(keys_dir=keys_dir, signing_key_path=keys_dir / signing, **kwargs)
+    ring.load()
+    return ring
+
+
+def sign(private_key, kid: str | None, algorithm: str) -> str:
+    headers = {"kid": kid} if kid else {}
+    return jwt.encode(
+        {"sub": "alice"}, private_key, algorithm=algorithm, headers=headers
+    )
+
+
+def test_kid_selects_key(keys_dir):
+    signing = ed25519.Ed25519PrivateKey.generate()
+    other = ec.generate_private_key(ec.SECP256R1())
+    write_key(keys_dir / "signing.pem", signing)
+    other_kid = write_key(keys_dir / "other.pem", other)
+    ring = keyring(keys_dir)
+
+    token = encode_jwt(
+        {"sub": "alice"}, expire_timedelta=timedelta(minutes=1), keyring=ring
+    )
+    assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+    assert decode_jwt(token, keyring=ring)["sub"] == "alice"
+    assert decode_jwt(sign(other, other_kid, "ES256"), keyring=ring)["sub"] == "alice"
+
+
+def test_token_without_kid_is_checked_by_alg(keys_dir):
+    signing = ed25519.Ed25519PrivateKey.generate()
+    other = ec.generate_private_key(ec.SECP256R1())
+    write_key(keys_dir / "signing.pem", signing)
+    write_key(keys_dir / "other.pem", other)
+    ring = keyring(keys_dir)
+
+    assert decode_jwt(sign(other, None, "ES256"), keyring=ring)["sub"] == "alice"
+    stranger = ec.generate_private_key(ec.SECP256R1())
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_jwt(sign(stranger, None, "ES256"), keyring=ring)
+    # no key of the algorithm
+    with pytest.raises(jwt.InvalidSignatureError, match="Unknown signing key"):
+        decode_jwt(sign(other, None, "ES384"), keyring=ring)
+
+
+def test_kid_of_another_algorithm_is_rejected(keys_dir):
+    signing = ed25519.Ed25519PrivateKey.generate()
+    signing_kid = write_key(keys_dir / "signing.pem", signing)
+    ring = keyring(keys_dir)
+    token = sign(b"secret", signing_kid, "HS256")
+    with pytest.raises(jwt.InvalidSignatureError, match="Unknown signing key"):
+        decode_jwt(token, keyring=ring)
+
+
+def test_unknown_kid_reloads_rotated_keys(keys_dir):
+    write_key(keys_dir / "signing.pem", ed25519.Ed25519PrivateKey.generate())
+    ring = keyring(keys_dir, miss_reload_interval=60)
+    generation = ring.generation
+
+    # another worker signs with a key added after this one loaded
+    rotated = ed25519.Ed25519PrivateKey.generate()
+    rotated_kid = write_key(keys_dir / "rotated.pem", rotated)
+    assert (
+        decode_jwt(sign(rotated, rotated_kid, "EdDSA"), keyring=ring)["sub"] == "alice"
+    )
+    assert ring.generation == generation + 1
+
+    # reloads on unknown kids are rate limited
+    late = ed25519.Ed25519PrivateKey.generate()
+    late_kid = write_key(keys_dir / "late.pem", late)
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_jwt(sign(late, late_kid, "EdDSA"), keyring=ring)
+    assert ring.generation == generation + 1
+
+
+def test_signing_key_outside_keys_dir_is_watched(keys_dir, tmp_path):
+    write_key(keys_dir / "old.pem", ed25519.Ed25519PrivateKey.generate())
+    signing_path = tmp_path / "signing.pem"
+    write_key(signing_path, ed25519.Ed25519PrivateKey.generate())
+    ring = KeyRing(keys_dir=keys_dir, signing_key_path=signing_path)
+    ring.load()
+    assert not ring.reload_if_changed()
+
+    new_kid = write_key(signing_path, ec.generate_private_key(ec.SECP256R1()))
+    assert ring.reload_if_changed()
+    assert ring.signing_key.kid == new_kid
+    assert ring.signing_key.algorithm == "ES256"
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime, timezone
+
+from src.apps.auth.schemas.credentials import CredentialsSchema
+from src.apps.auth.schemas.tokens import RefreshTokenSchema
+from src.apps.auth.use_cases.login import LoginUseCaseImpl
+from src.apps.users.schemas.users import UserReadSchema
+
+
+class Recorder:
+    """
+    Session and services of a login, recording the order of calls.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.user = UserReadSchema(
+            id=uuid.uuid4(),
+            username="alice",
+            hashed_password=b"hash",
+            is_active=True,
+            roles=[],
+        )
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def get_user_by_username(self, username: str) -> UserReadSchema:
+        self.calls.append("get_user")
+        return self.user
+
+    async def validate_password(self, password: str, hashed_password: bytes) -> bool:
+        self.calls.append("validate_password")
+        return True
+
+    def create_access_token(self, user: UserReadSchema) -> str:
+        return "access"
+
+    def create_refresh_token(self, user: UserReadSchema) -> RefreshTokenSchema:
+        return RefreshTokenSchema(
+            token="refresh",
+            jti=uuid.uuid4(),
+            expires_at=datetime.now(timezone.utc),
+        )
+
+    async def save_refresh_token(self, token) -> None:
+        self.calls.append("save_token")
+
+
+async def test_login_releases_connection_before_hashing():
+    recorder = Recorder()
+    login = LoginUseCaseImpl(
+        users_service=recorder,
+        security_service=recorder,
+        jwt_service=recorder,
+        session=recorder,
+    )
+    await login(CredentialsSchema(username="alice", password="secret"))
+    # the read transaction ends before the bcrypt wait, the token write
+    # starts a new one
+    assert recorder.calls == [
+        "get_user",
+        "commit",
+        "validate_password",
+        "save_token",
+    ]
@@ -0,0 +1,95 @@
+import itertools
+
+import pytest
+
+from src.apps.auth.enums import ActionsEnum, ResourcesEnum
+from src.apps.auth.schemas.rbac import AccessControlMap
+from src.apps.auth.schemas.tokens import TokenPayload
+from src.apps.auth.tools.acl import CompiledACL, permission_bit
+from src.apps.auth.tools.rbac import RBACImpl
+
+ACL = AccessControlMap(
+    roles={
+        "admin": {
+            resource: list(ActionsEnum)
+            for resource in (ResourcesEnum.USERS, ResourcesEnum.ROLES)
+        },
+        "doctor": {
+            ResourcesEnum.PATIENTS: [ActionsEnum.VIEW, ActionsEnum.EDIT],
+            ResourcesEnum.LAB: [ActionsEnum.VIEW],
+        },
+        "lab": {ResourcesEnum.LAB: [ActionsEnum.CREATE, ActionsEnum.VIEW]},
+        "nobody": {},
+    }
+)
+ROLE_SETS = [
+    (),
+    ("admin",),
+    ("doctor",),
+    ("doctor", "lab"),
+    ("lab", "admin", "doctor"),
+    ("unknown",),
+    ("unknown", "lab"),
+    ("nobody",),
+]
+
+
+def set_based_check(roles, resource, action) -> bool:
+    """
+    The check before compiled masks: any role with the action on the resource.
+    """
+    for role in roles:
+        actions = ACL.roles.get(role, {}).get(resource)
+        if actions and action in actions:
+            return True
+    return False
+
+
+@pytest.mark.parametrize("roles", ROLE_SETS)
+def test_compiled_acl_matches_set_based_check(roles):
+    compiled = CompiledACL.compile(ACL)
+    for resource, action in itertools.product(ResourcesEnum, ActionsEnum):
+        assert compiled.allows(
+            frozenset(roles), permission_bit(resource, action)
+        ) == set_based_check(roles, resource, action), (roles, resource, action)
+
+
+def test_unknown_permission_is_denied():
+    compiled = CompiledACL.compile(ACL)
+    assert permission_bit("patients", "approve") == 0
+    assert not compiled.allows(frozenset({"admin", "doctor"}), 0)
+
+
+class StaticACL:
+    def __init__(self, acl: CompiledACL) -> None:
+        self.acl = acl
+
+    async def get(self) -> CompiledACL:
+        return self.acl
+
+
+async def endpoint() -> None: ...
+
+
+async def unmapped() -> None: ...
+
+
+async def test_check_permissions_memoizes_role_sets():
+    bit = permission_bit(ResourcesEnum.LAB, ActionsEnum.CREATE)
+    rbac = RBACImpl(
+        acl=StaticACL(CompiledACL.compile(ACL)),
+        permissions={endpoint: bit},
+        memo_size=2,
+    )
+    token = TokenPayload(payload={"roles": ["doctor", "lab"]})
+    assert await rbac.check_permissions(token, endpoint)
+    assert not await rbac.check_permissions(
+        TokenPayload(payload={"roles": ["doctor"]}), endpoint
+    )
+    assert rbac.role_set(token) is rbac.role_set(
+        TokenPayload(payload={"roles": ["doctor", "lab"]})
+    )
+    # without roles claim, unmapped endpoint
+    assert not await rbac.check_permissions(TokenPayload(payload={}), endpoint)
+    assert not await rbac.check_permissions(token, unmapped)
+    assert len(rbac._role_sets) <= 2
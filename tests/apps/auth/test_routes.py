@@ -0,0 +1,68 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from src.apps.auth.enums import ActionsEnum, ResourcesEnum
+from src.apps.auth.exceptions import RoutePermissionsError
+from src.apps.auth.tools.acl import PERMISSION_BITS
+from src.apps.auth.tools.deps import CurrentUser
+from src.apps.auth.tools.rbac import requires_permission, route_permissions
+from src.apps.auth.tools.routes import resolve_route_permissions
+from src.router import apply_routes
+from src.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def restore_route_permissions():
+    saved = dict(route_permissions)
+    yield
+    route_permissions.clear()
+    route_permissions.update(saved)
+
+
+def test_protected_routes_map_to_permission_bits():
+    router = APIRouter()
+
+    @router.get("/users")
+    @requires_permission(ResourcesEnum.USERS, ActionsEnum.VIEW)
+    async def users(user_id: CurrentUser) -> None: ...
+
+    @router.get("/public")
+    async def public() -> None: ...
+
+    table = resolve_route_permissions(router.routes)
+    assert table == {users: PERMISSION_BITS[(ResourcesEnum.USERS, ActionsEnum.VIEW)]}
+
+
+def test_protected_route_without_permission_fails():
+    router = APIRouter()
+
+    @router.get("/users")
+    async def users(user_id: CurrentUser) -> None: ...
+
+    with pytest.raises(RoutePermissionsError, match="^/users: protected route"):
+        resolve_route_permissions(router.routes)
+
+
+def test_unknown_permission_fails():
+    router = APIRouter()
+
+    @router.get("/patients")
+    @requires_permission("patients", "approve")
+    async def patients() -> None: ...
+
+    with pytest.raises(RoutePermissionsError, match="unknown permission"):
+        resolve_route_permissions(router.routes)
+
+
+def test_application_routes_resolve():
+    apply_routes(FastAPI())
+    assert route_permissions
+    assert set(route_permissions.values()) <= set(PERMISSION_BITS.values())
+
+
+def test_metrics_require_authentication():
+    client = TestClient(apply_routes(FastAPI()))
+    prefix = settings.api.prefix
+    assert client.get(f"{prefix}/health").status_code == 200
+    assert client.get(f"{prefix}/health/metrics").status_code in (401, 403)
@@ -0,0 +1,53 @@
+import pytest_asyncio
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.apps.auth import tasks
+from src.core.database.db_provider import DatabaseProvider
+
+
+@pytest_asyncio.fixture
+async def provider(test_db_url, monkeypatch):
+    provider = DatabaseProvider(url=test_db_url)
+    monkeypatch.setattr(tasks, "db_provider", provider)
+    yield provider
+    await provider.dispose()
+
+
+async def try_lock(connection) -> bool:
+    return await connection.scalar(
+        sa.select(sa.func.pg_try_advisory_lock(tasks.PURGE_LOCK))
+    )
+
+
+async def test_purge_skipped_while_another_process_holds_the_lock(
+    provider, test_db_url, monkeypatch
+):
+    async def purge(*args):
+        raise AssertionError("purged without the lock")
+
+    monkeypatch.setattr(tasks, "_purge_stale_tokens", purge)
+    engine = create_async_engine(test_db_url, poolclass=NullPool)
+    async with engine.connect() as other:
+        assert await try_lock(other)
+        assert await tasks.purge_auth_tokens() == 0
+    await engine.dispose()
+
+
+async def test_purge_releases_the_lock(provider, test_db_url, monkeypatch):
+    async def purge(connection, batch_size, pause):
+        async with provider.engine.connect() as other:
+            assert not await try_lock(other)
+        return 3
+
+    monkeypatch.setattr(tasks, "_purge_stale_tokens", purge)
+    assert await tasks.purge_auth_tokens() == 3
+
+    async with provider.engine.connect() as other:
+        assert await try_lock(other)
+
+
+async def test_purge_batches_run_on_the_lock_connection(provider):
+    assert await tasks.purge_auth_tokens(batch_size=10, pause=0) >= 0
+    assert provider.engine.pool.checkedout() == 0
@@ -0,0 +1,143 @@
+import asyncio
+import fnmatch
+import os
+from time import monotonic
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.core.cache.resp import encode_command
+from src.tools.database.migrate import upgrade
+
+# Database tests run against this (disposable) database and are skipped
+# without it, e.g. TEST_DB_URL=postgresql+asyncpg://postgres@localhost/test
+TEST_DB_URL = os.environ.get("TEST_DB_URL")
+
+
+class RESPStandIn:
+    """
+    In-process Redis-protocol server with the commands used by the cache.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self.server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}"
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                args = []
+                for _ in range(int(line[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(args)
+                writer.write(self.reply(args))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def reply(self, args: list[bytes]) -> bytes:
+        command = args[0].upper()
+        if command == b"PING":
+            return b"+PONG\r\n"
+        if command == b"GET":
+            value = self.get(args[1])
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            expires_at = None
+            if len(args) == 5 and args[3].upper() == b"PX":
+                expires_at = monotonic() + int(args[4]) / 1000
+            self.data[args[1]] = (args[2], expires_at)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            deleted = sum(self.data.pop(key, None) is not None for key in args[1:])
+            return b":%d\r\n" % deleted
+        if command == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [
+                key for key in self.data if fnmatch.fnmatchcase(key.decode(), pattern)
+            ]
+            # single page: cursor "0" and every matching key
+            return b"*2\r\n$1\r\n0\r\n" + encode_command(*keys)
+        return b"-ERR unknown command '%s'\r\n" % command
+
+    def get(self, key: bytes) -> bytes | None:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= monotonic():
+            del self.data[key]
+            return None
+        return value
+
+
+@pytest_asyncio.fixture
+async def resp_server():
+    server = RESPStandIn()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture(scope="session")
+def test_db_url() -> str:
+    """
+    URL of the test database, migrated to the latest revision once.
+    """
+    if not TEST_DB_URL:
+        pytest.skip("TEST_DB_URL is not set")
+
+    async def migrate() -> None:
+        engine = create_async_engine(TEST_DB_URL, poolclass=NullPool)
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(upgrade)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(migrate())
+    return TEST_DB_URL
+
+
+@pytest_asyncio.fixture
+async def db_session(test_db_url):
+    """
+    Session in a transaction rolled back after the test, commits of the
+    code under test become savepoints.
+    """
+    engine = create_async_engine(test_db_url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from src.core.cache.cache_provider import CacheProvider
+from src.core.cache.resp import RESPClient
+from src.core.repositories import cache_repository
+from src.core.repositories.cache_repository import (
+    CacheRepositoryImpl,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    approx_size,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_repository, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+async def redis_backend(resp_server):
+    backend = RedisCacheBackend(RESPClient(resp_server.url))
+    yield backend
+    await backend.close()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return MemoryCacheBackend()
+    return request.getfixturevalue("redis_backend")
+
+
+async def test_hit_and_miss(backend):
+    cache = CacheRepositoryImpl(backend, prefix="test")
+    assert await cache.get("key") is None
+    await cache.set("key", {"a": [1, 2]})
+    await cache.set("none", None)
+    assert await cache.get("key") == {"a": [1, 2]}
+    assert await cache.get("none", "default") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+async def test_delete_and_clear(backend):
+    cache = CacheRepositoryImpl(backend, prefix="test")
+    other = CacheRepositoryImpl(backend, prefix="other")
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await other.set("a", 3)
+    assert await cache.delete("a")
+    assert not await cache.delete("a")
+    assert await cache.clear() == 1
+    assert await cache.get("b") is None
+    assert await other.get("a") == 3
+
+
+async def test_memory_ttl(clock):
+    cache = CacheRepositoryImpl(MemoryCacheBackend(), default_ttl=10)
+    await cache.set("default", 1)
+    await cache.set("short", 2, ttl=1)
+    clock[0] += 5
+    assert await cache.get("short") is None
+    assert await cache.get("default") == 1
+    clock[0] += 5
+    assert await cache.get("default") is None
+
+
+async def test_redis_ttl(redis_backend, resp_server):
+    cache = CacheRepositoryImpl(redis_backend, prefix="test")
+    await cache.set("key", 1, ttl=0.05)
+    assert resp_server.commands[-1][-2:] == [b"PX", b"50"]
+    assert await cache.get("key") == 1
+    await asyncio.sleep(0.06)
+    assert await cache.get("key") is None
+
+
+async def test_eviction_by_entries():
+    backend = MemoryCacheBackend(max_entries=2)
+    cache = CacheRepositoryImpl(backend)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")  # "b" is now least recently used
+    await cache.set("c", 3)
+    assert await cache.get("b") is None
+    assert (await cache.get("a"), await cache.get("c")) == (1, 3)
+    assert backend.evictions == 1
+
+
+async def test_eviction_by_memory_counts_nested_values():
+    backend = MemoryCacheBackend(max_memory_bytes=10_000)
+    cache = CacheRepositoryImpl(backend)
+    payload = {"items": [b"x" * 6000]}
+    await cache.set("a", payload)
+    await cache.set("b", payload)
+    assert await cache.get("a") is None
+    assert await cache.get("b") == payload
+    assert backend.size()[1] <= 10_000
+    await cache.set("huge", [b"x" * 20_000])
+    assert await cache.get("huge") is None
+
+
+def test_approx_size():
+    assert approx_size(b"x" * 100) == 100
+    assert approx_size({"k": ["x" * 1000]}) > 1000
+
+
+async def test_get_or_load_runs_loader_once(backend):
+    cache = CacheRepositoryImpl(backend, prefix="test")
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert await cache.get_or_load("k", loader) == "value"
+    assert calls == 1
+
+
+def test_provider_repository_per_default_ttl():
+    provider = CacheProvider(default_ttl=300)
+    assert provider.repository("ns") is provider.repository("ns")
+    short = provider.repository("ns", default_ttl=5)
+    assert short.default_ttl == 5
+    assert provider.repository("ns").default_ttl == 300
+    assert provider.repository("ns", local=True) is not provider.repository("ns")
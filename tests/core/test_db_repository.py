@@ -0,0 +1,162 @@
+import pytest
+from pydantic import BaseModel
+
+from src.core.exceptions import ModelNotFoundException
+from src.core.models import Location, Role
+from src.core.repositories.db_repository import DBRepositoryImpl
+from src.core.schemas import CreateBaseModel, SortSchema, UpdateBaseModel
+
+
+class RoleSchema(BaseModel):
+    id: int
+    name: str
+
+
+class RoleCreateSchema(CreateBaseModel):
+    name: str
+
+
+class RoleUpdateSchema(UpdateBaseModel):
+    name: str
+
+
+class RolesRepository(
+    DBRepositoryImpl[Role, RoleSchema, RoleCreateSchema, RoleUpdateSchema]
+):
+    model_type = Role
+    read_schema_type = RoleSchema
+    bulk_chunk_size = 2
+
+
+class LocationSchema(BaseModel):
+    id: int
+    name: str
+    deleted: bool
+
+
+class LocationCreateSchema(CreateBaseModel):
+    name: str
+    deleted: bool = False
+
+
+class LocationsRepository(
+    DBRepositoryImpl[Location, LocationSchema, LocationCreateSchema, UpdateBaseModel]
+):
+    model_type = Location
+    read_schema_type = LocationSchema
+    bulk_chunk_size = 2
+
+
+def roles(*names: str) -> list[RoleCreateSchema]:
+    return [RoleCreateSchema(name=name) for name in names]
+
+
+async def test_create_many_keeps_order(db_session):
+    repository = RolesRepository(db_session)
+    created = await repository.create_many(roles("c", "a", "b"))
+    assert [role.name for role in created] == ["c", "a", "b"]
+    assert len({role.id for role in created}) == 3
+
+
+async def test_upsert_many_updates_conflicting_rows(db_session):
+    repository = LocationsRepository(db_session)
+    (existing,) = await repository.create_many([LocationCreateSchema(name="a")])
+    upserted = await repository.upsert_many(
+        [
+            LocationCreateSchema(name="b"),
+            LocationCreateSchema(name="a", deleted=True),
+            LocationCreateSchema(name="c"),
+        ],
+        index_elements=["name"],
+    )
+    assert [(row.name, row.deleted) for row in upserted] == [
+        ("b", False),
+        ("a", True),
+        ("c", False),
+    ]
+    assert upserted[1].id == existing.id
+
+
+async def test_upsert_many_do_nothing_skips_existing_rows(db_session):
+    repository = RolesRepository(db_session)
+    await repository.create_many(roles("a", "c"))
+    inserted = await repository.upsert_many(
+        roles("a", "b", "c", "d", "e"),
+        index_elements=["name"],
+        update_fields=[],
+        chunk_size=5,
+    )
+    assert [role.name for role in inserted] == ["b", "d", "e"]
+    # a chunk with every row skipped
+    assert (
+        await repository.upsert_many(
+            roles("a", "b"), index_elements=["name"], update_fields=[]
+        )
+        == []
+    )
+
+
+async def test_update_many_and_missing_id(db_session):
+    repository = RolesRepository(db_session)
+    a, b = await repository.create_many(roles("a", "b"))
+    updated = await repository.update_many(
+        [
+            RoleUpdateSchema(id=b.id, name="B"),
+            RoleUpdateSchema(id=a.id, name="A"),
+        ]
+    )
+    assert [(role.id, role.name) for role in updated] == [(b.id, "B"), (a.id, "A")]
+    with pytest.raises(ModelNotFoundException):
+        await repository.update_many([RoleUpdateSchema(id=-1, name="missing")])
+
+
+async def test_delete_many_counts_deleted_rows(db_session):
+    repository = RolesRepository(db_session)
+    created = await repository.create_many(roles("a", "b", "c"))
+    ids = [role.id for role in created] + [-1]
+    assert await repository.delete_many(ids) == 3
+
+
+async def pages(repository, sorting, names, limit=2) -> list[list[str]]:
+    result, cursor = [], None
+    while True:
+        page = await repository.query_cursor(
+            limit=limit, cursor=cursor, filters={"name": names}, sorting=sorting
+        )
+        result.append([row.name for row in page.objects])
+        if (cursor := page.next_cursor) is None:
+            return result
+
+
+@pytest.mark.parametrize(
+    "sorting, key",
+    [
+        # ties on `deleted` broken by id, in the order of the last sort field
+        ([SortSchema(field="deleted", order="asc")], lambda row: (row.deleted, row.id)),
+        (
+            [SortSchema(field="deleted", order="desc")],
+            lambda row: (-row.deleted, -row.id),
+        ),
+        # mixed directions: OR-expanded keyset instead of a row comparison
+        (
+            [
+                SortSchema(field="deleted", order="desc"),
+                SortSchema(field="id", order="asc"),
+            ],
+            lambda row: (-row.deleted, row.id),
+        ),
+    ],
+)
+async def test_query_cursor_walks_every_row_once(db_session, sorting, key):
+    repository = LocationsRepository(db_session)
+    names = [f"page-{i}" for i in range(7)]
+    created = await repository.create_many(
+        [
+            LocationCreateSchema(name=name, deleted=i % 3 == 0)
+            for i, name in enumerate(names)
+        ]
+    )
+    expected = [row.name for row in sorted(created, key=key)]
+    result = await pages(repository, sorting, names)
+    assert [len(page) for page in result] == [2, 2, 2, 1]
+    assert sum(result, []) == expected
@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from src.core.executors import CPUExecutor
+
+
+async def test_resize_caps_concurrency_at_pool_size():
+    executor = CPUExecutor(max_workers=4, max_concurrency=4)
+    executor.resize(1)
+    assert (executor.max_workers, executor.max_concurrency) == (1, 1)
+
+    async def job():
+        return await executor.run(lambda: None)
+
+    first, second = asyncio.create_task(job()), asyncio.create_task(job())
+    await asyncio.sleep(0)
+    assert executor.stats().queue_depth == 1
+    await asyncio.gather(first, second)
+    executor.shutdown()
+
+
+async def test_resize_after_start_fails():
+    executor = CPUExecutor(max_workers=2)
+    await executor.run(sum, [1, 2])
+    with pytest.raises(RuntimeError):
+        executor.resize(1)
+    executor.shutdown()
@@ -0,0 +1,68 @@
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.exceptions import InvalidCursorException
+from src.core.models import AuthToken, Location, User
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.repositories.db_repository import DBRepositoryImpl
+from src.core.schemas import SortSchema
+
+SORTING = [SortSchema(field="expires_at", order="desc"), SortSchema(field="id")]
+
+
+def tampered(cursor: str, **changes) -> str:
+    data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    data.update(changes)
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def test_cursor_round_trip_restores_column_values():
+    expires_at = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor(SORTING, [expires_at, 7])
+    values = decode_cursor(cursor, SORTING)
+    columns = [AuthToken.expires_at, AuthToken.id]
+    restored = [DBRepositoryImpl._cursor_value(c, v) for c, v in zip(columns, values)]
+    assert restored == [expires_at, 7]
+
+    user_id = uuid.uuid4()
+    by_id = [SortSchema(field="id")]
+    (value,) = decode_cursor(encode_cursor(by_id, [user_id]), by_id)
+    assert DBRepositoryImpl._cursor_value(User.id, value) == user_id
+
+
+def test_cursor_of_other_sorting_is_rejected():
+    cursor = encode_cursor(SORTING, [datetime.now(timezone.utc), 1])
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, [SortSchema(field="id")])
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(tampered(cursor, v=[1]), SORTING)
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("not a cursor!", SORTING)
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        (Location.id, "1"),
+        (Location.id, 1.5),
+        (Location.id, True),
+        (Location.id, None),
+        (Location.id, 2**31),
+        (AuthToken.id, [1]),
+        (Location.name, 1),
+        (Location.deleted, 0),
+        (AuthToken.expires_at, 1700000000),
+        (AuthToken.expires_at, "yesterday"),
+        (User.id, "not-a-uuid"),
+    ],
+)
+def test_tampered_cursor_values_are_rejected(column, value):
+    repository = DBRepositoryImpl.__new__(DBRepositoryImpl)
+    repository.model_type = column.class_
+    sorting = [SortSchema(field=column.key)]
+    with pytest.raises(InvalidCursorException):
+        repository._keyset_where(sorting, [value])
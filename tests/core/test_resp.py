@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.core.cache.resp import RESPClient, RESPError, encode_command, read_reply
+
+
+def reader_for(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def test_encode_command():
+    assert (
+        encode_command("SET", b"k", 1) == b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$1\r\n1\r\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"+OK\r\n", "OK"),
+        (b":42\r\n", 42),
+        (b"$5\r\nhe\r\no\r\n", b"he\r\no"),
+        (b"$-1\r\n", None),
+        (b"*-1\r\n", None),
+        (b"*2\r\n$1\r\na\r\n*1\r\n:1\r\n", [b"a", [1]]),
+    ],
+)
+async def test_read_reply(data, expected):
+    assert await read_reply(reader_for(data)) == expected
+
+
+async def test_error_reply_is_raised():
+    with pytest.raises(RESPError, match="ERR boom"):
+        await read_reply(reader_for(b"-ERR boom\r\n"))
+
+
+async def test_error_inside_array_keeps_stream_in_sync():
+    reader = reader_for(b"*3\r\n:1\r\n-ERR boom\r\n$1\r\na\r\n+OK\r\n")
+    first, error, last = await read_reply(reader)
+    assert (first, last) == (1, b"a")
+    assert isinstance(error, RESPError)
+    assert await read_reply(reader) == "OK"
+
+
+async def test_closed_connection():
+    with pytest.raises(ConnectionError):
+        await read_reply(reader_for(b""))
+
+
+async def test_client_reuses_connection_after_error_reply(resp_server):
+    client = RESPClient(resp_server.url, pool_size=1)
+    try:
+        assert await client.execute("SET", "k", "v") == "OK"
+        with pytest.raises(RESPError):
+            await client.execute("NOPE")
+        assert await client.execute("GET", "k") == b"v"
+        assert client._pool.qsize() == 1
+    finally:
+        await client.close()
@@ -0,0 +1,134 @@
+import json
+from contextlib import asynccontextmanager
+
+import pytest_asyncio
+import sqlalchemy as sa
+
+from src.core.models import Location, Role, User, UserRole
+from src.tools.users import bulk_import
+from src.tools.users.bulk_import import (
+    Checkpoint,
+    UserRow,
+    import_users,
+    iter_rows,
+    write_batch,
+)
+
+
+def test_iter_rows_rejects_invalid_rows(tmp_path):
+    path = tmp_path / "users.ndjson"
+    records = [
+        {"username": "alice", "password": "secret", "roles": "admin|user"},
+        {"username": "bob", "password": 123456},
+        {"username": "x" * 51, "password": "secret"},
+        {"username": " ", "password": "secret"},
+        {"username": "carol", "password": "p" * 73},
+        {"username": "dave"},
+    ]
+    path.write_text("\n".join(json.dumps(record) for record in records))
+    rows = list(iter_rows(path, location_id=1))
+    assert rows[0] == UserRow(1, "alice", "secret", ["admin", "user"], True, 1)
+    assert rows[1:] == [None] * 5
+
+
+def test_checkpoint_keeps_files_next_to_the_source(tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("username,password,roles\n")
+    neighbour = tmp_path / "users.csv.tmp"
+    neighbour.write_text("not ours")
+
+    checkpoint = Checkpoint(source)
+    checkpoint.save(10)
+    assert checkpoint.load() == 10
+    assert neighbour.read_text() == "not ours"
+
+
+@pytest_asyncio.fixture
+async def references(db_session):
+    location = Location(name="bulk-import")
+    admin, user = Role(name="bulk-admin"), Role(name="bulk-user")
+    db_session.add_all([location, admin, user])
+    await db_session.flush()
+    return location.id, {"admin": admin.id, "user": user.id}
+
+
+async def user_roles(session, username: str) -> list[int]:
+    statement = (
+        sa.select(UserRole.role_id)
+        .join(User, User.id == UserRole.user_id)
+        .where(User.username == username)
+        .order_by(UserRole.role_id)
+    )
+    return list((await session.execute(statement)).scalars())
+
+
+async def test_write_batch_dedupes_usernames(db_session, references):
+    location_id, roles = references
+    rows = [
+        UserRow(1, "bulk-alice", "a", ["admin", "admin"], True, location_id),
+        UserRow(2, "bulk-alice", "b", ["user"], True, location_id),
+    ]
+    created = await write_batch(db_session, rows, [b"h1", b"h2"], roles)
+    assert created == 1
+    hashed = await db_session.scalar(
+        sa.select(User.hashed_password).where(User.username == "bulk-alice")
+    )
+    assert hashed == b"h1"
+    assert await user_roles(db_session, "bulk-alice") == [roles["admin"]]
+
+
+async def test_write_batch_chunks_by_bind_parameters(
+    db_session, references, monkeypatch
+):
+    # one user (5 parameters) or three user roles (2 parameters) per statement
+    monkeypatch.setattr(bulk_import, "MAX_PARAMS", 7)
+    location_id, roles = references
+    rows = [
+        UserRow(i, f"bulk-{i}", "p", ["admin", "user"], True, location_id)
+        for i in range(4)
+    ]
+    created = await write_batch(db_session, rows, [b"h"] * 4, roles)
+    assert created == 4
+    for i in range(4):
+        assert await user_roles(db_session, f"bulk-{i}") == sorted(roles.values())
+
+
+class RecordingSecurity:
+    def __init__(self) -> None:
+        self.passwords = []
+
+    async def encode_password(self, password: str) -> bytes:
+        self.passwords.append(password)
+        return password.encode()
+
+
+async def test_import_hashes_new_usernames_only(
+    db_session, references, tmp_path, monkeypatch
+):
+    location_id, roles = references
+
+    class Provider:
+        @asynccontextmanager
+        async def transaction(self):
+            yield db_session
+
+    monkeypatch.setattr(bulk_import, "db_provider", Provider())
+    await write_batch(
+        db_session,
+        [UserRow(1, "bulk-old", "old", [], True, location_id)],
+        [b"h"],
+        roles,
+    )
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,password,roles\n"
+        "bulk-old,p1,\n"
+        "bulk-new,p2,bulk-admin\n"
+        "bulk-new,p3,\n"
+    )
+    security = RecordingSecurity()
+    progress = await import_users(path, security, location_id=location_id)
+
+    assert security.passwords == ["p2"]
+    assert (progress.created, progress.skipped, progress.rejected) == (1, 2, 0)
+    assert await user_roles(db_session, "bulk-new") == [roles["admin"]]
@@ -0,0 +1,59 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.apps.auth.repositories.permissions import PermissionsRepositoryImpl
+from src.core.models import Role
+from src.tools.database import loaddata
+from src.tools.database.loaddata import DEFAULT_GRANTS, once, serial_tables
+
+
+async def test_once_shares_result_between_concurrent_callers():
+    calls = 0
+
+    async def hash_password():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"hash"
+
+    default_password = once(hash_password)
+    results = await asyncio.gather(*(default_password() for _ in range(5)))
+    assert results == [b"hash"] * 5
+    assert await default_password() == b"hash"
+    assert calls == 1
+
+
+def test_serial_tables_skip_uuid_ids():
+    tables = {"users", "roles", "users_roles", "seed_migrations"}
+    assert serial_tables(tables) == ["roles", "users_roles"]
+
+
+async def test_default_grants_apply_without_seed_dir(db_session, tmp_path, monkeypatch):
+    class Provider:
+        @asynccontextmanager
+        async def transaction(self):
+            yield db_session
+
+    async def noop() -> None: ...
+
+    published = []
+
+    async def publish() -> None:
+        published.append(True)
+
+    monkeypatch.setattr(loaddata, "db_provider", Provider())
+    monkeypatch.setattr(loaddata, "migrate", noop)
+    monkeypatch.setattr(loaddata.invalidation, "publish", publish)
+    monkeypatch.setattr(loaddata.settings, "base_dir", tmp_path)
+    db_session.add(Role(name=loaddata.settings.rbac.admin_role))
+    await db_session.flush()
+
+    await loaddata.load_data()
+    acl = await PermissionsRepositoryImpl(session=db_session).get_permissions_map()
+    granted = acl.roles[loaddata.settings.rbac.admin_role]
+    assert all(action in granted[resource] for resource, action in DEFAULT_GRANTS)
+    assert published == [True]
+
+    # already granted: nothing to publish
+    await loaddata.load_data()
+    assert published == [True]
@@ -0,0 +1,16 @@
+import pytest
+import sqlalchemy as sa
+
+from src.tools.database.migrate import check_version_triggers
+
+
+async def test_every_reference_table_has_a_version_trigger(db_session):
+    connection = await db_session.connection()
+    await connection.run_sync(check_version_triggers)
+
+
+async def test_missing_version_trigger_fails(db_session):
+    await db_session.execute(sa.text('DROP TRIGGER statuses_version ON "statuses"'))
+    connection = await db_session.connection()
+    with pytest.raises(RuntimeError, match="statuses"):
+        await connection.run_sync(check_version_triggers)